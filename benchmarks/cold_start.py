@@ -0,0 +1,119 @@
+"""Benchmark Lambda cold start: handler import plus container setup, per handler.
+
+Every sample runs in a fresh interpreter. ``eager`` builds every container
+dependency, as the container did before it went lazy; ``lazy`` builds only the
+dependencies the handler uses. Clients are created but never connect, and
+dummy AWS credentials are injected, so no AWS resources are needed.
+
+    python benchmarks/cold_start.py --runs 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+# Container attributes each handler touches on its first invocation
+HANDLERS = {
+    "contact_consumer": [
+        "contact_repo",
+        "scoring_engine",
+        "embedding_service",
+        "refresh_flags",
+        "contact_change_parser",
+        "interaction_parser",
+        "contact_events",
+    ],
+    "listing_consumer": [
+        "contact_repo",
+        "search_repo",
+        "scoring_engine",
+        "refresh_flags",
+        "listing_parser",
+        "contact_events",
+    ],
+    "card_refresh": [
+        "contact_repo",
+        "card_repo",
+        "llm_service",
+        "refresh_flags",
+        "insight_cache",
+        "leases",
+        "contact_events",
+    ],
+    "score_decay": ["contact_repo", "decay_calculator", "decay_checkpoints", "leases"],
+}
+
+PROBE = """
+import importlib, json, sys, time
+from functools import cached_property
+
+handler, mode, attrs = sys.argv[1], sys.argv[2], sys.argv[3:]
+start = time.perf_counter()
+importlib.import_module(f"lambdas.{handler}.handler")
+from rise_scout.infrastructure.container import Container
+imported = time.perf_counter()
+
+container = Container()
+if mode == "eager":
+    attrs = [n for n, v in vars(Container).items() if isinstance(v, cached_property)]
+for name in attrs:
+    getattr(container, name)
+built = time.perf_counter()
+
+print(json.dumps({"import_ms": (imported - start) * 1000, "init_ms": (built - imported) * 1000}))
+"""
+
+
+def probe_env() -> dict[str, str]:
+    return {
+        **os.environ,
+        "PYTHONPATH": str(SRC),
+        "AWS_ACCESS_KEY_ID": "benchmark",
+        "AWS_SECRET_ACCESS_KEY": "benchmark",
+        "AWS_DEFAULT_REGION": "us-west-2",
+        "RISE_SCOUT_ENV": "benchmark",
+        "POWERTOOLS_TRACE_DISABLED": "true",
+    }
+
+
+def sample(handler: str, mode: str) -> dict[str, float]:
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE, handler, mode, *HANDLERS[handler]],
+        env=probe_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--handlers", nargs="+", choices=list(HANDLERS), default=list(HANDLERS))
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    for handler in args.handlers:
+        totals: dict[str, float] = {}
+        for mode in ("eager", "lazy"):
+            runs = [sample(handler, mode) for _ in range(args.runs)]
+            import_ms = statistics.median(r["import_ms"] for r in runs)
+            init_ms = statistics.median(r["init_ms"] for r in runs)
+            totals[mode] = import_ms + init_ms
+            print(
+                f"{handler:<17} {mode:<5} import={import_ms:7.1f}ms  init={init_ms:7.1f}ms  "
+                f"total={totals[mode]:7.1f}ms"
+            )
+        print(f"{handler:<17} saved={totals['eager'] - totals['lazy']:7.1f}ms\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""Profile where each Lambda's cold start goes and write a JSON report.
+
+Each handler is imported in a fresh interpreter under ``-X importtime``. The
+container then builds the dependencies that handler uses. Sockets refuse to
+connect during the probe, so client setup is measured without any network.
+Per handler the report records:
+
+* import and container build wall time
+* peak RSS
+* self time per top-level package, e.g. aws_lambda_powertools, pydantic, botocore
+* the slowest modules by cumulative import time
+
+Reports are plain JSON so they can be kept per commit and diffed. With
+``--baseline``, the script exits non-zero when a handler's total grows by more
+than ``--max-regression-ms``.
+
+    python benchmarks/cold_start_profile.py --output cold_start.json
+    python benchmarks/cold_start_profile.py --baseline cold_start.json --max-regression-ms 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from cold_start import HANDLERS, probe_env
+
+PHASE_MARKER = "rise_scout_profile:container"
+
+PROBE = f"""
+import importlib, json, resource, socket, sys, time
+
+def refuse(self, *args, **kwargs):
+    raise ConnectionRefusedError("network disabled while profiling")
+
+socket.socket.connect = refuse
+socket.socket.connect_ex = refuse
+
+handler, attrs = sys.argv[1], sys.argv[2:]
+start = time.perf_counter()
+importlib.import_module(f"lambdas.{{handler}}.handler")
+imported = time.perf_counter()
+
+print("{PHASE_MARKER}", file=sys.stderr, flush=True)
+from rise_scout.infrastructure.container import Container
+container = Container()
+for name in attrs:
+    getattr(container, name)
+built = time.perf_counter()
+
+print(json.dumps({{
+    "import_ms": (imported - start) * 1000,
+    "init_ms": (built - imported) * 1000,
+    "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+}}))
+"""
+
+
+def parse_importtime(lines: list[str]) -> list[dict[str, Any]]:
+    modules = []
+    for line in lines:
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        modules.append(
+            {
+                "module": name.strip(),
+                "self_us": int(self_us),
+                "cumulative_us": int(cumulative_us),
+            }
+        )
+    return modules
+
+
+def by_package(modules: list[dict[str, Any]]) -> dict[str, float]:
+    totals: dict[str, int] = defaultdict(int)
+    for module in modules:
+        totals[module["module"].split(".")[0]] += module["self_us"]
+    return {
+        package: round(us / 1000, 2)
+        for package, us in sorted(totals.items(), key=lambda item: -item[1])
+    }
+
+
+def profile(handler: str, top: int) -> dict[str, Any]:
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE, handler, *HANDLERS[handler]],
+        env=probe_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = json.loads(out.stdout.strip().splitlines()[-1])
+
+    stderr = out.stderr.splitlines()
+    split = stderr.index(PHASE_MARKER) if PHASE_MARKER in stderr else len(stderr)
+    handler_imports = parse_importtime(stderr[:split])
+    container_imports = parse_importtime(stderr[split + 1 :])
+    slowest = sorted(
+        handler_imports + container_imports, key=lambda m: m["cumulative_us"], reverse=True
+    )
+
+    return {
+        **timings,
+        "total_ms": timings["import_ms"] + timings["init_ms"],
+        "modules_imported": len(handler_imports) + len(container_imports),
+        "handler_import_by_package_ms": by_package(handler_imports),
+        "container_import_by_package_ms": by_package(container_imports),
+        "slowest_modules": slowest[:top],
+    }
+
+
+def summarize(runs: list[dict[str, Any]]) -> dict[str, Any]:
+    # Breakdowns come from the median run; the headline numbers are medians of all runs
+    median_run = sorted(runs, key=lambda r: r["total_ms"])[len(runs) // 2]
+    return {
+        **median_run,
+        "runs": len(runs),
+        "import_ms": round(statistics.median(r["import_ms"] for r in runs), 2),
+        "init_ms": round(statistics.median(r["init_ms"] for r in runs), 2),
+        "total_ms": round(statistics.median(r["total_ms"] for r in runs), 2),
+        "peak_rss_kb": max(r["peak_rss_kb"] for r in runs),
+    }
+
+
+def regressions(
+    report: dict[str, Any], baseline: dict[str, Any], max_regression_ms: float
+) -> list[str]:
+    failures = []
+    for handler, result in report["handlers"].items():
+        previous = baseline["handlers"].get(handler)
+        if previous is None:
+            continue
+        delta = result["total_ms"] - previous["total_ms"]
+        print(f"{handler:<17} total={result['total_ms']:7.1f}ms  delta={delta:+7.1f}ms")
+        if delta > max_regression_ms:
+            failures.append(handler)
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--handlers", nargs="+", choices=list(HANDLERS), default=list(HANDLERS))
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=25, help="slowest modules kept per handler")
+    parser.add_argument("--output", type=Path, help="write the JSON report here")
+    parser.add_argument("--baseline", type=Path, help="earlier report to compare against")
+    parser.add_argument("--max-regression-ms", type=float, default=50.0)
+    args = parser.parse_args()
+
+    report = {
+        "generated_at": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "handlers": {
+            handler: summarize([profile(handler, args.top) for _ in range(args.runs)])
+            for handler in args.handlers
+        },
+    }
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.baseline:
+        failures = regressions(
+            report, json.loads(args.baseline.read_text()), args.max_regression_ms
+        )
+        if failures:
+            print(f"cold start regressed: {', '.join(failures)}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
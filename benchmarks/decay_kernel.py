@@ -0,0 +1,73 @@
+"""Benchmark the vectorized decay kernel against the per-contact loop.
+
+Both paths start from raw search-hit documents and end with the documents
+that would be bulk-indexed:
+
+* per-contact: document_to_contact -> DecayCalculator.apply -> contact_to_document
+* columnar:    DocumentDecayBatch -> decay_kernel -> DocumentDecayBatch.apply
+
+    python benchmarks/decay_kernel.py --contacts 20000 --page-size 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import time
+from datetime import UTC, datetime
+
+from synthetic import make_contact
+
+from rise_scout.domain.scoring.decay import DecayCalculator
+from rise_scout.infrastructure.config.weights_loader import load_weights
+from rise_scout.infrastructure.opensearch.decay_batch import DocumentDecayBatch
+from rise_scout.infrastructure.opensearch.serializers import (
+    contact_to_document,
+    document_to_contact,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--contacts", type=int, default=20_000)
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument("--reasons", type=int, default=20)
+    args = parser.parse_args()
+
+    calc = DecayCalculator(load_weights())
+    docs = [
+        contact_to_document(make_contact(i, reasons=args.reasons)) for i in range(args.contacts)
+    ]
+    cutoff = calc.reason_cutoff(datetime(2024, 6, 1, tzinfo=UTC))
+    pages = [docs[i : i + args.page_size] for i in range(0, len(docs), args.page_size)]
+
+    scalar_pages = copy.deepcopy(pages)
+    start = time.perf_counter()
+    scalar_written = 0
+    for page in scalar_pages:
+        for doc in page:
+            contact = document_to_contact(doc)
+            if calc.apply(contact, cutoff):
+                contact.decay_run_id = "bench"
+                contact_to_document(contact)
+                scalar_written += 1
+    scalar = time.perf_counter() - start
+
+    batch_pages = copy.deepcopy(pages)
+    now = datetime.now(UTC)
+    start = time.perf_counter()
+    batch_written = 0
+    for page in batch_pages:
+        batch = DocumentDecayBatch(page)
+        batch_written += len(batch.apply(calc.decay_columns(batch, cutoff), "bench", now))
+    batched = time.perf_counter() - start
+
+    assert scalar_written == batch_written
+    print(f"contacts={args.contacts} page_size={args.page_size} reasons={args.reasons}")
+    print(f"per-contact loop: {scalar:7.3f}s ({args.contacts / scalar:10.0f} contacts/s)")
+    print(f"columnar kernel:  {batched:7.3f}s ({args.contacts / batched:10.0f} contacts/s)")
+    print(f"speedup: {scalar / batched:.2f}x  written={batch_written}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Benchmark sliced score decay across a local process pool.
+
+Runs entirely in memory: a synthetic contact repository stands in for
+OpenSearch, with an optional per-request latency to model network I/O.
+
+    python benchmarks/decay_parallel.py --contacts 20000 --workers 1 2 4 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+from datetime import UTC, datetime
+from functools import partial
+from typing import Any
+
+import structlog
+from synthetic import contact_id, make_contact
+
+from rise_scout.application.score_decay import ScoreDecayService, run_parallel_decay
+from rise_scout.domain.contact.repository import BulkWriteResult
+from rise_scout.domain.scoring.checkpoint import DecayCheckpoint
+from rise_scout.domain.scoring.decay import DecayCalculator
+from rise_scout.domain.scoring.slicing import slice_bounds, slice_bucket
+from rise_scout.infrastructure.config.weights_loader import load_weights
+from rise_scout.infrastructure.opensearch.decay_batch import DocumentDecayBatch
+from rise_scout.infrastructure.opensearch.serializers import contact_to_document
+
+
+class SyntheticContactRepo:
+    def __init__(self, total: int, latency_ms: float) -> None:
+        self._total = total
+        self._latency = latency_ms / 1000
+
+    def iter_decay_batches(
+        self, run_id, reasons_before, page_size=500, search_after=None, slice_id=0, slice_count=1
+    ):
+        lower, upper = slice_bounds(slice_id, slice_count)
+        ids = [
+            i
+            for i in range(self._total)
+            if lower <= slice_bucket(contact_id(i)) < upper
+            and (search_after is None or contact_id(i) > search_after[0])
+        ]
+        for start in range(0, len(ids), page_size):
+            time.sleep(self._latency)
+            docs = [contact_to_document(make_contact(i)) for i in ids[start : start + page_size]]
+            yield DocumentDecayBatch(docs), [docs[-1]["contact_id"]]
+
+    def save_decay_batch(self, batch, result, run_id):
+        docs = batch.apply(result, run_id, datetime.now(UTC))
+        time.sleep(self._latency * -(-len(docs) // 100))
+        return BulkWriteResult(succeeded=[d["contact_id"] for d in docs])
+
+
+class MemoryCheckpointStore:
+    def __init__(self) -> None:
+        self._checkpoints: dict[str, DecayCheckpoint] = {}
+
+    def load(self, run_id, slice_id=0, slice_count=1):
+        return None
+
+    def save(self, checkpoint):
+        self._checkpoints[checkpoint.key] = checkpoint
+
+
+def build_service(total: int, latency_ms: float) -> ScoreDecayService:
+    return ScoreDecayService(
+        contact_repo=SyntheticContactRepo(total, latency_ms),
+        decay_calculator=DecayCalculator(load_weights()),
+        checkpoints=MemoryCheckpointStore(),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--contacts", type=int, default=20_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    baseline: float | None = None
+    for workers in args.workers:
+        start = time.perf_counter()
+        summary: Any = run_parallel_decay(
+            partial(build_service, args.contacts, args.latency_ms),
+            slice_count=workers,
+            run_id="bench",
+        )
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(
+            f"workers={workers:<3} scanned={summary.scanned:<8} decayed={summary.decayed:<8} "
+            f"wall={elapsed:7.2f}s speedup={baseline / elapsed:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Benchmark memory and GC cost of contact embeddings: list[float] vs packed float32.
+
+Contacts are read from their indexed JSON. For the list[float] baseline each contact keeps
+the parsed list, as Contact did before embeddings were packed, and the JSON holds the
+full-precision doubles the model returns, as the index did then. Per mode this reports:
+
+* heap retained by the contacts, measured with tracemalloc
+* full gc.collect() time with the contacts alive
+* the document's JSON size and the time to encode it for indexing
+
+    python benchmarks/embedding_memory.py --contacts 10000 --dim 1024
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from synthetic import make_contact
+
+from rise_scout.domain.contact.models import Contact
+from rise_scout.infrastructure.opensearch.serializers import (
+    contact_to_document,
+    document_json,
+    trusted_document_to_contact,
+)
+
+
+def as_list(doc: dict[str, Any]) -> Contact:
+    contact = trusted_document_to_contact(doc)
+    contact.__dict__["embedding_vector"] = doc["embedding_vector"]
+    return contact
+
+
+def with_doubles(doc: dict[str, Any], seed: int) -> dict[str, Any]:
+    # Same distribution as synthetic.make_contact, but never rounded to float32
+    rng = random.Random(seed)
+    return {**doc, "embedding_vector": [rng.uniform(-1, 1) for _ in doc["embedding_vector"]]}
+
+
+def load(texts: list[str], read: Callable[[dict[str, Any]], Contact]) -> tuple[int, list[Contact]]:
+    gc.collect()
+    tracemalloc.start()
+    contacts = [read(json.loads(text)) for text in texts]
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return retained, contacts
+
+
+def gc_ms(runs: int = 5) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        gc.collect()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def encode_us(docs: list[dict[str, Any]], encode: Callable[[dict[str, Any]], str]) -> float:
+    start = time.perf_counter()
+    for doc in docs:
+        encode(doc)
+    return (time.perf_counter() - start) / len(docs) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--contacts", type=int, default=10_000)
+    parser.add_argument("--dim", type=int, default=1024)
+    parser.add_argument("--reasons", type=int, default=20)
+    args = parser.parse_args()
+
+    docs = [
+        contact_to_document(make_contact(i, args.reasons, embedding_dim=args.dim))
+        for i in range(args.contacts)
+    ]
+    texts = [document_json(d) for d in docs]
+    double_texts = [json.dumps(with_doubles(d, i)) for i, d in enumerate(docs)]
+    sample = [json.loads(t) for t in double_texts[:500]]
+    packed = [contact_to_document(trusted_document_to_contact(json.loads(t))) for t in texts[:500]]
+
+    print(f"contacts={args.contacts} dim={args.dim} reasons={args.reasons}")
+    for label, read, source, docs, encode in (
+        ("list[float]", as_list, double_texts, sample, json.dumps),
+        ("float32", trusted_document_to_contact, texts, packed, document_json),
+    ):
+        retained, contacts = load(source, read)
+        collect = gc_ms()
+        size = statistics.mean(len(encode(d)) for d in docs)
+        print(
+            f"{label:<12} heap={retained / 2**20:7.1f}MiB"
+            f" ({retained / args.contacts / 1024:5.1f}KiB/contact)  gc={collect:6.1f}ms"
+            f"  json={size / 1024:5.1f}KiB  encode={encode_us(docs, encode):5.0f}us"
+        )
+        del contacts
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Evaluate kNN recall@k and index memory for each embedding size and quantization.
+
+The corpus is synthetic: unit vectors drawn around cluster centroids in a low-rank
+subspace plus full-rank noise, with queries perturbed from corpus members. Ground truth
+is exact cosine top-k on the full 1024-dim float32 vectors. Per format this reports:
+
+* recall@k of exact search over the vectors as the index would hold them
+* bytes per stored vector, and the HNSW native memory estimate 1.1 * (bytes + 8 * m)
+  per vector, scaled to a million contacts
+* the vector's share of the indexed JSON
+
+Vectors and queries go through VectorFormat.encode, so byte quantization is exactly what
+would be indexed; fp16 storage is emulated with np.float16 as faiss's scalar quantizer
+does. Titan v2 produces 256 and 512 dimensions natively; here a Gaussian random projection
+stands in for them, which tends to understate their recall. Search is brute force, so the
+numbers isolate the representation's loss from the HNSW graph's.
+
+    python benchmarks/embedding_recall.py --docs 10000 --queries 200
+    python benchmarks/embedding_recall.py --dimensions 1024 --quantizations float byte --k 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+
+import numpy as np
+
+from rise_scout.domain.embeddings.vector import to_float32
+from rise_scout.infrastructure.opensearch.vectors import VectorFormat, VectorQuantization
+
+FULL_DIMENSIONS = 1024
+
+
+def normalize(x: np.ndarray) -> np.ndarray:
+    return x / np.linalg.norm(x, axis=1, keepdims=True)
+
+
+def make_corpus(
+    rng: np.random.Generator, args: argparse.Namespace
+) -> tuple[np.ndarray, np.ndarray]:
+    # Clusters live in a low-rank subspace, as real text embeddings mostly do
+    basis, _ = np.linalg.qr(rng.standard_normal((FULL_DIMENSIONS, args.intrinsic)))
+
+    def sample(centers: np.ndarray, spread: float) -> np.ndarray:
+        latent = centers + spread * rng.standard_normal(centers.shape) / np.sqrt(args.intrinsic)
+        ambient = rng.standard_normal((len(centers), FULL_DIMENSIONS)) / np.sqrt(FULL_DIMENSIONS)
+        return normalize(normalize(latent) @ basis.T + args.ambient_noise * ambient)
+
+    centroids = normalize(rng.standard_normal((args.clusters, args.intrinsic)))
+    corpus = sample(centroids[rng.integers(args.clusters, size=args.docs)], args.spread)
+    members = rng.choice(args.docs, size=args.queries, replace=False)
+    queries = sample(corpus[members] @ basis, args.spread / 2)
+    return corpus.astype(np.float32), queries.astype(np.float32)
+
+
+def top_k(queries: np.ndarray, corpus: np.ndarray, k: int) -> np.ndarray:
+    scores = queries @ corpus.T
+    return np.argpartition(-scores, k, axis=1)[:, :k]
+
+
+def recall(found: np.ndarray, truth: np.ndarray) -> float:
+    k = truth.shape[1]
+    return statistics.mean(len(set(f) & set(t)) / k for f, t in zip(found, truth, strict=True))
+
+
+def as_indexed(vectors: np.ndarray, fmt: VectorFormat) -> tuple[np.ndarray, float]:
+    """What the index stores for each vector, and the mean JSON length of the vectors."""
+    texts = [fmt.encode(to_float32(v)) for v in vectors]
+    stored = np.array([json.loads(t) for t in texts], dtype=np.float32)
+    if fmt.quantization is VectorQuantization.FP16:
+        stored = stored.astype(np.float16).astype(np.float32)
+    return stored, statistics.mean(map(len, texts))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--docs", type=int, default=10_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--clusters", type=int, default=100)
+    parser.add_argument("--spread", type=float, default=1.0, help="Noise around each centroid")
+    parser.add_argument("--intrinsic", type=int, default=64, help="Rank of the cluster subspace")
+    parser.add_argument("--ambient-noise", type=float, default=0.2)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--m", type=int, default=24, help="HNSW m, as in the index mapping")
+    parser.add_argument("--dimensions", type=int, nargs="+", default=[256, 512, 1024])
+    parser.add_argument("--quantizations", nargs="+", default=[q.value for q in VectorQuantization])
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    corpus, queries = make_corpus(rng, args)
+    truth = top_k(queries, corpus, args.k)
+
+    print(f"docs={args.docs} queries={args.queries} clusters={args.clusters} k={args.k}")
+    for dimensions in args.dimensions:
+        if dimensions == FULL_DIMENSIONS:
+            reduced_corpus, reduced_queries = corpus, queries
+        else:
+            projection = rng.standard_normal((FULL_DIMENSIONS, dimensions)).astype(np.float32)
+            reduced_corpus = normalize(corpus @ projection)
+            reduced_queries = normalize(queries @ projection)
+
+        for quantization in args.quantizations:
+            fmt = VectorFormat(dimensions=dimensions, quantization=VectorQuantization(quantization))
+            start = time.perf_counter()
+            stored, json_bytes = as_indexed(reduced_corpus, fmt)
+            encode_us = (time.perf_counter() - start) / args.docs * 1e6
+            # Byte indexes are queried with byte vectors; faiss compares fp16 to float queries
+            if fmt.quantization is VectorQuantization.BYTE:
+                probes, _ = as_indexed(reduced_queries, fmt)
+            else:
+                probes = reduced_queries
+
+            vector_bytes = dimensions * fmt.bytes_per_dimension
+            hnsw_gib = 1.1 * (vector_bytes + 8 * args.m) * 1_000_000 / 2**30
+            print(
+                f"{dimensions:>5}d {quantization:<6}"
+                f" recall@{args.k}={recall(top_k(probes, stored, args.k), truth):.3f}"
+                f"  vector={vector_bytes:>5}B  hnsw/1M={hnsw_gib:5.2f}GiB"
+                f"  json={json_bytes / 1024:5.1f}KiB  encode={encode_us:5.0f}us"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Benchmark Redis round-trips per batch: per-key commands vs the pipelined store methods.
+
+Runs against fakeredis by default, or a real server with ``--url``. Each round-trip
+can be given a simulated network latency so fakeredis timings resemble ElastiCache.
+
+    python benchmarks/redis_round_trips.py --batch 10 100 1000 --latency-ms 0.5
+    python benchmarks/redis_round_trips.py --url redis://localhost:6379/15
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+from collections.abc import Callable
+from typing import Any
+
+import fakeredis
+import redis
+import redis.connection
+import structlog
+
+from rise_scout.domain.shared.types import AgentId
+from rise_scout.infrastructure.redis.debouncer import EventDebouncer
+from rise_scout.infrastructure.redis.refresh_flags import REFRESH_KEY, RefreshFlagStore
+
+
+class RoundTripCounter:
+    """Counts packets sent to the server, which is one per command or per pipeline."""
+
+    def __init__(self, latency_ms: float) -> None:
+        self.count = 0
+        self._latency = latency_ms / 1000
+        self._original = redis.connection.AbstractConnection.send_packed_command
+
+    def install(self) -> None:
+        counter = self
+
+        def send_packed_command(conn: Any, *args: Any, **kwargs: Any) -> None:
+            counter.count += 1
+            if counter._latency:
+                time.sleep(counter._latency)
+            counter._original(conn, *args, **kwargs)
+
+        redis.connection.AbstractConnection.send_packed_command = send_packed_command  # type: ignore[method-assign]
+
+    def measure(self, fn: Callable[[], object]) -> tuple[int, float]:
+        before = self.count
+        start = time.perf_counter()
+        fn()
+        return self.count - before, time.perf_counter() - start
+
+
+Timing = tuple[int, float]
+
+
+def run_batch(
+    client: redis.Redis[bytes], counter: RoundTripCounter, size: int
+) -> dict[str, tuple[Timing, Timing]]:
+    debouncer = EventDebouncer(client)
+    flags = RefreshFlagStore(client)
+    keys = [f"bench:{size}:{i}" for i in range(size)]
+    priorities = {AgentId(f"a-{i}"): float(i) for i in range(size)}
+
+    rows = {
+        "debounce": (
+            counter.measure(lambda: [debouncer.should_process(k) for k in keys]),
+            # What the Kafka consumers do per batch: skip seen offsets, mark processed ones
+            counter.measure(
+                lambda: debouncer.mark_many(list(debouncer.seen_many([f"{k}:b" for k in keys])))
+            ),
+        ),
+        "flag": (
+            counter.measure(
+                lambda: [client.zincrby(REFRESH_KEY, p, str(a)) for a, p in priorities.items()]
+            ),
+            counter.measure(lambda: flags.flag_agents(priorities)),
+        ),
+    }
+    loop_pop = counter.measure(lambda: [client.zpopmax(REFRESH_KEY, 1) for _ in range(size)])
+    flags.flag_agents(priorities)
+    rows["pop"] = (loop_pop, counter.measure(lambda: flags.pop_flagged_agents(limit=size)))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batch", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--latency-ms", type=float, default=0.5)
+    parser.add_argument("--url", help="real Redis to use instead of fakeredis; it is flushed")
+    args = parser.parse_args()
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    client = redis.from_url(args.url) if args.url else fakeredis.FakeRedis()
+    client.flushdb()
+    counter = RoundTripCounter(0.0 if args.url else args.latency_ms)
+    counter.install()
+    client.ping()  # connection handshake is not part of any batch
+
+    for size in args.batch:
+        for name, ((loop_trips, loop_s), (bulk_trips, bulk_s)) in run_batch(
+            client, counter, size
+        ).items():
+            print(
+                f"batch={size:<5} {name:<9} per-key={loop_trips:5} trips {loop_s * 1000:8.1f}ms  "
+                f"bulk={bulk_trips:3} trips {bulk_s * 1000:7.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
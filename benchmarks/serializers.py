@@ -0,0 +1,78 @@
+"""Benchmark contact (de)serialization: validated vs trusted reads, pydantic vs unrolled writes.
+
+Documents go through a JSON round trip first, so reads see what a search hit holds.
+
+    python benchmarks/serializers.py --contacts 20000 --reasons 50
+    python benchmarks/serializers.py --contacts 5000 --embedding-dim 1024
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+from synthetic import make_contact
+
+from rise_scout.domain.contact.models import Contact
+from rise_scout.infrastructure.opensearch.serializers import (
+    contact_to_document,
+    document_json,
+    document_to_contact,
+    trusted_document_to_contact,
+)
+
+
+def pydantic_contact_to_document(contact: Contact) -> dict[str, Any]:
+    doc = contact_to_document(contact)
+    doc["preferences"] = contact.preferences.model_dump()
+    doc["score_reasons"] = [r.model_dump(mode="json") for r in contact.score_reasons]
+    return doc
+
+
+def timed(fn: Callable[[Any], object], items: list[Any]) -> float:
+    start = time.perf_counter()
+    for item in items:
+        fn(item)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--contacts", type=int, default=20_000)
+    parser.add_argument("--reasons", type=int, default=50)
+    parser.add_argument("--embedding-dim", type=int, default=0)
+    args = parser.parse_args()
+
+    contacts = [
+        make_contact(i, reasons=args.reasons, embedding_dim=args.embedding_dim or None)
+        for i in range(args.contacts)
+    ]
+    docs = [json.loads(document_json(contact_to_document(c))) for c in contacts]
+    assert trusted_document_to_contact(docs[0]) == document_to_contact(docs[0])
+
+    print(f"contacts={args.contacts} reasons={args.reasons} embedding_dim={args.embedding_dim}")
+    rows: dict[str, tuple[Callable[[Any], object], Callable[[Any], object], list[Any]]] = {
+        "read": (document_to_contact, trusted_document_to_contact, docs),
+        "write": (pydantic_contact_to_document, contact_to_document, contacts),
+        # Load and save, as listing matching's bulk_get and bulk_save do
+        "round trip": (
+            lambda d: pydantic_contact_to_document(document_to_contact(d)),
+            lambda d: contact_to_document(trusted_document_to_contact(d)),
+            docs,
+        ),
+    }
+    for label, (baseline_fn, fast_fn, items) in rows.items():
+        baseline = timed(baseline_fn, items)
+        fast = timed(fast_fn, items)
+        print(
+            f"{label:<12} validated={baseline:6.3f}s ({args.contacts / baseline:8.0f}/s)  "
+            f"trusted={fast:6.3f}s ({args.contacts / fast:8.0f}/s)  "
+            f"speedup={baseline / fast:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
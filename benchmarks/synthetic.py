@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import random
+from datetime import UTC, datetime, timedelta
+
+from rise_scout.domain.contact.models import Contact, Preferences, ScoreReason
+from rise_scout.domain.shared.types import AgentId, ContactId, MlsId
+
+SIGNALS = [
+    ("listing_view", 3.0, "engagement"),
+    ("listing_save", 8.0, "engagement"),
+    ("open_house_rsvp", 20.0, "engagement"),
+    ("price_drop_match", 12.0, "market"),
+    ("new_listing_match", 10.0, "market"),
+    ("agent_note_added", 5.0, "relationship"),
+]
+
+
+def contact_id(index: int) -> ContactId:
+    return ContactId(f"c-{index:07d}")
+
+
+def make_contact(
+    index: int,
+    reasons: int = 20,
+    embedding_dim: int | None = None,
+    now: datetime | None = None,
+) -> Contact:
+    rng = random.Random(index)
+    now = now or datetime(2024, 6, 1, tzinfo=UTC)
+    return Contact(
+        contact_id=contact_id(index),
+        user_ids=[AgentId(f"a-{rng.randrange(1000):04d}")],
+        mls_ids=[MlsId("mls-1")],
+        first_name=f"First{index}",
+        last_name=f"Last{index}",
+        email=f"contact{index}@example.com",
+        preferences=Preferences(
+            price_min=200_000, price_max=600_000, zip_codes=["90210"], cities=["los angeles"]
+        ),
+        score=round(rng.uniform(0, 300), 2),
+        score_reasons=[
+            ScoreReason(
+                signal=signal,
+                points=points,
+                category=category,
+                detail=f"{signal} detail {i}",
+                timestamp=now - timedelta(days=rng.randrange(60), seconds=rng.randrange(86400)),
+            )
+            for i, (signal, points, category) in enumerate(
+                rng.choice(SIGNALS) for _ in range(reasons)
+            )
+        ],
+        embedding_vector=(
+            [rng.uniform(-1, 1) for _ in range(embedding_dim)] if embedding_dim else None
+        ),
+        updated_at=now,
+    )
@@ -0,0 +1,92 @@
+"""Benchmark per-agent search vs chunked _msearch for card refresh top-K.
+
+A fake client models each HTTP round-trip with a fixed latency plus a small
+per-sub-search cost, so the numbers isolate request count rather than
+cluster behaviour.
+
+    python benchmarks/top_by_agents.py --agents 100 1000 10000 --latency-ms 15
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+from typing import Any
+
+import structlog
+from synthetic import make_contact
+
+from rise_scout.domain.shared.types import AgentId
+from rise_scout.infrastructure.opensearch.contact_repository import OpenSearchContactRepository
+from rise_scout.infrastructure.opensearch.serializers import (
+    contact_to_document,
+    document_to_contact,
+)
+
+
+class LatencyClient:
+    def __init__(self, latency_ms: float, per_search_ms: float) -> None:
+        self._latency = latency_ms / 1000
+        self._per_search = per_search_ms / 1000
+        self._docs = [contact_to_document(make_contact(i, embedding_dim=1024)) for i in range(5)]
+        self.requests = 0
+
+    def _hits(self, source: list[str] | None) -> dict[str, Any]:
+        docs = self._docs if source is None else [{k: d[k] for k in source} for d in self._docs]
+        return {"hits": {"hits": [{"_source": d} for d in docs]}}
+
+    def search(self, index: str, body: dict[str, Any]) -> dict[str, Any]:
+        self.requests += 1
+        time.sleep(self._latency + self._per_search)
+        return self._hits(body.get("_source"))
+
+    def msearch(self, body: list[dict[str, Any]]) -> dict[str, Any]:
+        self.requests += 1
+        searches = body[1::2]
+        time.sleep(self._latency + self._per_search * len(searches))
+        return {"responses": [self._hits(s.get("_source")) for s in searches]}
+
+
+def per_agent_loop(client: LatencyClient, agent_ids: list[AgentId]) -> None:
+    for agent_id in agent_ids:
+        body = {
+            "query": {"term": {"user_ids": str(agent_id)}},
+            "sort": [{"score": {"order": "desc"}}],
+            "size": 5,
+        }
+        resp = client.search(index="contacts", body=body)
+        [document_to_contact(hit["_source"]) for hit in resp["hits"]["hits"]]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--agents", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--latency-ms", type=float, default=15.0)
+    parser.add_argument("--per-search-ms", type=float, default=0.2)
+    args = parser.parse_args()
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    for count in args.agents:
+        agent_ids = [AgentId(f"a-{i}") for i in range(count)]
+
+        loop_client = LatencyClient(args.latency_ms, args.per_search_ms)
+        start = time.perf_counter()
+        per_agent_loop(loop_client, agent_ids)
+        loop = time.perf_counter() - start
+
+        batch_client = LatencyClient(args.latency_ms, args.per_search_ms)
+        repo = OpenSearchContactRepository(batch_client, "contacts")  # type: ignore[arg-type]
+        start = time.perf_counter()
+        repo.get_top_by_agents(agent_ids)
+        batched = time.perf_counter() - start
+
+        print(
+            f"agents={count:<6} loop={loop:8.2f}s ({loop_client.requests} requests)  "
+            f"msearch={batched:7.2f}s ({batch_client.requests} requests)  "
+            f"speedup={loop / batched:6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
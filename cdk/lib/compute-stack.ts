@@ -31,6 +31,7 @@ export class ComputeStack extends cdk.Stack {
       RISE_SCOUT_AOSS_ENDPOINT: props.aossEndpoint,
       RISE_SCOUT_CARDS_TABLE: props.cardsTable.tableName,
       RISE_SCOUT_REDIS_URL: `redis://${props.redisEndpoint}:6379/0`,
+      RISE_SCOUT_DECAY_SLICE_COUNT: "4",
       POWERTOOLS_SERVICE_NAME: "rise-scout",
       POWERTOOLS_LOG_LEVEL: props.envName === "dev" ? "DEBUG" : "INFO",
     };
@@ -64,6 +65,16 @@ export class ComputeStack extends cdk.Stack {
       })
     );
 
+    // Score decay coordinator fans out slice workers to itself
+    lambdaRole.addToPolicy(
+      new iam.PolicyStatement({
+        actions: ["lambda:InvokeFunction"],
+        resources: [
+          `arn:aws:lambda:${this.region}:${this.account}:function:rise-scout-score-decay-${props.envName}`,
+        ],
+      })
+    );
+
     // DynamoDB access
     props.cardsTable.grantReadWriteData(lambdaRole);
 
@@ -85,15 +96,28 @@ export class ComputeStack extends cdk.Stack {
       environment: commonEnv,
     });
 
-    // EventBridge: daily score decay at 2 AM UTC
+    // EventBridge: daily score decay starting at 2 AM UTC. Follow-up invocations
+    // resume from the Redis checkpoint and exit immediately once the day's run is complete.
     new events.Rule(this, "ScoreDecaySchedule", {
-      schedule: events.Schedule.cron({ hour: "2", minute: "0" }),
+      schedule: events.Schedule.cron({ hour: "2-4", minute: "0/15" }),
       targets: [new targets.LambdaFunction(functions.scoreDecay)],
     });
 
-    // EventBridge: card refresh every 15 minutes
+    // EventBridge: card refresh stream worker. Each run consumes ContactScored events for
+    // up to ~55s (exiting early when idle) and rebuilds cards within seconds of scoring.
+    new events.Rule(this, "CardRefreshStreamSchedule", {
+      schedule: events.Schedule.rate(cdk.Duration.minutes(1)),
+      targets: [
+        new targets.LambdaFunction(functions.cardRefresh, {
+          event: events.RuleTargetInput.fromObject({ mode: "stream", max_run_ms: 55000 }),
+        }),
+      ],
+    });
+
+    // EventBridge: hourly drain of the refresh flag queue as a safety net for anything
+    // the stream worker missed
     new events.Rule(this, "CardRefreshSchedule", {
-      schedule: events.Schedule.rate(cdk.Duration.minutes(15)),
+      schedule: events.Schedule.rate(cdk.Duration.hours(1)),
       targets: [new targets.LambdaFunction(functions.cardRefresh)],
     });
   }
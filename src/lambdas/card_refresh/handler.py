@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from typing import Any
 
 from aws_lambda_powertools import Logger, Tracer
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
-from rise_scout.application.card_refresh import CardRefreshService
+from rise_scout.application.card_refresh import AsyncCardRefreshService, CardRefreshService
+from rise_scout.application.card_refresh_worker import CardRefreshWorker
 from rise_scout.infrastructure.container import Container
 
 logger = Logger()
@@ -13,6 +16,9 @@ tracer = Tracer()
 
 _container: Container | None = None
 
+# Leave room after the stream loop for the final flush
+STREAM_MARGIN_MS = 30_000
+
 
 def _get_container() -> Container:
     global _container
@@ -21,17 +27,69 @@ def _get_container() -> Container:
     return _container
 
 
-@logger.inject_lambda_context
-@tracer.capture_lambda_handler
-def handler(event: dict[str, Any], context: LambdaContext) -> dict[str, Any]:
-    container = _get_container()
-    service = CardRefreshService(
+def _build_service(container: Container) -> CardRefreshService:
+    return CardRefreshService(
         contact_repo=container.contact_repo,
         card_repo=container.card_repo,
         llm_service=container.llm_service,
         refresh_flags=container.refresh_flags,
+        max_workers=container.settings.llm_max_concurrency,
+        chunk_size=container.settings.card_refresh_chunk_size,
+        insight_cache=container.insight_cache,
+        llm_model_id=container.settings.llm_model_id,
+        leases=container.leases,
+    )
+
+
+def _build_async_service(container: Container) -> AsyncCardRefreshService:
+    return AsyncCardRefreshService(
+        contact_repo=container.async_contact_repo,
+        card_repo=container.async_card_repo,
+        llm_service=container.async_llm_service,
+        refresh_flags=container.async_refresh_flags,
+        max_concurrency=container.settings.llm_max_concurrency,
+        chunk_size=container.settings.card_refresh_chunk_size,
+        insight_cache=container.async_insight_cache,
+        llm_model_id=container.settings.llm_model_id,
+        leases=container.leases,
     )
 
-    refreshed = service.refresh_flagged_agents()
+
+@logger.inject_lambda_context
+@tracer.capture_lambda_handler
+def handler(event: dict[str, Any], context: LambdaContext) -> dict[str, Any]:
+    container = _get_container()
+    service = _build_service(container)
+
+    if event.get("mode") == "stream":
+        # Stream mode: rebuild cards within seconds of scoring until the run window closes
+        worker = CardRefreshWorker(
+            service,
+            container.contact_events,
+            coalesce_ms=container.settings.card_stream_coalesce_ms,
+            idle_exit_ms=container.settings.card_stream_idle_exit_ms,
+            refresh_flags=container.refresh_flags,
+            remaining_time_ms=context.get_remaining_time_in_millis,
+        )
+        stop_at = time.monotonic() + event.get("max_run_ms", 55_000) / 1000
+        refreshed = worker.run(
+            lambda: (
+                time.monotonic() < stop_at
+                and context.get_remaining_time_in_millis() > STREAM_MARGIN_MS
+            )
+        )
+        logger.info("Card stream run complete", refreshed=refreshed)
+        return {"refreshed": refreshed}
+
+    if container.settings.async_io:
+        refreshed = asyncio.run(
+            _build_async_service(container).refresh_flagged_agents(
+                remaining_time_ms=context.get_remaining_time_in_millis
+            )
+        )
+    else:
+        refreshed = service.refresh_flagged_agents(
+            remaining_time_ms=context.get_remaining_time_in_millis
+        )
     logger.info("Card refresh complete", refreshed=refreshed)
     return {"refreshed": refreshed}
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import base64
 import json
+from collections import defaultdict
 from typing import Any
 
 from aws_lambda_powertools import Logger, Tracer
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
-from rise_scout.application.contact_ingestion import ContactIngestionService
+from rise_scout.application.contact_ingestion import (
+    AsyncContactIngestionService,
+    ContactIngestionService,
+)
 from rise_scout.infrastructure.container import Container
+from rise_scout.infrastructure.kafka.dedupe import mark_records_processed, skip_processed_records
 
 logger = Logger()
 tracer = Tracer()
@@ -31,22 +37,59 @@ def _build_service(container: Container) -> ContactIngestionService:
         refresh_flags=container.refresh_flags,
         contact_parser=container.contact_change_parser,
         interaction_parser=container.interaction_parser,
+        event_stream=container.contact_events,
     )
 
 
+def _build_async_service(container: Container) -> AsyncContactIngestionService:
+    return AsyncContactIngestionService(
+        contact_repo=container.async_contact_repo,
+        scoring_engine=container.scoring_engine,
+        embedding_service=container.async_embedding_service,
+        refresh_flags=container.async_refresh_flags,
+        contact_parser=container.contact_change_parser,
+        interaction_parser=container.interaction_parser,
+        event_stream=container.async_contact_events,
+    )
+
+
+def _decode(record: dict[str, Any]) -> dict[str, Any]:
+    raw = base64.b64decode(record["value"]).decode("utf-8")
+    return json.loads(raw)
+
+
 @logger.inject_lambda_context
 @tracer.capture_lambda_handler
 def handler(event: dict[str, Any], context: LambdaContext) -> dict[str, Any]:
     container = _get_container()
+    records = skip_processed_records(container.debouncer, event.get("records", {}))
+    # Only records handled by this delivery are marked; anything else is retried if redelivered
+    done: list[dict[str, Any]] = []
+    try:
+        if container.settings.async_io:
+            processed, errors = asyncio.run(_process_async(container, records, done))
+        else:
+            processed, errors = _process(container, records, done)
+    finally:
+        mark_records_processed(
+            container.debouncer, done, ttl_seconds=container.settings.kafka_dedupe_ttl_seconds
+        )
+
+    logger.info("Batch complete", processed=processed, errors=errors)
+    return {"processed": processed, "errors": errors}
+
+
+def _process(
+    container: Container, records: dict[str, list[dict[str, Any]]], done: list[dict[str, Any]]
+) -> tuple[int, int]:
     service = _build_service(container)
     processed = 0
     errors = 0
 
-    for topic, records in event.get("records", {}).items():
-        for record in records:
+    for topic, batch in records.items():
+        for record in batch:
             try:
-                raw = base64.b64decode(record["value"]).decode("utf-8")
-                payload = json.loads(raw)
+                payload = _decode(record)
 
                 if "ai_contact_change_payloads" in topic:
                     service.handle_contact_change(payload)
@@ -57,9 +100,56 @@ def handler(event: dict[str, Any], context: LambdaContext) -> dict[str, Any]:
                     continue
 
                 processed += 1
+                done.append(record)
             except Exception:
                 errors += 1
                 logger.exception("Record processing failed", topic=topic)
 
-    logger.info("Batch complete", processed=processed, errors=errors)
-    return {"processed": processed, "errors": errors}
+    return processed, errors
+
+
+async def _process_async(
+    container: Container, records: dict[str, list[dict[str, Any]]], done: list[dict[str, Any]]
+) -> tuple[int, int]:
+    service = _build_async_service(container)
+    errors = 0
+
+    # Records for one contact keep their order; different contacts are processed concurrently
+    lanes: dict[str, list[tuple[str, dict[str, Any], dict[str, Any]]]] = defaultdict(list)
+    for topic, batch in records.items():
+        for record in batch:
+            try:
+                payload = _decode(record)
+            except Exception:
+                errors += 1
+                logger.exception("Record processing failed", topic=topic)
+                continue
+            lanes[str(payload.get("contact_id"))].append((topic, record, payload))
+
+    results = await asyncio.gather(*(_process_lane(service, lane, done) for lane in lanes.values()))
+    return sum(p for p, _ in results), errors + sum(e for _, e in results)
+
+
+async def _process_lane(
+    service: AsyncContactIngestionService,
+    lane: list[tuple[str, dict[str, Any], dict[str, Any]]],
+    done: list[dict[str, Any]],
+) -> tuple[int, int]:
+    processed = 0
+    errors = 0
+    for topic, record, payload in lane:
+        try:
+            if "ai_contact_change_payloads" in topic:
+                await service.handle_contact_change(payload)
+            elif "ai_contact_interactions" in topic:
+                await service.handle_interaction(payload)
+            else:
+                logger.warning("Unknown topic", topic=topic)
+                continue
+
+            processed += 1
+            done.append(record)
+        except Exception:
+            errors += 1
+            logger.exception("Record processing failed", topic=topic)
+    return processed, errors
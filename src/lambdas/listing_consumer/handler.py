@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import base64
 import json
 from typing import Any
@@ -7,8 +8,12 @@ from typing import Any
 from aws_lambda_powertools import Logger, Tracer
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
-from rise_scout.application.listing_matching import ListingMatchingService
+from rise_scout.application.listing_matching import (
+    AsyncListingMatchingService,
+    ListingMatchingService,
+)
 from rise_scout.infrastructure.container import Container
+from rise_scout.infrastructure.kafka.dedupe import mark_records_processed, skip_processed_records
 
 logger = Logger()
 tracer = Tracer()
@@ -30,27 +35,83 @@ def _build_service(container: Container) -> ListingMatchingService:
         scoring_engine=container.scoring_engine,
         refresh_flags=container.refresh_flags,
         listing_parser=container.listing_parser,
+        event_stream=container.contact_events,
     )
 
 
+def _build_async_service(container: Container) -> AsyncListingMatchingService:
+    return AsyncListingMatchingService(
+        contact_repo=container.async_contact_repo,
+        search_repo=container.async_search_repo,
+        scoring_engine=container.scoring_engine,
+        refresh_flags=container.async_refresh_flags,
+        listing_parser=container.listing_parser,
+        event_stream=container.async_contact_events,
+    )
+
+
+def _decode(record: dict[str, Any]) -> dict[str, Any]:
+    raw = base64.b64decode(record["value"]).decode("utf-8")
+    return json.loads(raw)
+
+
 @logger.inject_lambda_context
 @tracer.capture_lambda_handler
 def handler(event: dict[str, Any], context: LambdaContext) -> dict[str, Any]:
     container = _get_container()
+    records = skip_processed_records(container.debouncer, event.get("records", {}))
+    # Only records handled by this delivery are marked; anything else is retried if redelivered
+    done: list[dict[str, Any]] = []
+    try:
+        if container.settings.async_io:
+            processed, errors = asyncio.run(_process_async(container, records, done))
+        else:
+            processed, errors = _process(container, records, done)
+    finally:
+        mark_records_processed(
+            container.debouncer, done, ttl_seconds=container.settings.kafka_dedupe_ttl_seconds
+        )
+
+    logger.info("Listing batch complete", processed=processed, errors=errors)
+    return {"processed": processed, "errors": errors}
+
+
+def _process(
+    container: Container, records: dict[str, list[dict[str, Any]]], done: list[dict[str, Any]]
+) -> tuple[int, int]:
     service = _build_service(container)
     processed = 0
     errors = 0
 
-    for _topic, records in event.get("records", {}).items():
-        for record in records:
+    for _topic, batch in records.items():
+        for record in batch:
             try:
-                raw = base64.b64decode(record["value"]).decode("utf-8")
-                payload = json.loads(raw)
-                service.handle_listing_event(payload)
+                service.handle_listing_event(_decode(record))
                 processed += 1
+                done.append(record)
             except Exception:
                 errors += 1
                 logger.exception("Listing record failed")
 
-    logger.info("Listing batch complete", processed=processed, errors=errors)
-    return {"processed": processed, "errors": errors}
+    return processed, errors
+
+
+async def _process_async(
+    container: Container, records: dict[str, list[dict[str, Any]]], done: list[dict[str, Any]]
+) -> tuple[int, int]:
+    service = _build_async_service(container)
+    processed = 0
+    errors = 0
+
+    # Listings can match the same contacts, so events still apply one at a time
+    for _topic, batch in records.items():
+        for record in batch:
+            try:
+                await service.handle_listing_event(_decode(record))
+                processed += 1
+                done.append(record)
+            except Exception:
+                errors += 1
+                logger.exception("Listing record failed")
+
+    return processed, errors
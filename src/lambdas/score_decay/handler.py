@@ -6,6 +6,7 @@ from aws_lambda_powertools import Logger, Tracer
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
 from rise_scout.application.score_decay import ScoreDecayService
+from rise_scout.domain.scoring.checkpoint import daily_run_id
 from rise_scout.infrastructure.container import Container
 
 logger = Logger()
@@ -28,8 +29,49 @@ def handler(event: dict[str, Any], context: LambdaContext) -> dict[str, Any]:
     service = ScoreDecayService(
         contact_repo=container.contact_repo,
         decay_calculator=container.decay_calculator,
+        checkpoints=container.decay_checkpoints,
+        leases=container.leases,
     )
+    run_id = event.get("run_id") or daily_run_id()
+    slice_count = int(event.get("slice_count", container.settings.decay_slice_count))
 
-    decayed = service.run_decay()
-    logger.info("Score decay complete", decayed=decayed)
-    return {"decayed": decayed}
+    # Scheduled invocations coordinate; each slice runs in its own async invocation
+    if slice_count > 1 and "slice_id" not in event:
+        from rise_scout.infrastructure.awslambda.slice_dispatcher import LambdaSliceDispatcher
+
+        dispatcher = LambdaSliceDispatcher(
+            context.invoked_function_arn, container.settings.aws_region
+        )
+        dispatched = service.dispatch_slices(dispatcher, slice_count, run_id=run_id)
+        summary = service.summarize(run_id, slice_count)
+        logger.info(
+            "Score decay slices dispatched",
+            run_id=summary.run_id,
+            dispatched=dispatched,
+            decayed=summary.decayed,
+        )
+        return {
+            "run_id": summary.run_id,
+            "dispatched": dispatched,
+            "decayed": summary.decayed,
+            "completed": summary.completed,
+        }
+
+    checkpoint = service.run_decay(
+        run_id=run_id,
+        remaining_time_ms=context.get_remaining_time_in_millis,
+        slice_id=int(event.get("slice_id", 0)),
+        slice_count=slice_count,
+    )
+    logger.info(
+        "Score decay invocation finished",
+        key=checkpoint.key,
+        decayed=checkpoint.decayed,
+        completed=checkpoint.completed,
+    )
+    return {
+        "run_id": checkpoint.run_id,
+        "slice_id": checkpoint.slice_id,
+        "decayed": checkpoint.decayed,
+        "completed": checkpoint.completed,
+    }
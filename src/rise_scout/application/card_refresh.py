@@ -1,13 +1,31 @@
 from __future__ import annotations
 
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+
 import structlog
 
-from rise_scout.domain.cards.llm_service import LLMEnrichmentService
+from rise_scout.domain.cards.insight_cache import (
+    AsyncInsightCache,
+    CachedInsight,
+    InsightCache,
+    estimate_tokens,
+    insight_cache_key,
+)
+from rise_scout.domain.cards.llm_service import AsyncLLMEnrichmentService, LLMEnrichmentService
 from rise_scout.domain.cards.models import Card, CardContact
-from rise_scout.domain.cards.repository import CardRepository
+from rise_scout.domain.cards.repository import AsyncCardRepository, CardRepository
 from rise_scout.domain.contact.models import Contact
-from rise_scout.domain.contact.repository import ContactRepository
-from rise_scout.domain.shared.services import RefreshFlagService
+from rise_scout.domain.contact.repository import AsyncContactRepository, ContactRepository
+from rise_scout.domain.shared.services import (
+    AsyncRefreshFlagService,
+    Lease,
+    LeaseService,
+    RefreshFlagService,
+)
+from rise_scout.domain.shared.types import AgentId, ContactId
 
 logger = structlog.get_logger()
 
@@ -19,50 +37,445 @@ class CardRefreshService:
         card_repo: CardRepository,
         llm_service: LLMEnrichmentService,
         refresh_flags: RefreshFlagService,
+        max_workers: int = 8,
+        time_margin_ms: int = 20_000,
+        chunk_size: int = 100,
+        insight_cache: InsightCache | None = None,
+        leases: LeaseService | None = None,
+        lease_ttl_ms: int = 60_000,
+        llm_model_id: str = "",
     ) -> None:
         self._contact_repo = contact_repo
         self._card_repo = card_repo
         self._llm_service = llm_service
         self._refresh_flags = refresh_flags
+        self._max_workers = max_workers
+        self._time_margin_ms = time_margin_ms
+        self._chunk_size = chunk_size
+        self._insight_cache = insight_cache
+        self._llm_model_id = llm_model_id
+        self._leases = leases
+        self._lease_ttl_ms = lease_ttl_ms
+
+    def refresh_flagged_agents(self, remaining_time_ms: Callable[[], int] | None = None) -> int:
+        if self._leases is None:
+            return self._drain_flags(remaining_time_ms, None)
 
-    def refresh_flagged_agents(self) -> int:
-        agent_ids = self._refresh_flags.pop_flagged_agents()
-        if not agent_ids:
-            logger.info("no_agents_flagged")
+        lease = self._leases.acquire("card_refresh", self._lease_ttl_ms)
+        if lease is None:
+            logger.info("card_refresh_already_running")
             return 0
+        try:
+            return self._drain_flags(remaining_time_ms, lease)
+        finally:
+            lease.release()
 
-        top_contacts = self._contact_repo.get_top_by_agents(agent_ids, limit=5)
+    def _drain_flags(self, remaining_time_ms: Callable[[], int] | None, lease: Lease | None) -> int:
+        deadline = _deadline(remaining_time_ms, self._time_margin_ms)
         refreshed = 0
+        chunks = 0
+        while _may_continue(deadline, lease, chunks):
+            popped = self._refresh_flags.pop_flagged_agents(limit=self._chunk_size)
+            if not popped:
+                break
+            try:
+                refreshed += len(self._refresh_agents(list(popped), deadline))
+            except Exception:
+                _log_chunk_failed(popped)
+                self._refresh_flags.flag_agents(popped)
+                raise
+            chunks += 1
+        _log_drain(chunks, refreshed)
+        return refreshed
+
+    def refresh_agents(
+        self, agent_ids: list[AgentId], remaining_time_ms: Callable[[], int] | None = None
+    ) -> int:
+        deadline = _deadline(remaining_time_ms, self._time_margin_ms)
+        return len(self._refresh_agents(agent_ids, deadline))
+
+    def build_card(
+        self, agent_id: AgentId, remaining_time_ms: Callable[[], int] | None = None
+    ) -> Card | None:
+        cards = self._refresh_agents([agent_id], _deadline(remaining_time_ms, self._time_margin_ms))
+        return cards[0] if cards else None
+
+    def _refresh_agents(self, agent_ids: list[AgentId], deadline: float | None) -> list[Card]:
+        top_contacts = self._contact_repo.get_top_by_agents(agent_ids, limit=5)
+        insights = self._generate_insights(top_contacts, deadline)
+        stale = {a: self._stale_insights(a) for a in _missing_insights(top_contacts, insights)}
+        cards = _build_cards(agent_ids, top_contacts, insights, stale)
+
+        written = self._card_repo.save_many(cards) if cards else 0
+        _log_chunk(agent_ids, cards, written)
+        return cards
+
+    def _generate_insights(
+        self, top_contacts: dict[AgentId, list[Contact]], deadline: float | None
+    ) -> dict[ContactId, str]:
+        unique = {c.contact_id: c for contacts in top_contacts.values() for c in contacts}
+        if not unique:
+            return {}
+
+        keys = {cid: insight_cache_key(c, self._llm_model_id) for cid, c in unique.items()}
+        cached = self._cached_insights(keys)
+        batches = _insight_batches(top_contacts, set(cached))
+
+        fresh: dict[ContactId, str] = {}
+        timed_out = 0
+        if batches:
+            pool = ThreadPoolExecutor(max_workers=self._max_workers)
+            futures: dict[Future[dict[ContactId, str]], list[Contact]] = {
+                pool.submit(self._generate_batch_safe, batch): batch for batch in batches
+            }
+            done, not_done = wait(futures, timeout=_timeout(deadline))
+            # Stragglers are abandoned rather than joined so the run can finish in budget
+            pool.shutdown(wait=False, cancel_futures=True)
+            for future in done:
+                fresh.update(_batch_insights(futures[future], future.result()))
+            timed_out = sum(len(futures[f]) for f in not_done)
+            self._store_insights(_cache_entries(fresh, keys, unique))
+
+        return _merge_insights(unique, len(batches), cached, fresh, timed_out)
+
+    def _cached_insights(self, keys: dict[ContactId, str]) -> dict[ContactId, CachedInsight]:
+        if self._insight_cache is None:
+            return {}
+        try:
+            entries = self._insight_cache.get_many(list(keys.values()))
+        except Exception:
+            logger.warning("insight_cache_read_failed", exc_info=True)
+            return {}
+        return _cached_by_contact(keys, entries)
+
+    def _store_insights(self, entries: dict[str, CachedInsight]) -> None:
+        if self._insight_cache is None or not entries:
+            return
+        try:
+            self._insight_cache.set_many(entries)
+        except Exception:
+            logger.warning("insight_cache_write_failed", exc_info=True)
+
+    def _stale_insights(self, agent_id: AgentId) -> dict[ContactId, str]:
+        try:
+            card = self._card_repo.get(agent_id)
+        except Exception:
+            logger.warning("stale_card_lookup_failed", agent_id=str(agent_id), exc_info=True)
+            return {}
+        return _card_insights(card)
+
+    def _generate_batch_safe(self, contacts: list[Contact]) -> dict[ContactId, str]:
+        try:
+            return self._llm_service.generate_insights(contacts)
+        except Exception:
+            _log_generation_failed(contacts)
+            return {}
+
+
+class AsyncCardRefreshService:
+    def __init__(
+        self,
+        contact_repo: AsyncContactRepository,
+        card_repo: AsyncCardRepository,
+        llm_service: AsyncLLMEnrichmentService,
+        refresh_flags: AsyncRefreshFlagService,
+        max_concurrency: int = 8,
+        time_margin_ms: int = 20_000,
+        chunk_size: int = 100,
+        insight_cache: AsyncInsightCache | None = None,
+        leases: LeaseService | None = None,
+        lease_ttl_ms: int = 60_000,
+        llm_model_id: str = "",
+    ) -> None:
+        self._contact_repo = contact_repo
+        self._card_repo = card_repo
+        self._llm_service = llm_service
+        self._refresh_flags = refresh_flags
+        self._max_concurrency = max_concurrency
+        self._time_margin_ms = time_margin_ms
+        self._chunk_size = chunk_size
+        self._insight_cache = insight_cache
+        self._llm_model_id = llm_model_id
+        self._leases = leases
+        self._lease_ttl_ms = lease_ttl_ms
 
-        for agent_id in agent_ids:
-            contacts = top_contacts.get(agent_id, [])
-            if not contacts:
-                continue
+    async def refresh_flagged_agents(
+        self, remaining_time_ms: Callable[[], int] | None = None
+    ) -> int:
+        if self._leases is None:
+            return await self._drain_flags(remaining_time_ms, None)
 
-            card_contacts = [self._build_card_contact(c) for c in contacts]
-            card = Card(agent_id=agent_id, contacts=card_contacts)
-            self._card_repo.save(card)
-            refreshed += 1
+        lease = await asyncio.to_thread(self._leases.acquire, "card_refresh", self._lease_ttl_ms)
+        if lease is None:
+            logger.info("card_refresh_already_running")
+            return 0
+        try:
+            return await self._drain_flags(remaining_time_ms, lease)
+        finally:
+            await asyncio.to_thread(lease.release)
 
-        logger.info("card_refresh_complete", agents=len(agent_ids), refreshed=refreshed)
+    async def _drain_flags(
+        self, remaining_time_ms: Callable[[], int] | None, lease: Lease | None
+    ) -> int:
+        deadline = _deadline(remaining_time_ms, self._time_margin_ms)
+        refreshed = 0
+        chunks = 0
+        while _may_continue(deadline, lease, chunks):
+            popped = await self._refresh_flags.pop_flagged_agents(limit=self._chunk_size)
+            if not popped:
+                break
+            try:
+                refreshed += len(await self._refresh_agents(list(popped), deadline))
+            except Exception:
+                _log_chunk_failed(popped)
+                await self._refresh_flags.flag_agents(popped)
+                raise
+            chunks += 1
+        _log_drain(chunks, refreshed)
         return refreshed
 
-    def _build_card_contact(self, contact: Contact) -> CardContact:
-        return CardContact(
-            contact_id=contact.contact_id,
-            name=contact.display_name,
-            score=contact.score,
-            top_reasons=contact.top_score_details(limit=3),
-            insight=self._generate_insight_safe(contact),
+    async def refresh_agents(
+        self, agent_ids: list[AgentId], remaining_time_ms: Callable[[], int] | None = None
+    ) -> int:
+        deadline = _deadline(remaining_time_ms, self._time_margin_ms)
+        return len(await self._refresh_agents(agent_ids, deadline))
+
+    async def _refresh_agents(self, agent_ids: list[AgentId], deadline: float | None) -> list[Card]:
+        top_contacts = await self._contact_repo.get_top_by_agents(agent_ids, limit=5)
+        insights = await self._generate_insights(top_contacts, deadline)
+        # Previous cards are only read for agents with a missing insight, all at once
+        missing = _missing_insights(top_contacts, insights)
+        stale = dict(
+            zip(
+                missing,
+                await asyncio.gather(*(self._stale_insights(a) for a in missing)),
+                strict=True,
+            )
         )
+        cards = _build_cards(agent_ids, top_contacts, insights, stale)
+
+        written = await self._card_repo.save_many(cards) if cards else 0
+        _log_chunk(agent_ids, cards, written)
+        return cards
+
+    async def _generate_insights(
+        self, top_contacts: dict[AgentId, list[Contact]], deadline: float | None
+    ) -> dict[ContactId, str]:
+        unique = {c.contact_id: c for contacts in top_contacts.values() for c in contacts}
+        if not unique:
+            return {}
+
+        keys = {cid: insight_cache_key(c, self._llm_model_id) for cid, c in unique.items()}
+        cached = await self._cached_insights(keys)
+        batches = _insight_batches(top_contacts, set(cached))
+
+        fresh: dict[ContactId, str] = {}
+        timed_out = 0
+        if batches:
+            semaphore = asyncio.Semaphore(self._max_concurrency)
+            tasks = {
+                asyncio.ensure_future(self._generate_batch_safe(batch, semaphore)): batch
+                for batch in batches
+            }
+            done, not_done = await asyncio.wait(tasks, timeout=_timeout(deadline))
+            for task in not_done:
+                task.cancel()
+            for task in done:
+                fresh.update(_batch_insights(tasks[task], task.result()))
+            timed_out = sum(len(tasks[t]) for t in not_done)
+            await self._store_insights(_cache_entries(fresh, keys, unique))
 
-    def _generate_insight_safe(self, contact: Contact) -> str:
+        return _merge_insights(unique, len(batches), cached, fresh, timed_out)
+
+    async def _cached_insights(self, keys: dict[ContactId, str]) -> dict[ContactId, CachedInsight]:
+        if self._insight_cache is None:
+            return {}
         try:
-            return self._llm_service.generate_insight(contact)
+            entries = await self._insight_cache.get_many(list(keys.values()))
         except Exception:
-            logger.warning(
-                "insight_generation_failed",
-                contact_id=str(contact.contact_id),
-                exc_info=True,
-            )
-            return ""
+            logger.warning("insight_cache_read_failed", exc_info=True)
+            return {}
+        return _cached_by_contact(keys, entries)
+
+    async def _store_insights(self, entries: dict[str, CachedInsight]) -> None:
+        if self._insight_cache is None or not entries:
+            return
+        try:
+            await self._insight_cache.set_many(entries)
+        except Exception:
+            logger.warning("insight_cache_write_failed", exc_info=True)
+
+    async def _stale_insights(self, agent_id: AgentId) -> dict[ContactId, str]:
+        try:
+            card = await self._card_repo.get(agent_id)
+        except Exception:
+            logger.warning("stale_card_lookup_failed", agent_id=str(agent_id), exc_info=True)
+            return {}
+        return _card_insights(card)
+
+    async def _generate_batch_safe(
+        self, contacts: list[Contact], semaphore: asyncio.Semaphore
+    ) -> dict[ContactId, str]:
+        async with semaphore:
+            try:
+                return await self._llm_service.generate_insights(contacts)
+            except Exception:
+                _log_generation_failed(contacts)
+                return {}
+
+
+# Everything below is shared by both services; only the I/O differs between them
+
+
+def _deadline(remaining_time_ms: Callable[[], int] | None, margin_ms: int) -> float | None:
+    if remaining_time_ms is None:
+        return None
+    return time.monotonic() + (remaining_time_ms() - margin_ms) / 1000
+
+
+def _timeout(deadline: float | None) -> float | None:
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+def _may_continue(deadline: float | None, lease: Lease | None, chunks: int) -> bool:
+    if lease is not None and lease.lost:
+        logger.warning("card_refresh_lease_lost", chunks=chunks)
+        return False
+    if deadline is not None and time.monotonic() >= deadline:
+        # Agents not popped yet stay flagged for the next run
+        logger.info("card_refresh_budget_exhausted", chunks=chunks)
+        return False
+    return True
+
+
+def _log_drain(chunks: int, refreshed: int) -> None:
+    if chunks == 0:
+        logger.info("no_agents_flagged")
+    else:
+        logger.info("card_refresh_complete", chunks=chunks, refreshed=refreshed)
+
+
+def _missing_insights(
+    top_contacts: dict[AgentId, list[Contact]], insights: dict[ContactId, str]
+) -> list[AgentId]:
+    return [
+        agent_id
+        for agent_id, contacts in top_contacts.items()
+        if any(not insights.get(c.contact_id) for c in contacts)
+    ]
+
+
+def _build_cards(
+    agent_ids: list[AgentId],
+    top_contacts: dict[AgentId, list[Contact]],
+    insights: dict[ContactId, str],
+    stale: dict[AgentId, dict[ContactId, str]],
+) -> list[Card]:
+    # Contacts whose insight missed the budget or failed keep their previous one
+    return [
+        Card(
+            agent_id=agent_id,
+            contacts=[
+                _card_contact(
+                    c, insights.get(c.contact_id) or stale.get(agent_id, {}).get(c.contact_id, "")
+                )
+                for c in top_contacts[agent_id]
+            ],
+        )
+        for agent_id in agent_ids
+        if top_contacts.get(agent_id)
+    ]
+
+
+def _log_chunk(agent_ids: list[AgentId], cards: list[Card], written: int) -> None:
+    logger.info(
+        "card_refresh_chunk_complete",
+        agents=len(agent_ids),
+        refreshed=len(cards),
+        written=written,
+    )
+
+
+def _log_chunk_failed(popped: dict[AgentId, float]) -> None:
+    # Popped agents are flagged again at their priority so the failure doesn't drop them
+    logger.exception("card_refresh_chunk_failed", agents=len(popped))
+
+
+def _batch_insights(batch: list[Contact], result: dict[ContactId, str]) -> dict[ContactId, str]:
+    # Contacts the model skipped count as failed
+    return {c.contact_id: result.get(c.contact_id, "") for c in batch}
+
+
+def _cache_entries(
+    fresh: dict[ContactId, str], keys: dict[ContactId, str], unique: dict[ContactId, Contact]
+) -> dict[str, CachedInsight]:
+    return {
+        keys[cid]: CachedInsight(insight=text, tokens=estimate_tokens(unique[cid], text))
+        for cid, text in fresh.items()
+        if text
+    }
+
+
+def _merge_insights(
+    unique: dict[ContactId, Contact],
+    requests: int,
+    cached: dict[ContactId, CachedInsight],
+    fresh: dict[ContactId, str],
+    timed_out: int,
+) -> dict[ContactId, str]:
+    logger.info(
+        "insights_generated",
+        requested=len(unique),
+        requests=requests,
+        cache_hits=len(cached),
+        hit_rate=round(len(cached) / len(unique), 3),
+        tokens_saved=sum(entry.tokens for entry in cached.values()),
+        within_budget=sum(1 for text in fresh.values() if text),
+        failed=sum(1 for text in fresh.values() if not text),
+        timed_out=timed_out,
+    )
+    return {cid: entry.insight for cid, entry in cached.items()} | fresh
+
+
+def _cached_by_contact(
+    keys: dict[ContactId, str], entries: dict[str, CachedInsight]
+) -> dict[ContactId, CachedInsight]:
+    return {cid: entries[key] for cid, key in keys.items() if key in entries}
+
+
+def _card_insights(card: Card | None) -> dict[ContactId, str]:
+    if card is None:
+        return {}
+    return {c.contact_id: c.insight for c in card.contacts if c.insight}
+
+
+def _log_generation_failed(contacts: list[Contact]) -> None:
+    logger.warning(
+        "insight_generation_failed",
+        contact_ids=[str(c.contact_id) for c in contacts],
+        exc_info=True,
+    )
+
+
+def _insight_batches(
+    top_contacts: dict[AgentId, list[Contact]], cached: set[ContactId]
+) -> list[list[Contact]]:
+    # One request per card; contacts shared between cards are asked for only once
+    batches: list[list[Contact]] = []
+    assigned = set(cached)
+    for contacts in top_contacts.values():
+        batch = [c for c in contacts if c.contact_id not in assigned]
+        assigned.update(c.contact_id for c in batch)
+        if batch:
+            batches.append(batch)
+    return batches
+
+
+def _card_contact(contact: Contact, insight: str) -> CardContact:
+    return CardContact(
+        contact_id=contact.contact_id,
+        name=contact.display_name,
+        score=contact.score,
+        top_reasons=contact.top_score_details(limit=3),
+        insight=insight,
+    )
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import statistics
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+import structlog
+
+from rise_scout.application.card_refresh import CardRefreshService
+from rise_scout.domain.shared.services import ContactEventStream, RefreshFlagService
+from rise_scout.domain.shared.types import AgentId
+
+logger = structlog.get_logger()
+
+
+class CardRefreshWorker:
+    def __init__(
+        self,
+        card_refresh: CardRefreshService,
+        event_stream: ContactEventStream,
+        coalesce_ms: int = 2_000,
+        batch_size: int = 100,
+        block_ms: int = 500,
+        idle_exit_ms: int | None = None,
+        refresh_flags: RefreshFlagService | None = None,
+        remaining_time_ms: Callable[[], int] | None = None,
+    ) -> None:
+        self._card_refresh = card_refresh
+        self._event_stream = event_stream
+        self._coalesce = coalesce_ms / 1000
+        self._batch_size = batch_size
+        self._block_ms = block_ms
+        self._idle_exit = None if idle_exit_ms is None else idle_exit_ms / 1000
+        self._refresh_flags = refresh_flags
+        self._remaining_time_ms = remaining_time_ms
+
+        self._first_seen: dict[AgentId, float] = {}
+        self._scored_at: dict[AgentId, datetime] = {}
+        self._unacked: dict[str, set[AgentId]] = {}
+
+    def run(self, should_continue: Callable[[], bool]) -> int:
+        refreshed = 0
+        last_event = time.monotonic()
+
+        while should_continue():
+            messages = self._event_stream.read(count=self._batch_size, block_ms=self._block_ms)
+            now = time.monotonic()
+            if messages:
+                last_event = now
+            for message_id, event in messages:
+                self._unacked[message_id] = set(event.agent_ids)
+                for agent_id in event.agent_ids:
+                    self._first_seen.setdefault(agent_id, now)
+                    scored_at = self._scored_at.get(agent_id, event.occurred_at)
+                    self._scored_at[agent_id] = min(scored_at, event.occurred_at)
+
+            # Each agent waits out its window so a burst of events costs one rebuild
+            due = [a for a, seen in self._first_seen.items() if now - seen >= self._coalesce]
+            if due:
+                refreshed += self._flush(due)
+            elif (
+                not self._first_seen
+                and self._idle_exit is not None
+                and now - last_event >= self._idle_exit
+            ):
+                break
+
+        if self._first_seen:
+            refreshed += self._flush(list(self._first_seen))
+        self._ack_completed()
+        return refreshed
+
+    def _flush(self, agent_ids: list[AgentId]) -> int:
+        refreshed = self._card_refresh.refresh_agents(agent_ids, self._remaining_time_ms)
+        written_at = datetime.now(UTC)
+        if self._refresh_flags is not None:
+            # The same events flagged these agents; the scheduled drain needn't rebuild them
+            try:
+                self._refresh_flags.unflag_agents(agent_ids)
+            except Exception:
+                logger.warning("card_stream_unflag_failed", agents=len(agent_ids), exc_info=True)
+
+        latencies = sorted(
+            (written_at - self._scored_at.pop(a)).total_seconds() * 1000 for a in agent_ids
+        )
+        for agent_id in agent_ids:
+            del self._first_seen[agent_id]
+        done = set(agent_ids)
+        for agents in self._unacked.values():
+            agents -= done
+        self._ack_completed()
+
+        logger.info(
+            "card_stream_flush",
+            agents=len(agent_ids),
+            refreshed=refreshed,
+            scored_to_card_ms_p50=round(statistics.median(latencies)),
+            scored_to_card_ms_max=round(latencies[-1]),
+        )
+        return refreshed
+
+    def _ack_completed(self) -> None:
+        done = [message_id for message_id, agents in self._unacked.items() if not agents]
+        self._event_stream.ack(done)
+        for message_id in done:
+            del self._unacked[message_id]
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import cache
+
+import structlog
+
+from rise_scout.application.card_refresh import CardRefreshService
+from rise_scout.domain.cards.models import Card
+from rise_scout.domain.cards.repository import CardRepository
+from rise_scout.domain.shared.services import LockService
+from rise_scout.domain.shared.types import AgentId
+
+logger = structlog.get_logger()
+
+
+class CardService:
+    def __init__(
+        self,
+        card_repo: CardRepository,
+        card_refresh: CardRefreshService,
+        lock: LockService,
+        executor: Executor | None = None,
+        lock_ttl_ms: int = 30_000,
+        wait_timeout_ms: int = 10_000,
+        poll_interval_ms: int = 100,
+    ) -> None:
+        self._card_repo = card_repo
+        self._card_refresh = card_refresh
+        self._lock = lock
+        self._executor = executor or _background_builds()
+        self._lock_ttl_ms = lock_ttl_ms
+        self._wait_timeout = wait_timeout_ms / 1000
+        self._poll_interval = poll_interval_ms / 1000
+
+    def get_or_build(self, agent_id: AgentId) -> Card | None:
+        card = self._card_repo.get(agent_id)
+        if card is not None and not card.is_expired():
+            return card
+
+        if card is not None:
+            # Serve the stale card now; one caller refreshes it behind the scenes
+            token = self._lock.acquire(_lock_name(agent_id), self._lock_ttl_ms)
+            if token is not None:
+                self._executor.submit(self._build, agent_id, token, time.monotonic())
+            return card
+
+        token = self._lock.acquire(_lock_name(agent_id), self._lock_ttl_ms)
+        if token is not None:
+            return self._build(agent_id, token, time.monotonic())
+        return self._wait_for_build(agent_id)
+
+    def _build(self, agent_id: AgentId, token: str, locked_at: float) -> Card | None:
+        # The build is budgeted against the lock's lifetime, less the refresh service's
+        # margin, so insights that run long are cut off before waiters start their own build
+        def remaining_ms() -> int:
+            return self._lock_ttl_ms - int((time.monotonic() - locked_at) * 1000)
+
+        try:
+            card = self._card_refresh.build_card(agent_id, remaining_ms)
+            logger.info("card_built_on_read", agent_id=str(agent_id), found=card is not None)
+            return card
+        except Exception:
+            logger.exception("card_build_failed", agent_id=str(agent_id))
+            return None
+        finally:
+            self._lock.release(_lock_name(agent_id), token)
+
+    def _wait_for_build(self, agent_id: AgentId) -> Card | None:
+        deadline = time.monotonic() + self._wait_timeout
+        while self._lock.is_locked(_lock_name(agent_id)) and time.monotonic() < deadline:
+            time.sleep(self._poll_interval)
+        return self._card_repo.get(agent_id)
+
+
+@cache
+def _background_builds() -> ThreadPoolExecutor:
+    # Shared by every CardService in the process rather than a pool per instance
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="card_build")
+
+
+def _lock_name(agent_id: AgentId) -> str:
+    return f"card_build:{agent_id}"
@@ -1,15 +1,26 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 import structlog
 
-from rise_scout.application.event_handlers import dispatch_contact_events
+from rise_scout.application.event_handlers import (
+    dispatch_contact_events,
+    dispatch_contact_events_async,
+)
+from rise_scout.domain.contact.models import Contact
 from rise_scout.domain.contact.parsers import ContactChangeParser, InteractionParser
-from rise_scout.domain.contact.repository import ContactRepository
-from rise_scout.domain.embeddings.service import EmbeddingService
+from rise_scout.domain.contact.repository import AsyncContactRepository, ContactRepository
+from rise_scout.domain.embeddings.service import AsyncEmbeddingService, EmbeddingService
+from rise_scout.domain.embeddings.vector import Float32Array, to_float32
 from rise_scout.domain.scoring.engine import ScoringEngine
-from rise_scout.domain.shared.services import RefreshFlagService
+from rise_scout.domain.shared.services import (
+    AsyncContactEventStream,
+    AsyncRefreshFlagService,
+    ContactEventStream,
+    RefreshFlagService,
+)
 
 logger = structlog.get_logger()
 
@@ -23,6 +34,7 @@ class ContactIngestionService:
         refresh_flags: RefreshFlagService,
         contact_parser: ContactChangeParser,
         interaction_parser: InteractionParser,
+        event_stream: ContactEventStream | None = None,
     ) -> None:
         self._contact_repo = contact_repo
         self._scoring_engine = scoring_engine
@@ -30,6 +42,7 @@ class ContactIngestionService:
         self._refresh_flags = refresh_flags
         self._contact_parser = contact_parser
         self._interaction_parser = interaction_parser
+        self._event_stream = event_stream
 
     def handle_contact_change(self, payload: dict[str, Any]) -> None:
         contact, is_new = self._contact_parser.parse(payload)
@@ -39,15 +52,18 @@ class ContactIngestionService:
             if existing:
                 contact.score = existing.score
                 contact.score_reasons = existing.score_reasons
+                # A contact decayed earlier in today's run must not become eligible again
+                contact.decay_run_id = existing.decay_run_id
 
         self._scoring_engine.compute_profile_signals(contact)
 
         text = contact.to_embedding_text()
         if text.strip():
-            contact.embedding_vector = self._embedding_service.embed(text)
+            # Assignment isn't validated; this packs anything that isn't float32 already
+            contact.embedding_vector = to_float32(self._embedding_service.embed(text))
 
         self._contact_repo.save(contact)
-        dispatch_contact_events([contact], self._refresh_flags)
+        dispatch_contact_events([contact], self._refresh_flags, self._event_stream)
 
         logger.info(
             "contact_ingested",
@@ -66,7 +82,7 @@ class ContactIngestionService:
 
         self._scoring_engine.process_signal(contact, signal, detail)
         self._contact_repo.save(contact)
-        dispatch_contact_events([contact], self._refresh_flags)
+        dispatch_contact_events([contact], self._refresh_flags, self._event_stream)
 
         logger.info(
             "interaction_processed",
@@ -74,3 +90,78 @@ class ContactIngestionService:
             signal=signal.value,
             score=contact.score,
         )
+
+
+class AsyncContactIngestionService:
+    def __init__(
+        self,
+        contact_repo: AsyncContactRepository,
+        scoring_engine: ScoringEngine,
+        embedding_service: AsyncEmbeddingService,
+        refresh_flags: AsyncRefreshFlagService,
+        contact_parser: ContactChangeParser,
+        interaction_parser: InteractionParser,
+        event_stream: AsyncContactEventStream | None = None,
+    ) -> None:
+        self._contact_repo = contact_repo
+        self._scoring_engine = scoring_engine
+        self._embedding_service = embedding_service
+        self._refresh_flags = refresh_flags
+        self._contact_parser = contact_parser
+        self._interaction_parser = interaction_parser
+        self._event_stream = event_stream
+
+    async def handle_contact_change(self, payload: dict[str, Any]) -> None:
+        contact, is_new = self._contact_parser.parse(payload)
+
+        # The embedding only depends on the payload, so it runs alongside the lookup
+        existing, embedding = await asyncio.gather(
+            self._existing(contact, is_new), self._embed(contact.to_embedding_text())
+        )
+        if existing:
+            contact.score = existing.score
+            contact.score_reasons = existing.score_reasons
+            contact.decay_run_id = existing.decay_run_id
+
+        self._scoring_engine.compute_profile_signals(contact)
+        if embedding is not None:
+            contact.embedding_vector = to_float32(embedding)
+
+        await self._contact_repo.save(contact)
+        await dispatch_contact_events_async([contact], self._refresh_flags, self._event_stream)
+
+        logger.info(
+            "contact_ingested",
+            contact_id=str(contact.contact_id),
+            is_new=is_new,
+            score=contact.score,
+        )
+
+    async def handle_interaction(self, payload: dict[str, Any]) -> None:
+        contact_id, signal, detail = self._interaction_parser.parse(payload)
+
+        contact = await self._contact_repo.get(contact_id)
+        if contact is None:
+            logger.warning("interaction_contact_not_found", contact_id=str(contact_id))
+            return
+
+        self._scoring_engine.process_signal(contact, signal, detail)
+        await self._contact_repo.save(contact)
+        await dispatch_contact_events_async([contact], self._refresh_flags, self._event_stream)
+
+        logger.info(
+            "interaction_processed",
+            contact_id=str(contact_id),
+            signal=signal.value,
+            score=contact.score,
+        )
+
+    async def _existing(self, contact: Contact, is_new: bool) -> Contact | None:
+        if is_new:
+            return None
+        return await self._contact_repo.get(contact.contact_id)
+
+    async def _embed(self, text: str) -> Float32Array | None:
+        if not text.strip():
+            return None
+        return await self._embedding_service.embed(text)
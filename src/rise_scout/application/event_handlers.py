@@ -1,21 +1,58 @@
 from __future__ import annotations
 
-from typing import Iterable
+import asyncio
+from collections import defaultdict
+from collections.abc import Awaitable, Iterable
 
 from rise_scout.domain.contact.models import Contact
+from rise_scout.domain.scoring.priority import refresh_priority
 from rise_scout.domain.shared.events import ContactScored
-from rise_scout.domain.shared.services import RefreshFlagService
-from rise_scout.domain.shared.types import AgentId
+from rise_scout.domain.shared.services import (
+    AsyncContactEventStream,
+    AsyncRefreshFlagService,
+    ContactEventStream,
+    RefreshFlagService,
+)
+from rise_scout.domain.shared.types import AgentId, ContactId
 
 
 def dispatch_contact_events(
     contacts: Iterable[Contact],
     refresh_flags: RefreshFlagService,
+    event_stream: ContactEventStream | None = None,
 ) -> None:
-    agent_ids: set[AgentId] = set()
+    priorities, scored = _collect_scored(contacts)
+    if priorities:
+        refresh_flags.flag_agents(priorities)
+    if event_stream is not None and scored:
+        event_stream.publish(scored)
+
+
+async def dispatch_contact_events_async(
+    contacts: Iterable[Contact],
+    refresh_flags: AsyncRefreshFlagService,
+    event_stream: AsyncContactEventStream | None = None,
+) -> None:
+    priorities, scored = _collect_scored(contacts)
+    pending: list[Awaitable[None]] = []
+    if priorities:
+        pending.append(refresh_flags.flag_agents(priorities))
+    if event_stream is not None and scored:
+        pending.append(event_stream.publish(scored))
+    await asyncio.gather(*pending)
+
+
+def _collect_scored(
+    contacts: Iterable[Contact],
+) -> tuple[dict[AgentId, float], list[ContactScored]]:
+    priorities: dict[AgentId, float] = defaultdict(float)
+    # The first event per contact carries the earliest scoring time for latency tracking
+    scored: dict[ContactId, ContactScored] = {}
     for contact in contacts:
         for event in contact.collect_events():
             if isinstance(event, ContactScored):
-                agent_ids.update(event.agent_ids)
-    if agent_ids:
-        refresh_flags.flag_agents(list(agent_ids))
+                priority = refresh_priority(event)
+                for agent_id in event.agent_ids:
+                    priorities[agent_id] += priority
+                scored.setdefault(event.contact_id, event)
+    return dict(priorities), list(scored.values())
@@ -4,13 +4,27 @@ from typing import Any
 
 import structlog
 
-from rise_scout.application.event_handlers import dispatch_contact_events
-from rise_scout.domain.contact.repository import ContactRepository
+from rise_scout.application.event_handlers import (
+    dispatch_contact_events,
+    dispatch_contact_events_async,
+)
+from rise_scout.domain.contact.models import Contact
+from rise_scout.domain.contact.repository import (
+    AsyncContactRepository,
+    BulkWriteResult,
+    ContactRepository,
+)
 from rise_scout.domain.scoring.engine import ScoringEngine
-from rise_scout.domain.scoring.signals import LISTING_EVENT_SIGNAL_MAP
+from rise_scout.domain.scoring.signals import LISTING_EVENT_SIGNAL_MAP, SignalType
+from rise_scout.domain.search.models import MatchedContact
 from rise_scout.domain.search.parsers import ListingParser
-from rise_scout.domain.search.repository import SearchRepository
-from rise_scout.domain.shared.services import RefreshFlagService
+from rise_scout.domain.search.repository import AsyncSearchRepository, SearchRepository
+from rise_scout.domain.shared.services import (
+    AsyncContactEventStream,
+    AsyncRefreshFlagService,
+    ContactEventStream,
+    RefreshFlagService,
+)
 
 logger = structlog.get_logger()
 
@@ -23,12 +37,14 @@ class ListingMatchingService:
         scoring_engine: ScoringEngine,
         refresh_flags: RefreshFlagService,
         listing_parser: ListingParser,
+        event_stream: ContactEventStream | None = None,
     ) -> None:
         self._contact_repo = contact_repo
         self._search_repo = search_repo
         self._scoring_engine = scoring_engine
         self._refresh_flags = refresh_flags
         self._listing_parser = listing_parser
+        self._event_stream = event_stream
 
     def handle_listing_event(self, payload: dict[str, Any]) -> None:
         event = self._listing_parser.parse(payload)
@@ -38,25 +54,58 @@ class ListingMatchingService:
             logger.info("no_matches", listing_id=str(event.listing_id))
             return
 
-        contact_ids = [m.contact_id for m in matched]
-        contacts = self._contact_repo.bulk_get(contact_ids)
-        contacts_by_id = {c.contact_id: c for c in contacts}
-
         signal = LISTING_EVENT_SIGNAL_MAP.get(event.event_type)
         if signal is None:
             logger.warning("unmapped_event_type", event_type=event.event_type)
             return
 
-        for match in matched:
-            contact = contacts_by_id.get(match.contact_id)
-            if contact is None:
-                continue
-            detail = "; ".join(match.match_reasons)
-            self._scoring_engine.process_signal(contact, signal, detail)
+        contacts = self._contact_repo.bulk_get([m.contact_id for m in matched])
+        modified = _score_matches(self._scoring_engine, signal, matched, contacts)
+        written = _written(modified, self._contact_repo.bulk_save(modified))
+        dispatch_contact_events(written, self._refresh_flags, self._event_stream)
 
-        modified = [contacts_by_id[m.contact_id] for m in matched if m.contact_id in contacts_by_id]
-        self._contact_repo.bulk_save(modified)
-        dispatch_contact_events(modified, self._refresh_flags)
+        logger.info(
+            "listing_matching_complete",
+            listing_id=str(event.listing_id),
+            matched=len(matched),
+            scored=len(modified),
+        )
+
+
+class AsyncListingMatchingService:
+    def __init__(
+        self,
+        contact_repo: AsyncContactRepository,
+        search_repo: AsyncSearchRepository,
+        scoring_engine: ScoringEngine,
+        refresh_flags: AsyncRefreshFlagService,
+        listing_parser: ListingParser,
+        event_stream: AsyncContactEventStream | None = None,
+    ) -> None:
+        self._contact_repo = contact_repo
+        self._search_repo = search_repo
+        self._scoring_engine = scoring_engine
+        self._refresh_flags = refresh_flags
+        self._listing_parser = listing_parser
+        self._event_stream = event_stream
+
+    async def handle_listing_event(self, payload: dict[str, Any]) -> None:
+        event = self._listing_parser.parse(payload)
+        matched = await self._search_repo.find_matching_contacts(event)
+
+        if not matched:
+            logger.info("no_matches", listing_id=str(event.listing_id))
+            return
+
+        signal = LISTING_EVENT_SIGNAL_MAP.get(event.event_type)
+        if signal is None:
+            logger.warning("unmapped_event_type", event_type=event.event_type)
+            return
+
+        contacts = await self._contact_repo.bulk_get([m.contact_id for m in matched])
+        modified = _score_matches(self._scoring_engine, signal, matched, contacts)
+        written = _written(modified, await self._contact_repo.bulk_save(modified))
+        await dispatch_contact_events_async(written, self._refresh_flags, self._event_stream)
 
         logger.info(
             "listing_matching_complete",
@@ -64,3 +113,28 @@ class ListingMatchingService:
             matched=len(matched),
             scored=len(modified),
         )
+
+
+def _score_matches(
+    scoring_engine: ScoringEngine,
+    signal: SignalType,
+    matched: list[MatchedContact],
+    contacts: list[Contact],
+) -> list[Contact]:
+    contacts_by_id = {c.contact_id: c for c in contacts}
+    modified: list[Contact] = []
+    for match in matched:
+        contact = contacts_by_id.get(match.contact_id)
+        if contact is None:
+            continue
+        scoring_engine.process_signal(contact, signal, "; ".join(match.match_reasons))
+        modified.append(contact)
+    return modified
+
+
+def _written(contacts: list[Contact], result: BulkWriteResult) -> list[Contact]:
+    # Unsaved contacts get no events; their agents' cards would show scores that don't exist
+    if result.ok:
+        return contacts
+    logger.error("listing_contacts_not_saved", failed=result.failed)
+    return [c for c in contacts if c.contact_id not in result.failed]
@@ -1,9 +1,24 @@
 from __future__ import annotations
 
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from datetime import UTC, datetime
+from functools import partial
+
 import structlog
 
 from rise_scout.domain.contact.repository import ContactRepository
+from rise_scout.domain.scoring.checkpoint import (
+    DecayCheckpoint,
+    DecayCheckpointRepository,
+    DecaySliceDispatcher,
+    checkpoint_key,
+    daily_run_id,
+)
 from rise_scout.domain.scoring.decay import DecayCalculator
+from rise_scout.domain.shared.exceptions import LeaseLostError
+from rise_scout.domain.shared.services import Lease, LeaseService
 
 logger = structlog.get_logger()
 
@@ -13,21 +28,228 @@ class ScoreDecayService:
         self,
         contact_repo: ContactRepository,
         decay_calculator: DecayCalculator,
+        checkpoints: DecayCheckpointRepository,
+        page_size: int = 500,
+        time_margin_ms: int = 30_000,
+        leases: LeaseService | None = None,
+        lease_ttl_ms: int = 60_000,
+        max_catch_up_passes: int = 3,
     ) -> None:
         self._contact_repo = contact_repo
         self._decay_calculator = decay_calculator
+        self._checkpoints = checkpoints
+        self._page_size = page_size
+        self._time_margin_ms = time_margin_ms
+        self._leases = leases
+        self._lease_ttl_ms = lease_ttl_ms
+        self._max_catch_up_passes = max_catch_up_passes
+
+    def run_decay(
+        self,
+        run_id: str | None = None,
+        remaining_time_ms: Callable[[], int] | None = None,
+        slice_id: int = 0,
+        slice_count: int = 1,
+    ) -> DecayCheckpoint:
+        run_id = run_id or daily_run_id()
+        if self._leases is None:
+            return self._run_decay(run_id, remaining_time_ms, slice_id, slice_count, None)
+
+        key = checkpoint_key(run_id, slice_id, slice_count)
+        lease = self._leases.acquire(f"score_decay:{key}", self._lease_ttl_ms)
+        if lease is None:
+            logger.info("decay_already_running", key=key)
+            return self._load_checkpoint(run_id, slice_id, slice_count)
+        try:
+            return self._run_decay(run_id, remaining_time_ms, slice_id, slice_count, lease)
+        except LeaseLostError:
+            logger.warning("decay_fenced_out", key=key, fence=lease.fence)
+            return self._load_checkpoint(run_id, slice_id, slice_count)
+        finally:
+            lease.release()
+
+    def _load_checkpoint(self, run_id: str, slice_id: int, slice_count: int) -> DecayCheckpoint:
+        return self._checkpoints.load(run_id, slice_id, slice_count) or DecayCheckpoint(
+            run_id=run_id, slice_id=slice_id, slice_count=slice_count
+        )
+
+    def _run_decay(
+        self,
+        run_id: str,
+        remaining_time_ms: Callable[[], int] | None,
+        slice_id: int,
+        slice_count: int,
+        lease: Lease | None,
+    ) -> DecayCheckpoint:
+        checkpoint = self._load_checkpoint(run_id, slice_id, slice_count)
+        if checkpoint.completed:
+            logger.info("decay_already_complete", key=checkpoint.key, decayed=checkpoint.decayed)
+            return checkpoint
+
+        checkpoint.invocations += 1
+        if lease is not None:
+            checkpoint.fence = lease.fence
+        if checkpoint.search_after is not None:
+            logger.info("decay_resuming", key=checkpoint.key, scanned=checkpoint.scanned)
+
+        cutoff = self._decay_calculator.reason_cutoff()
+        batches = self._contact_repo.iter_decay_batches(
+            run_id,
+            cutoff,
+            self._page_size,
+            checkpoint.search_after,
+            slice_id,
+            slice_count,
+        )
+        for batch, cursor in batches:
+            if lease is not None and lease.lost:
+                logger.warning("decay_lease_lost", key=checkpoint.key, scanned=checkpoint.scanned)
+                return checkpoint
+
+            result = self._decay_calculator.decay_columns(batch, cutoff)
+            written = self._contact_repo.save_decay_batch(batch, result, run_id)
+
+            checkpoint.search_after = cursor
+            if checkpoint.catch_up_passes == 0:
+                checkpoint.scanned += len(batch)
+            checkpoint.decayed += len(written.succeeded)
+            checkpoint.failed += len(written.failed)
+            checkpoint.updated_at = datetime.now(UTC)
+            self._checkpoints.save(checkpoint)
+
+            if remaining_time_ms is not None and remaining_time_ms() < self._time_margin_ms:
+                logger.info(
+                    "decay_paused",
+                    key=checkpoint.key,
+                    scanned=checkpoint.scanned,
+                    decayed=checkpoint.decayed,
+                )
+                return checkpoint
+
+        if checkpoint.failed and checkpoint.catch_up_passes < self._max_catch_up_passes:
+            # Failed contacts kept their old decay_run_id. The catch-up scan from the start
+            # is left to the next scheduled invocation, by which time the index has refreshed
+            # and this run's stamps filter out everything it already wrote.
+            logger.warning(
+                "decay_catch_up_deferred",
+                key=checkpoint.key,
+                failed=checkpoint.failed,
+                passes=checkpoint.catch_up_passes,
+            )
+            checkpoint.catch_up_passes += 1
+            checkpoint.failed = 0
+            checkpoint.search_after = None
+            checkpoint.updated_at = datetime.now(UTC)
+            self._checkpoints.save(checkpoint)
+            return checkpoint
+
+        if checkpoint.failed:
+            logger.error("decay_contacts_not_saved", key=checkpoint.key, failed=checkpoint.failed)
+        checkpoint.completed = True
+        checkpoint.updated_at = datetime.now(UTC)
+        self._checkpoints.save(checkpoint)
+
+        logger.info(
+            "decay_complete",
+            key=checkpoint.key,
+            total=checkpoint.scanned,
+            decayed=checkpoint.decayed,
+            unchanged=checkpoint.scanned - checkpoint.decayed,
+            invocations=checkpoint.invocations,
+        )
+        return checkpoint
+
+    def pending_slices(self, run_id: str, slice_count: int) -> list[int]:
+        pending = []
+        for slice_id in range(slice_count):
+            checkpoint = self._checkpoints.load(run_id, slice_id, slice_count)
+            if checkpoint is None or not checkpoint.completed:
+                pending.append(slice_id)
+        return pending
+
+    def dispatch_slices(
+        self,
+        dispatcher: DecaySliceDispatcher,
+        slice_count: int,
+        run_id: str | None = None,
+    ) -> list[int]:
+        run_id = run_id or daily_run_id()
+        pending = self.pending_slices(run_id, slice_count)
+        for slice_id in pending:
+            dispatcher.dispatch(run_id, slice_id, slice_count)
+
+        logger.info(
+            "decay_slices_dispatched",
+            run_id=run_id,
+            slice_count=slice_count,
+            dispatched=len(pending),
+        )
+        return pending
+
+    def summarize(self, run_id: str, slice_count: int) -> DecayCheckpoint:
+        checkpoints = [
+            self._checkpoints.load(run_id, slice_id, slice_count) for slice_id in range(slice_count)
+        ]
+        return aggregate_checkpoints(
+            run_id,
+            [c or DecayCheckpoint(run_id=run_id, slice_count=slice_count) for c in checkpoints],
+        )
+
+
+def aggregate_checkpoints(run_id: str, checkpoints: list[DecayCheckpoint]) -> DecayCheckpoint:
+    return DecayCheckpoint(
+        run_id=run_id,
+        slice_count=len(checkpoints),
+        scanned=sum(c.scanned for c in checkpoints),
+        decayed=sum(c.decayed for c in checkpoints),
+        invocations=max((c.invocations for c in checkpoints), default=0),
+        completed=all(c.completed for c in checkpoints),
+    )
+
+
+def _ms_until(deadline: float) -> int:
+    return int((deadline - time.time()) * 1000)
+
+
+def _run_slice(
+    build_service: Callable[[], ScoreDecayService],
+    run_id: str,
+    slice_id: int,
+    slice_count: int,
+    deadline: float | None,
+) -> DecayCheckpoint:
+    remaining_time_ms: Callable[[], int] | None = None
+    if deadline is not None:
+        remaining_time_ms = partial(_ms_until, deadline)
 
-    def run_decay(self) -> int:
-        contacts = self._contact_repo.paginate_all()
-        decayed = []
+    service = build_service()
+    return service.run_decay(run_id, remaining_time_ms, slice_id, slice_count)
 
-        for contact in contacts:
-            if contact.score <= 0.0:
-                continue
-            self._decay_calculator.apply(contact)
-            decayed.append(contact)
 
-        self._contact_repo.bulk_save_batched(decayed)
+def run_parallel_decay(
+    build_service: Callable[[], ScoreDecayService],
+    slice_count: int,
+    run_id: str | None = None,
+    max_workers: int | None = None,
+    deadline: float | None = None,
+) -> DecayCheckpoint:
+    # build_service runs inside each worker process, so it must be a picklable
+    # module-level callable that creates its own clients.
+    run_id = run_id or daily_run_id()
+    with ProcessPoolExecutor(max_workers=max_workers or slice_count) as pool:
+        futures = [
+            pool.submit(_run_slice, build_service, run_id, slice_id, slice_count, deadline)
+            for slice_id in range(slice_count)
+        ]
+        checkpoints = [f.result() for f in futures]
 
-        logger.info("decay_complete", total=len(contacts), decayed=len(decayed))
-        return len(decayed)
+    summary = aggregate_checkpoints(run_id, checkpoints)
+    logger.info(
+        "parallel_decay_complete",
+        run_id=run_id,
+        slice_count=slice_count,
+        scanned=summary.scanned,
+        decayed=summary.decayed,
+        completed=summary.completed,
+    )
+    return summary
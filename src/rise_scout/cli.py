@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+import structlog
+
+from rise_scout.application.card_refresh import CardRefreshService
+from rise_scout.application.card_refresh_worker import CardRefreshWorker
+from rise_scout.infrastructure.container import Container
+
+logger = structlog.get_logger()
+
+
+def rebuild_leaderboards(args: argparse.Namespace) -> None:
+    container = Container()
+    rebuilt = container.contact_repo.rebuild_leaderboard(page_size=args.page_size)
+    logger.info("rebuild_leaderboards_complete", contacts=rebuilt)
+
+
+def create_contacts_index(args: argparse.Namespace) -> None:
+    container = Container()
+    container.contact_repo.create_index()
+
+
+def card_worker(args: argparse.Namespace) -> None:
+    container = Container()
+    service = CardRefreshService(
+        contact_repo=container.contact_repo,
+        card_repo=container.card_repo,
+        llm_service=container.llm_service,
+        refresh_flags=container.refresh_flags,
+        max_workers=container.settings.llm_max_concurrency,
+        chunk_size=container.settings.card_refresh_chunk_size,
+        insight_cache=container.insight_cache,
+        llm_model_id=container.settings.llm_model_id,
+    )
+    worker = CardRefreshWorker(
+        service,
+        container.contact_events,
+        coalesce_ms=args.coalesce_ms,
+        refresh_flags=container.refresh_flags,
+    )
+    stop_at = None if args.seconds is None else time.monotonic() + args.seconds
+    try:
+        refreshed = worker.run(lambda: stop_at is None or time.monotonic() < stop_at)
+    except KeyboardInterrupt:
+        return
+    logger.info("card_worker_stopped", refreshed=refreshed)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="rise-scout")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rebuild = commands.add_parser(
+        "rebuild-leaderboards", help="Reconstruct per-agent top contacts in Redis from OpenSearch"
+    )
+    rebuild.add_argument("--page-size", type=int, default=1000)
+    rebuild.set_defaults(func=rebuild_leaderboards)
+
+    create = commands.add_parser(
+        "create-contacts-index",
+        help="Create the contacts index with the configured embedding size and quantization",
+    )
+    create.set_defaults(func=create_contacts_index)
+
+    worker = commands.add_parser(
+        "card-worker", help="Consume ContactScored events and rebuild cards as they arrive"
+    )
+    worker.add_argument("--seconds", type=float, default=None, help="Stop after this long")
+    worker.add_argument("--coalesce-ms", type=int, default=2_000)
+    worker.set_defaults(func=card_worker)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
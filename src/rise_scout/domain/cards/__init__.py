@@ -1,5 +1,16 @@
-from rise_scout.domain.cards.llm_service import LLMEnrichmentService
+from rise_scout.domain.cards.insight_cache import AsyncInsightCache, CachedInsight, InsightCache
+from rise_scout.domain.cards.llm_service import AsyncLLMEnrichmentService, LLMEnrichmentService
 from rise_scout.domain.cards.models import Card, CardContact
-from rise_scout.domain.cards.repository import CardRepository
+from rise_scout.domain.cards.repository import AsyncCardRepository, CardRepository
 
-__all__ = ["Card", "CardContact", "CardRepository", "LLMEnrichmentService"]
+__all__ = [
+    "AsyncCardRepository",
+    "AsyncInsightCache",
+    "AsyncLLMEnrichmentService",
+    "CachedInsight",
+    "Card",
+    "CardContact",
+    "CardRepository",
+    "InsightCache",
+    "LLMEnrichmentService",
+]
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Protocol
+
+from pydantic import BaseModel
+
+from rise_scout.domain.contact.models import Contact
+
+SCORE_BUCKET_SIZE = 10.0
+INSIGHT_REASONS = 5
+# Rough size of the fixed prompt framing, in characters
+PROMPT_OVERHEAD_CHARS = 200
+# Bump when the insight prompt or tool schema changes, so older insights stop matching
+INSIGHT_PROMPT_VERSION = 2
+
+
+class CachedInsight(BaseModel):
+    model_config = {"frozen": True}
+
+    insight: str
+    tokens: int = 0
+
+
+class InsightCache(Protocol):
+    def get_many(self, keys: list[str]) -> dict[str, CachedInsight]: ...
+
+    def set_many(self, entries: dict[str, CachedInsight]) -> None: ...
+
+
+class AsyncInsightCache(Protocol):
+    async def get_many(self, keys: list[str]) -> dict[str, CachedInsight]: ...
+
+    async def set_many(self, entries: dict[str, CachedInsight]) -> None: ...
+
+
+def insight_cache_key(contact: Contact, model_id: str) -> str:
+    inputs = [
+        INSIGHT_PROMPT_VERSION,
+        model_id,
+        str(contact.contact_id),
+        contact.display_name,
+        int(contact.score // SCORE_BUCKET_SIZE),
+        [[r.signal, r.detail, r.points] for r in contact.score_reasons[:INSIGHT_REASONS]],
+    ]
+    return hashlib.sha256(json.dumps(inputs).encode()).hexdigest()
+
+
+def estimate_tokens(contact: Contact, insight: str) -> int:
+    # ~4 characters per token; good enough to report savings, not to bill
+    reasons = sum(
+        len(r.signal) + len(r.detail) + 10 for r in contact.score_reasons[:INSIGHT_REASONS]
+    )
+    chars = PROMPT_OVERHEAD_CHARS + len(contact.display_name) + reasons + len(insight)
+    return chars // 4
@@ -3,7 +3,16 @@ from __future__ import annotations
 from typing import Protocol
 
 from rise_scout.domain.contact.models import Contact
+from rise_scout.domain.shared.types import ContactId
 
 
 class LLMEnrichmentService(Protocol):
     def generate_insight(self, contact: Contact) -> str: ...
+
+    def generate_insights(self, contacts: list[Contact]) -> dict[ContactId, str]: ...
+
+
+class AsyncLLMEnrichmentService(Protocol):
+    async def generate_insight(self, contact: Contact) -> str: ...
+
+    async def generate_insights(self, contacts: list[Contact]) -> dict[ContactId, str]: ...
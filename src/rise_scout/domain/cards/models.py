@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
 from pydantic import BaseModel, Field
 
@@ -22,3 +22,10 @@ class Card(BaseModel):
     contacts: list[CardContact] = Field(default_factory=list)
     generated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
     ttl: int = 900  # 15 minutes in seconds
+
+    @property
+    def expires_at(self) -> datetime:
+        return self.generated_at + timedelta(seconds=self.ttl)
+
+    def is_expired(self, now: datetime | None = None) -> bool:
+        return (now or datetime.now(UTC)) >= self.expires_at
@@ -10,3 +10,13 @@ class CardRepository(Protocol):
     def get(self, agent_id: AgentId) -> Card | None: ...
 
     def save(self, card: Card) -> None: ...
+
+    def save_many(self, cards: list[Card]) -> int: ...
+
+
+class AsyncCardRepository(Protocol):
+    async def get(self, agent_id: AgentId) -> Card | None: ...
+
+    async def save(self, card: Card) -> None: ...
+
+    async def save_many(self, cards: list[Card]) -> int: ...
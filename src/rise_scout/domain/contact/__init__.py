@@ -1,8 +1,14 @@
 from rise_scout.domain.contact.models import Contact, Preferences, ScoreReason
 from rise_scout.domain.contact.parsers import ContactChangeParser, InteractionParser
-from rise_scout.domain.contact.repository import ContactRepository
+from rise_scout.domain.contact.repository import (
+    AsyncContactRepository,
+    BulkWriteResult,
+    ContactRepository,
+)
 
 __all__ = [
+    "AsyncContactRepository",
+    "BulkWriteResult",
     "Contact",
     "ContactChangeParser",
     "ContactRepository",
@@ -5,6 +5,7 @@ from enum import StrEnum
 
 from pydantic import BaseModel, Field, PrivateAttr
 
+from rise_scout.domain.embeddings.vector import EmbeddingVector
 from rise_scout.domain.shared.events import ContactScored, DomainEvent
 from rise_scout.domain.shared.types import AgentId, ContactId, ListingId, MlsId
 
@@ -69,7 +70,8 @@ class Contact(BaseModel):
 
     score: float = 0.0
     score_reasons: list[ScoreReason] = Field(default_factory=list)
-    embedding_vector: list[float] | None = None
+    embedding_vector: EmbeddingVector | None = None
+    decay_run_id: str | None = None
 
     last_interaction_at: datetime | None = None
     updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
@@ -102,6 +104,8 @@ class Contact(BaseModel):
             ContactScored(
                 contact_id=self.contact_id,
                 agent_ids=list(self.user_ids),
+                delta=delta,
+                category=reason.category,
             )
         )
 
@@ -1,10 +1,27 @@
 from __future__ import annotations
 
-from typing import Protocol
+from collections.abc import Iterator
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Protocol
+
+from pydantic import BaseModel
 
 from rise_scout.domain.contact.models import Contact
 from rise_scout.domain.shared.types import AgentId, ContactId
 
+if TYPE_CHECKING:
+    from rise_scout.domain.scoring.columnar import DecayBatch, DecayKernelResult
+
+
+class BulkWriteResult(BaseModel):
+    succeeded: list[ContactId] = []
+    # Contact id -> reason, for writes that were rejected or ran out of retries
+    failed: dict[ContactId, str] = {}
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
 
 class ContactRepository(Protocol):
     def get(self, contact_id: ContactId) -> Contact | None: ...
@@ -13,12 +30,50 @@ class ContactRepository(Protocol):
 
     def bulk_get(self, contact_ids: list[ContactId]) -> list[Contact]: ...
 
-    def bulk_save(self, contacts: list[Contact]) -> None: ...
+    def bulk_save(self, contacts: list[Contact]) -> BulkWriteResult: ...
 
-    def bulk_save_batched(self, contacts: list[Contact], batch_size: int = 100) -> None: ...
+    def bulk_save_batched(
+        self, contacts: list[Contact], batch_size: int = 100
+    ) -> BulkWriteResult: ...
 
     def get_top_by_agents(
         self, agent_ids: list[AgentId], limit: int = 5
     ) -> dict[AgentId, list[Contact]]: ...
 
     def paginate_all(self, page_size: int = 500) -> list[Contact]: ...
+
+    def iter_pages(
+        self,
+        page_size: int = 500,
+        search_after: list[Any] | None = None,
+        slice_id: int = 0,
+        slice_count: int = 1,
+    ) -> Iterator[tuple[list[Contact], list[Any]]]: ...
+
+    def iter_decay_batches(
+        self,
+        run_id: str,
+        reasons_before: datetime,
+        page_size: int = 500,
+        search_after: list[Any] | None = None,
+        slice_id: int = 0,
+        slice_count: int = 1,
+    ) -> Iterator[tuple[DecayBatch, list[Any]]]: ...
+
+    def save_decay_batch(
+        self, batch: DecayBatch, result: DecayKernelResult, run_id: str
+    ) -> BulkWriteResult: ...
+
+
+class AsyncContactRepository(Protocol):
+    async def get(self, contact_id: ContactId) -> Contact | None: ...
+
+    async def save(self, contact: Contact) -> None: ...
+
+    async def bulk_get(self, contact_ids: list[ContactId]) -> list[Contact]: ...
+
+    async def bulk_save(self, contacts: list[Contact]) -> BulkWriteResult: ...
+
+    async def get_top_by_agents(
+        self, agent_ids: list[AgentId], limit: int = 5
+    ) -> dict[AgentId, list[Contact]]: ...
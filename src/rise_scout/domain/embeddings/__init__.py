@@ -1,3 +1,10 @@
-from rise_scout.domain.embeddings.service import EmbeddingService
+from rise_scout.domain.embeddings.service import AsyncEmbeddingService, EmbeddingService
+from rise_scout.domain.embeddings.vector import EmbeddingVector, Float32Array, to_float32
 
-__all__ = ["EmbeddingService"]
+__all__ = [
+    "AsyncEmbeddingService",
+    "EmbeddingService",
+    "EmbeddingVector",
+    "Float32Array",
+    "to_float32",
+]
@@ -2,8 +2,16 @@ from __future__ import annotations
 
 from typing import Protocol
 
+from rise_scout.domain.embeddings.vector import Float32Array
+
 
 class EmbeddingService(Protocol):
-    def embed(self, text: str) -> list[float]: ...
+    def embed(self, text: str) -> Float32Array: ...
+
+    def embed_batch(self, texts: list[str]) -> list[Float32Array]: ...
+
+
+class AsyncEmbeddingService(Protocol):
+    async def embed(self, text: str) -> Float32Array: ...
 
-    def embed_batch(self, texts: list[str]) -> list[list[float]]: ...
+    async def embed_batch(self, texts: list[str]) -> list[Float32Array]: ...
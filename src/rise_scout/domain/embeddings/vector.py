@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Annotated, Any
+
+from pydantic import PlainSerializer, PlainValidator
+
+if TYPE_CHECKING:
+    Float32Array = array[float]
+else:
+    Float32Array = array
+
+
+def to_float32(values: Any) -> Float32Array:
+    """Packs values as float32, 4 bytes each instead of a 24-byte float object plus its slot.
+
+    A float32 array is returned as-is. Float32 buffers such as NumPy arrays, and raw bytes
+    holding packed float32s, are copied in one memcpy; ``np.frombuffer(vector, np.float32)``
+    views the result without a copy.
+    """
+    if isinstance(values, array) and values.typecode == "f":
+        return values
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return array("f", values)
+    if view.format in ("f", "B") and view.c_contiguous:
+        vector = array("f")
+        vector.frombytes(view.cast("B"))
+        return vector
+    return array("f", view.tolist())
+
+
+EmbeddingVector = Annotated[
+    Float32Array,
+    PlainValidator(to_float32),
+    PlainSerializer(lambda v: v.tolist(), return_type=list[float], when_used="json"),
+]
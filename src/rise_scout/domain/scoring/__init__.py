@@ -1,6 +1,19 @@
+from rise_scout.domain.scoring.checkpoint import (
+    DecayCheckpoint,
+    DecayCheckpointRepository,
+    DecaySliceDispatcher,
+)
 from rise_scout.domain.scoring.decay import DecayCalculator
 from rise_scout.domain.scoring.engine import ScoringEngine
 from rise_scout.domain.scoring.signals import SignalType
 from rise_scout.domain.scoring.weights import ScoringWeights
 
-__all__ = ["ScoringEngine", "DecayCalculator", "SignalType", "ScoringWeights"]
+__all__ = [
+    "DecayCalculator",
+    "DecayCheckpoint",
+    "DecayCheckpointRepository",
+    "DecaySliceDispatcher",
+    "ScoringEngine",
+    "ScoringWeights",
+    "SignalType",
+]
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any, Protocol
+
+from pydantic import BaseModel, Field
+
+
+def daily_run_id(now: datetime | None = None) -> str:
+    return f"decay-{(now or datetime.now(UTC)).date().isoformat()}"
+
+
+def checkpoint_key(run_id: str, slice_id: int = 0, slice_count: int = 1) -> str:
+    if slice_count == 1:
+        return run_id
+    return f"{run_id}:{slice_id}/{slice_count}"
+
+
+class DecayCheckpoint(BaseModel):
+    run_id: str
+    slice_id: int = 0
+    slice_count: int = 1
+    search_after: list[Any] | None = None
+    scanned: int = 0
+    decayed: int = 0
+    # Writes that failed since the current pass started; each earns another pass
+    failed: int = 0
+    catch_up_passes: int = 0
+    invocations: int = 0
+    completed: bool = False
+    fence: int = 0
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+
+    @property
+    def key(self) -> str:
+        return checkpoint_key(self.run_id, self.slice_id, self.slice_count)
+
+
+class DecayCheckpointRepository(Protocol):
+    def load(
+        self, run_id: str, slice_id: int = 0, slice_count: int = 1
+    ) -> DecayCheckpoint | None: ...
+
+    def save(self, checkpoint: DecayCheckpoint) -> None: ...
+
+
+class DecaySliceDispatcher(Protocol):
+    def dispatch(self, run_id: str, slice_id: int, slice_count: int) -> None: ...
@@ -1,23 +1,56 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
 
 from rise_scout.domain.contact.models import Contact
 from rise_scout.domain.scoring.weights import ScoringWeights
 
+if TYPE_CHECKING:
+    from rise_scout.domain.scoring.columnar import DecayBatch, DecayKernelResult
+
+# The columnar kernel pulls in numpy, which only the decay Lambda needs; it is
+# imported on first use to keep it off the consumers' cold start.
+
 
 class DecayCalculator:
     def __init__(self, weights: ScoringWeights) -> None:
         self._rate = weights.decay.rate
         self._retention_days = weights.decay.reason_retention_days
+        self._epsilon = weights.decay.score_epsilon
+
+    def reason_cutoff(self, now: datetime | None = None) -> datetime:
+        return (now or datetime.now(UTC)) - timedelta(days=self._retention_days)
+
+    def apply(self, contact: Contact, cutoff: datetime | None = None) -> bool:
+        changed = False
+        if contact.score > 0.0:
+            contact.apply_decay(self._rate)
+            if contact.score < self._epsilon:
+                contact.score = 0.0
+            changed = True
+
+        return self._prune_old_reasons(contact, cutoff or self.reason_cutoff()) or changed
+
+    def apply_batch(
+        self, contacts: Sequence[Contact], cutoff: datetime | None = None
+    ) -> list[Contact]:
+        if not contacts:
+            return []
+        from rise_scout.domain.scoring.columnar import ContactDecayBatch
+
+        batch = ContactDecayBatch(contacts)
+        return batch.apply(self.decay_columns(batch, cutoff), datetime.now(UTC))
 
-    def apply(self, contact: Contact) -> None:
-        if contact.score <= 0.0:
-            return
+    def decay_columns(self, batch: DecayBatch, cutoff: datetime | None = None) -> DecayKernelResult:
+        from rise_scout.domain.scoring.columnar import decay_kernel
 
-        contact.apply_decay(self._rate)
-        self._prune_old_reasons(contact)
+        return decay_kernel(batch, self._rate, self._epsilon, cutoff or self.reason_cutoff())
 
-    def _prune_old_reasons(self, contact: Contact) -> None:
-        cutoff = datetime.now(UTC) - timedelta(days=self._retention_days)
-        contact.score_reasons = [r for r in contact.score_reasons if r.timestamp >= cutoff]
+    def _prune_old_reasons(self, contact: Contact, cutoff: datetime) -> bool:
+        kept = [r for r in contact.score_reasons if r.timestamp >= cutoff]
+        if len(kept) == len(contact.score_reasons):
+            return False
+        contact.score_reasons = kept
+        return True
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from rise_scout.domain.shared.events import ContactScored
+
+# Direct client activity outranks market matches; profile completeness barely moves the queue
+CATEGORY_PRIORITY: dict[str, float] = {
+    "engagement": 2.0,
+    "relationship": 1.0,
+    "market": 1.0,
+    "profile": 0.5,
+}
+MIN_PRIORITY = 0.1
+
+
+def refresh_priority(event: ContactScored) -> float:
+    weight = CATEGORY_PRIORITY.get(event.category, 1.0)
+    return max(abs(event.delta) * weight, MIN_PRIORITY)
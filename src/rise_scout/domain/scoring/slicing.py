@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import zlib
+
+SLICE_BUCKETS = 1024
+
+
+def slice_bucket(contact_id: str) -> int:
+    return zlib.crc32(contact_id.encode()) % SLICE_BUCKETS
+
+
+def slice_bounds(slice_id: int, slice_count: int) -> tuple[int, int]:
+    if not 0 <= slice_id < slice_count <= SLICE_BUCKETS:
+        raise ValueError(f"Invalid slice {slice_id} of {slice_count}")
+    lower = slice_id * SLICE_BUCKETS // slice_count
+    upper = (slice_id + 1) * SLICE_BUCKETS // slice_count
+    return lower, upper
@@ -4,6 +4,7 @@ from pydantic import BaseModel, Field
 class DecayConfig(BaseModel):
     rate: float = 0.95
     reason_retention_days: int = 30
+    score_epsilon: float = 0.1
 
 
 class ScoringWeights(BaseModel):
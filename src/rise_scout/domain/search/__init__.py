@@ -1,8 +1,9 @@
 from rise_scout.domain.search.models import ListingEvent, ListingEventType, MatchedContact
 from rise_scout.domain.search.parsers import ListingParser
-from rise_scout.domain.search.repository import SearchRepository
+from rise_scout.domain.search.repository import AsyncSearchRepository, SearchRepository
 
 __all__ = [
+    "AsyncSearchRepository",
     "ListingEvent",
     "ListingEventType",
     "ListingParser",
@@ -7,3 +7,7 @@ from rise_scout.domain.search.models import ListingEvent, MatchedContact
 
 class SearchRepository(Protocol):
     def find_matching_contacts(self, event: ListingEvent) -> list[MatchedContact]: ...
+
+
+class AsyncSearchRepository(Protocol):
+    async def find_matching_contacts(self, event: ListingEvent) -> list[MatchedContact]: ...
@@ -3,20 +3,40 @@ from rise_scout.domain.shared.exceptions import (
     ContactNotFoundError,
     DomainError,
     InvalidSignalError,
+    LeaseLostError,
+    RateLimitExceededError,
     StaleContactError,
 )
-from rise_scout.domain.shared.services import RefreshFlagService
+from rise_scout.domain.shared.services import (
+    AsyncContactEventStream,
+    AsyncRefreshFlagService,
+    ContactEventStream,
+    Lease,
+    LeaseService,
+    LockService,
+    RateLimiter,
+    RefreshFlagService,
+)
 from rise_scout.domain.shared.types import AgentId, ContactId, ListingId, MlsId
 
 __all__ = [
     "AgentId",
+    "AsyncContactEventStream",
+    "AsyncRefreshFlagService",
+    "ContactEventStream",
     "ContactId",
     "ContactNotFoundError",
     "DomainError",
     "DomainEvent",
     "InvalidSignalError",
+    "Lease",
+    "LeaseLostError",
+    "LeaseService",
     "ListingId",
+    "LockService",
     "MlsId",
+    "RateLimitExceededError",
+    "RateLimiter",
     "RefreshFlagService",
     "StaleContactError",
 ]
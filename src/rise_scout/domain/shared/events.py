@@ -16,3 +16,5 @@ class DomainEvent(BaseModel):
 class ContactScored(DomainEvent):
     contact_id: ContactId
     agent_ids: list[AgentId]
+    delta: float = 0.0
+    category: str = ""
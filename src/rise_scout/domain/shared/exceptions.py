@@ -18,3 +18,16 @@ class StaleContactError(DomainError):
     def __init__(self, contact_id: str) -> None:
         super().__init__(f"Contact {contact_id} has been modified concurrently")
         self.contact_id = contact_id
+
+
+class LeaseLostError(DomainError):
+    def __init__(self, name: str, fence: int) -> None:
+        super().__init__(f"Lease {name} with fence {fence} has been superseded")
+        self.name = name
+        self.fence = fence
+
+
+class RateLimitExceededError(DomainError):
+    def __init__(self, bucket: str, max_wait_ms: int) -> None:
+        super().__init__(f"Rate limit {bucket} would need a wait over {max_wait_ms}ms")
+        self.bucket = bucket
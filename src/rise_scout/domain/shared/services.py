@@ -2,10 +2,59 @@ from __future__ import annotations
 
 from typing import Protocol
 
+from rise_scout.domain.shared.events import ContactScored
 from rise_scout.domain.shared.types import AgentId
 
 
 class RefreshFlagService(Protocol):
-    def flag_agents(self, agent_ids: list[AgentId]) -> None: ...
+    def flag_agents(self, priorities: dict[AgentId, float]) -> None: ...
 
-    def pop_flagged_agents(self) -> list[AgentId]: ...
+    def pop_flagged_agents(self, limit: int = 100) -> dict[AgentId, float]: ...
+
+    def unflag_agents(self, agent_ids: list[AgentId]) -> None: ...
+
+
+class AsyncRefreshFlagService(Protocol):
+    async def flag_agents(self, priorities: dict[AgentId, float]) -> None: ...
+
+    async def pop_flagged_agents(self, limit: int = 100) -> dict[AgentId, float]: ...
+
+    async def unflag_agents(self, agent_ids: list[AgentId]) -> None: ...
+
+
+class ContactEventStream(Protocol):
+    def publish(self, events: list[ContactScored]) -> None: ...
+
+    def read(self, count: int = 100, block_ms: int = 1000) -> list[tuple[str, ContactScored]]: ...
+
+    def ack(self, message_ids: list[str]) -> None: ...
+
+
+class AsyncContactEventStream(Protocol):
+    async def publish(self, events: list[ContactScored]) -> None: ...
+
+
+class LockService(Protocol):
+    def acquire(self, name: str, ttl_ms: int) -> str | None: ...
+
+    def release(self, name: str, token: str) -> bool: ...
+
+    def is_locked(self, name: str) -> bool: ...
+
+
+class Lease(Protocol):
+    @property
+    def fence(self) -> int: ...
+
+    @property
+    def lost(self) -> bool: ...
+
+    def release(self) -> None: ...
+
+
+class LeaseService(Protocol):
+    def acquire(self, name: str, ttl_ms: int) -> Lease | None: ...
+
+
+class RateLimiter(Protocol):
+    def acquire(self, cost: float = 1.0) -> None: ...
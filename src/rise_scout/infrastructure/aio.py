@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+from collections.abc import Callable
+from concurrent.futures import Executor
+from typing import Any, TypeVar
+
+from rise_scout.domain.cards.insight_cache import CachedInsight, InsightCache
+from rise_scout.domain.cards.llm_service import LLMEnrichmentService
+from rise_scout.domain.cards.models import Card
+from rise_scout.domain.cards.repository import CardRepository
+from rise_scout.domain.contact.models import Contact
+from rise_scout.domain.contact.repository import BulkWriteResult, ContactRepository
+from rise_scout.domain.embeddings.service import EmbeddingService
+from rise_scout.domain.embeddings.vector import Float32Array
+from rise_scout.domain.search.models import ListingEvent, MatchedContact
+from rise_scout.domain.search.repository import SearchRepository
+from rise_scout.domain.shared.events import ContactScored
+from rise_scout.domain.shared.services import ContactEventStream, RefreshFlagService
+from rise_scout.domain.shared.types import AgentId, ContactId
+
+T = TypeVar("T")
+
+# boto3 and the opensearch-py/redis-py sync clients have no asyncio transport we can use
+# without new dependencies. Their calls block on sockets with the GIL released, so running
+# them on a dedicated pool lets a coroutine overlap as many as the pool has threads.
+
+
+class _Threaded:
+    def __init__(self, executor: Executor | None = None) -> None:
+        self._executor = executor
+
+    async def _run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+
+class ThreadedContactRepository(_Threaded):
+    def __init__(self, repo: ContactRepository, executor: Executor | None = None) -> None:
+        super().__init__(executor)
+        self._repo = repo
+
+    async def get(self, contact_id: ContactId) -> Contact | None:
+        return await self._run(self._repo.get, contact_id)
+
+    async def save(self, contact: Contact) -> None:
+        await self._run(self._repo.save, contact)
+
+    async def bulk_get(self, contact_ids: list[ContactId]) -> list[Contact]:
+        return await self._run(self._repo.bulk_get, contact_ids)
+
+    async def bulk_save(self, contacts: list[Contact]) -> BulkWriteResult:
+        return await self._run(self._repo.bulk_save, contacts)
+
+    async def get_top_by_agents(
+        self, agent_ids: list[AgentId], limit: int = 5
+    ) -> dict[AgentId, list[Contact]]:
+        return await self._run(self._repo.get_top_by_agents, agent_ids, limit=limit)
+
+
+class ThreadedCardRepository(_Threaded):
+    def __init__(self, repo: CardRepository, executor: Executor | None = None) -> None:
+        super().__init__(executor)
+        self._repo = repo
+
+    async def get(self, agent_id: AgentId) -> Card | None:
+        return await self._run(self._repo.get, agent_id)
+
+    async def save(self, card: Card) -> None:
+        await self._run(self._repo.save, card)
+
+    async def save_many(self, cards: list[Card]) -> int:
+        return await self._run(self._repo.save_many, cards)
+
+
+class ThreadedSearchRepository(_Threaded):
+    def __init__(self, repo: SearchRepository, executor: Executor | None = None) -> None:
+        super().__init__(executor)
+        self._repo = repo
+
+    async def find_matching_contacts(self, event: ListingEvent) -> list[MatchedContact]:
+        return await self._run(self._repo.find_matching_contacts, event)
+
+
+class ThreadedEmbeddingService(_Threaded):
+    def __init__(self, service: EmbeddingService, executor: Executor | None = None) -> None:
+        super().__init__(executor)
+        self._service = service
+
+    async def embed(self, text: str) -> Float32Array:
+        return await self._run(self._service.embed, text)
+
+    async def embed_batch(self, texts: list[str]) -> list[Float32Array]:
+        # One call per text, so fan them out instead of running the sync loop
+        return list(await asyncio.gather(*(self.embed(t) for t in texts)))
+
+
+class ThreadedLLMService(_Threaded):
+    def __init__(self, service: LLMEnrichmentService, executor: Executor | None = None) -> None:
+        super().__init__(executor)
+        self._service = service
+
+    async def generate_insight(self, contact: Contact) -> str:
+        return await self._run(self._service.generate_insight, contact)
+
+    async def generate_insights(self, contacts: list[Contact]) -> dict[ContactId, str]:
+        return await self._run(self._service.generate_insights, contacts)
+
+
+class ThreadedRefreshFlags(_Threaded):
+    def __init__(self, flags: RefreshFlagService, executor: Executor | None = None) -> None:
+        super().__init__(executor)
+        self._flags = flags
+
+    async def flag_agents(self, priorities: dict[AgentId, float]) -> None:
+        await self._run(self._flags.flag_agents, priorities)
+
+    async def pop_flagged_agents(self, limit: int = 100) -> dict[AgentId, float]:
+        return await self._run(self._flags.pop_flagged_agents, limit=limit)
+
+    async def unflag_agents(self, agent_ids: list[AgentId]) -> None:
+        await self._run(self._flags.unflag_agents, agent_ids)
+
+
+class ThreadedContactEventStream(_Threaded):
+    def __init__(self, stream: ContactEventStream, executor: Executor | None = None) -> None:
+        super().__init__(executor)
+        self._stream = stream
+
+    async def publish(self, events: list[ContactScored]) -> None:
+        await self._run(self._stream.publish, events)
+
+
+class ThreadedInsightCache(_Threaded):
+    def __init__(self, cache: InsightCache, executor: Executor | None = None) -> None:
+        super().__init__(executor)
+        self._cache = cache
+
+    async def get_many(self, keys: list[str]) -> dict[str, CachedInsight]:
+        return await self._run(self._cache.get_many, keys)
+
+    async def set_many(self, entries: dict[str, CachedInsight]) -> None:
+        await self._run(self._cache.set_many, entries)
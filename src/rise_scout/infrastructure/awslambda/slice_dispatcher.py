@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import json
+
+import boto3
+import structlog
+
+logger = structlog.get_logger()
+
+
+class LambdaSliceDispatcher:
+    def __init__(self, function_name: str, region: str = "us-west-2") -> None:
+        self._client = boto3.client("lambda", region_name=region)
+        self._function_name = function_name
+
+    def dispatch(self, run_id: str, slice_id: int, slice_count: int) -> None:
+        payload = {"run_id": run_id, "slice_id": slice_id, "slice_count": slice_count}
+        self._client.invoke(
+            FunctionName=self._function_name,
+            InvocationType="Event",
+            Payload=json.dumps(payload).encode(),
+        )
+        logger.debug("decay_slice_dispatched", run_id=run_id, slice_id=slice_id)
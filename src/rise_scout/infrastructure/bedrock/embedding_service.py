@@ -1,23 +1,46 @@
 from __future__ import annotations
 
 import json
+from typing import Any
 
 import boto3
 import structlog
 
+from rise_scout.domain.embeddings.vector import Float32Array, to_float32
+from rise_scout.domain.shared.services import RateLimiter
+
 logger = structlog.get_logger()
 
 
 class BedrockEmbeddingService:
-    def __init__(self, model_id: str, region: str = "us-west-2") -> None:
+    def __init__(
+        self,
+        model_id: str,
+        region: str = "us-west-2",
+        rate_limiter: RateLimiter | None = None,
+        dimensions: int | None = None,
+    ) -> None:
         self._client = boto3.client("bedrock-runtime", region_name=region)
         self._model_id = model_id
+        self._rate_limiter = rate_limiter
+        self._dimensions = dimensions
 
-    def embed(self, text: str) -> list[float]:
-        body = json.dumps({"inputText": text})
-        resp = self._client.invoke_model(modelId=self._model_id, body=body)
+    def embed(self, text: str) -> Float32Array:
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+        request: dict[str, Any] = {"inputText": text}
+        if self._dimensions is not None:
+            # Titan v2 truncates and renormalizes server-side; 256, 512 or 1024
+            request["dimensions"] = self._dimensions
+            request["normalize"] = True
+        resp = self._client.invoke_model(modelId=self._model_id, body=json.dumps(request))
         result = json.loads(resp["body"].read())
-        return result["embedding"]
+        vector = to_float32(result["embedding"])
+        if self._dimensions is not None and len(vector) != self._dimensions:
+            raise ValueError(
+                f"{self._model_id} returned {len(vector)} dimensions, expected {self._dimensions}"
+            )
+        return vector
 
-    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+    def embed_batch(self, texts: list[str]) -> list[Float32Array]:
         return [self.embed(text) for text in texts]
@@ -1,42 +1,142 @@
 from __future__ import annotations
 
 import json
+from typing import Any
 
 import boto3
 import structlog
+from botocore.config import Config
 
 from rise_scout.domain.contact.models import Contact
+from rise_scout.domain.shared.services import RateLimiter
+from rise_scout.domain.shared.types import ContactId
 
 logger = structlog.get_logger()
 
+ANTHROPIC_VERSION = "bedrock-2023-05-31"
+INSIGHT_MAX_TOKENS = 150
+
+# Cached insights are keyed on INSIGHT_PROMPT_VERSION; bump it when the prompts or tool change
+INSIGHTS_TOOL = {
+    "name": "record_insights",
+    "description": "Record one insight per contact.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "insights": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "contact_id": {"type": "string"},
+                        "insight": {"type": "string"},
+                    },
+                    "required": ["contact_id", "insight"],
+                },
+            }
+        },
+        "required": ["insights"],
+    },
+}
+
 
 class BedrockLLMService:
-    def __init__(self, model_id: str, region: str = "us-west-2") -> None:
-        self._client = boto3.client("bedrock-runtime", region_name=region)
+    def __init__(
+        self,
+        model_id: str,
+        region: str = "us-west-2",
+        max_pool_connections: int = 10,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
+        self._client = boto3.client(
+            "bedrock-runtime",
+            region_name=region,
+            config=Config(max_pool_connections=max_pool_connections),
+        )
         self._model_id = model_id
+        self._rate_limiter = rate_limiter
 
     def generate_insight(self, contact: Contact) -> str:
-        reasons_text = "; ".join(
-            f"{r.signal}: {r.detail} ({r.points:+.0f}pts)" for r in contact.score_reasons[:5]
-        )
-
         prompt = (
             f"You are a real estate assistant. Given the following contact activity, "
             f"write a 1-2 sentence actionable insight for their agent.\n\n"
             f"Contact: {contact.first_name} {contact.last_name}\n"
             f"Score: {contact.score:.0f}\n"
-            f"Recent signals: {reasons_text}\n\n"
+            f"Recent signals: {_reasons_text(contact)}\n\n"
             f"Insight:"
         )
 
-        body = json.dumps(
+        result = self._invoke(
             {
-                "anthropic_version": "bedrock-2023-05-31",
-                "max_tokens": 150,
+                "anthropic_version": ANTHROPIC_VERSION,
+                "max_tokens": INSIGHT_MAX_TOKENS,
                 "messages": [{"role": "user", "content": prompt}],
             }
         )
-
-        resp = self._client.invoke_model(modelId=self._model_id, body=body)
-        result = json.loads(resp["body"].read())
         return result["content"][0]["text"].strip()
+
+    def generate_insights(self, contacts: list[Contact]) -> dict[ContactId, str]:
+        if len(contacts) <= 1:
+            return {c.contact_id: self.generate_insight(c) for c in contacts}
+
+        blocks = "\n\n".join(
+            f"Contact ID: {c.contact_id}\n"
+            f"Contact: {c.first_name} {c.last_name}\n"
+            f"Score: {c.score:.0f}\n"
+            f"Recent signals: {_reasons_text(c)}"
+            for c in contacts
+        )
+        prompt = (
+            f"You are a real estate assistant. For each contact below, write a 1-2 sentence "
+            f"actionable insight for their agent based on the contact's activity.\n\n"
+            f"{blocks}"
+        )
+
+        result = self._invoke(
+            {
+                "anthropic_version": ANTHROPIC_VERSION,
+                "max_tokens": INSIGHT_MAX_TOKENS * len(contacts),
+                "tools": [INSIGHTS_TOOL],
+                "tool_choice": {"type": "tool", "name": INSIGHTS_TOOL["name"]},
+                "messages": [{"role": "user", "content": prompt}],
+            }
+        )
+        try:
+            parsed = _parse_insights(result)
+        except (KeyError, StopIteration, TypeError, ValueError):
+            logger.warning("batch_insight_parse_failed", contacts=len(contacts), exc_info=True)
+            parsed = {}
+
+        insights: dict[ContactId, str] = {}
+        for contact in contacts:
+            text = parsed.get(str(contact.contact_id), "")
+            insights[contact.contact_id] = text or self._generate_insight_fallback(contact)
+        return insights
+
+    def _generate_insight_fallback(self, contact: Contact) -> str:
+        try:
+            return self.generate_insight(contact)
+        except Exception:
+            logger.warning(
+                "insight_generation_failed", contact_id=str(contact.contact_id), exc_info=True
+            )
+            return ""
+
+    def _invoke(self, body: dict[str, Any]) -> dict[str, Any]:
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+        resp = self._client.invoke_model(modelId=self._model_id, body=json.dumps(body))
+        return json.loads(resp["body"].read())
+
+
+def _reasons_text(contact: Contact) -> str:
+    return "; ".join(
+        f"{r.signal}: {r.detail} ({r.points:+.0f}pts)" for r in contact.score_reasons[:5]
+    )
+
+
+def _parse_insights(result: dict[str, Any]) -> dict[str, str]:
+    block = next(b for b in result["content"] if b.get("type") == "tool_use")
+    return {
+        str(item["contact_id"]): str(item["insight"]).strip() for item in block["input"]["insights"]
+    }
@@ -1,72 +1,309 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import TYPE_CHECKING
 
-import redis
 import structlog
 
 from rise_scout.domain.scoring.decay import DecayCalculator
 from rise_scout.domain.scoring.engine import ScoringEngine
-from rise_scout.infrastructure.bedrock.embedding_service import BedrockEmbeddingService
-from rise_scout.infrastructure.bedrock.llm_service import BedrockLLMService
+from rise_scout.domain.scoring.weights import ScoringWeights
+from rise_scout.infrastructure.aio import (
+    ThreadedCardRepository,
+    ThreadedContactEventStream,
+    ThreadedContactRepository,
+    ThreadedEmbeddingService,
+    ThreadedInsightCache,
+    ThreadedLLMService,
+    ThreadedRefreshFlags,
+    ThreadedSearchRepository,
+)
 from rise_scout.infrastructure.config.weights_loader import load_weights
-from rise_scout.infrastructure.dynamodb.card_repository import DynamoDBCardRepository
 from rise_scout.infrastructure.kafka.parsers import (
     ContactChangeParser,
     InteractionParser,
     ListingParser,
 )
-from rise_scout.infrastructure.opensearch.client import create_aoss_client
-from rise_scout.infrastructure.opensearch.contact_repository import OpenSearchContactRepository
-from rise_scout.infrastructure.opensearch.search_repository import OpenSearchSearchRepository
-from rise_scout.infrastructure.redis.debouncer import EventDebouncer
-from rise_scout.infrastructure.redis.refresh_flags import RefreshFlagStore
 from rise_scout.infrastructure.rise_api.client import StubRiseApiClient
 from rise_scout.settings import Settings
 
+if TYPE_CHECKING:
+    import redis
+    from opensearchpy import OpenSearch
+
+    from rise_scout.infrastructure.bedrock.embedding_service import BedrockEmbeddingService
+    from rise_scout.infrastructure.bedrock.llm_service import BedrockLLMService
+    from rise_scout.infrastructure.dynamodb.card_repository import DynamoDBCardRepository
+    from rise_scout.infrastructure.opensearch.contact_repository import (
+        OpenSearchContactRepository,
+    )
+    from rise_scout.infrastructure.opensearch.search_repository import (
+        OpenSearchSearchRepository,
+    )
+    from rise_scout.infrastructure.opensearch.vectors import VectorFormat
+    from rise_scout.infrastructure.redis.contact_events import RedisContactEventStream
+    from rise_scout.infrastructure.redis.debouncer import EventDebouncer
+    from rise_scout.infrastructure.redis.decay_checkpoint import DecayCheckpointStore
+    from rise_scout.infrastructure.redis.insight_cache import RedisInsightCache
+    from rise_scout.infrastructure.redis.leaderboard import RedisContactLeaderboard
+    from rise_scout.infrastructure.redis.lease import RedisLeaseService
+    from rise_scout.infrastructure.redis.lock import RedisLock
+    from rise_scout.infrastructure.redis.rate_limiter import RedisTokenBucket
+    from rise_scout.infrastructure.redis.refresh_flags import RefreshFlagStore
+
 logger = structlog.get_logger()
 
 
 class Container:
+    """Builds each dependency on first access.
+
+    Client libraries are imported inside the properties that need them, so a Lambda
+    only pays the import and setup cost of the clients its handler touches.
+    """
+
     def __init__(self, settings: Settings | None = None) -> None:
         self.settings = settings or Settings()
         self._init_logging()
+        logger.info("container_initialized", env=self.settings.env)
+
+    # Config
+    @cached_property
+    def weights(self) -> ScoringWeights:
+        return load_weights()
+
+    @cached_property
+    def scoring_engine(self) -> ScoringEngine:
+        return ScoringEngine(self.weights)
 
-        # Config
-        self.weights = load_weights()
-        self.scoring_engine = ScoringEngine(self.weights)
-        self.decay_calculator = DecayCalculator(self.weights)
+    @cached_property
+    def decay_calculator(self) -> DecayCalculator:
+        return DecayCalculator(self.weights)
 
-        # OpenSearch
-        self._os_client = create_aoss_client(self.settings)
-        self.contact_repo = OpenSearchContactRepository(
-            self._os_client, self.settings.contacts_index
+    # Redis
+    @cached_property
+    def _redis_client(self) -> redis.Redis[bytes]:
+        import redis
+
+        pool = redis.BlockingConnectionPool.from_url(
+            self.settings.redis_url,
+            max_connections=self.settings.redis_max_connections,
+            timeout=self.settings.redis_pool_timeout_s,
+            socket_timeout=self.settings.redis_socket_timeout_s,
+            socket_connect_timeout=self.settings.redis_connect_timeout_s,
+            socket_keepalive=True,
+            health_check_interval=30,
         )
-        self.search_repo = OpenSearchSearchRepository(self._os_client, self.settings.contacts_index)
+        return redis.Redis(connection_pool=pool)
+
+    @cached_property
+    def refresh_flags(self) -> RefreshFlagStore:
+        from rise_scout.infrastructure.redis.refresh_flags import RefreshFlagStore
+
+        return RefreshFlagStore(self._redis_client)
+
+    @cached_property
+    def debouncer(self) -> EventDebouncer:
+        from rise_scout.infrastructure.redis.debouncer import EventDebouncer
 
-        # DynamoDB
-        self.card_repo = DynamoDBCardRepository(self.settings.cards_table, self.settings.aws_region)
+        return EventDebouncer(self._redis_client)
 
-        # Redis
-        self._redis_client = redis.from_url(self.settings.redis_url)
-        self.refresh_flags = RefreshFlagStore(self._redis_client)
-        self.debouncer = EventDebouncer(self._redis_client)
+    @cached_property
+    def decay_checkpoints(self) -> DecayCheckpointStore:
+        from rise_scout.infrastructure.redis.decay_checkpoint import DecayCheckpointStore
 
-        # Bedrock
-        self.embedding_service = BedrockEmbeddingService(
-            self.settings.embedding_model_id, self.settings.aws_region
+        return DecayCheckpointStore(self._redis_client)
+
+    @cached_property
+    def insight_cache(self) -> RedisInsightCache:
+        from rise_scout.infrastructure.redis.insight_cache import RedisInsightCache
+
+        return RedisInsightCache(
+            self._redis_client, ttl_seconds=self.settings.insight_cache_ttl_seconds
         )
-        self.llm_service = BedrockLLMService(self.settings.llm_model_id, self.settings.aws_region)
 
-        # Kafka parsers
-        self.contact_change_parser = ContactChangeParser()
-        self.interaction_parser = InteractionParser()
-        self.listing_parser = ListingParser()
+    @cached_property
+    def contact_events(self) -> RedisContactEventStream:
+        from rise_scout.infrastructure.redis.contact_events import RedisContactEventStream
 
-        # RISE API
-        self.rise_api = StubRiseApiClient()
+        return RedisContactEventStream(self._redis_client)
 
-        logger.info("container_initialized", env=self.settings.env)
+    @cached_property
+    def lock(self) -> RedisLock:
+        from rise_scout.infrastructure.redis.lock import RedisLock
+
+        return RedisLock(self._redis_client)
+
+    @cached_property
+    def leases(self) -> RedisLeaseService:
+        from rise_scout.infrastructure.redis.lease import RedisLeaseService
+
+        return RedisLeaseService(self._redis_client)
+
+    @cached_property
+    def leaderboard(self) -> RedisContactLeaderboard:
+        from rise_scout.infrastructure.redis.leaderboard import RedisContactLeaderboard
+
+        return RedisContactLeaderboard(self._redis_client, size=self.settings.leaderboard_size)
+
+    # OpenSearch
+    @cached_property
+    def _os_client(self) -> OpenSearch:
+        from rise_scout.infrastructure.opensearch.client import create_aoss_client
+
+        return create_aoss_client(self.settings)
+
+    @cached_property
+    def contact_repo(self) -> OpenSearchContactRepository:
+        from rise_scout.infrastructure.opensearch.bulk_writer import BulkWriter
+        from rise_scout.infrastructure.opensearch.contact_repository import (
+            OpenSearchContactRepository,
+        )
+
+        writer = BulkWriter(
+            self._os_client,
+            self.settings.contacts_index,
+            max_chunk_bytes=self.settings.bulk_max_chunk_bytes,
+            max_concurrency=self.settings.bulk_max_concurrency,
+            max_retries=self.settings.bulk_max_retries,
+            vectors=self.vector_format,
+        )
+        return OpenSearchContactRepository(
+            self._os_client,
+            self.settings.contacts_index,
+            leaderboard=self.leaderboard,
+            writer=writer,
+            vectors=self.vector_format,
+        )
+
+    @cached_property
+    def vector_format(self) -> VectorFormat:
+        from rise_scout.infrastructure.opensearch.vectors import VectorFormat, VectorQuantization
+
+        return VectorFormat(
+            dimensions=self.settings.embedding_dimensions,
+            quantization=VectorQuantization(self.settings.embedding_quantization),
+        )
+
+    @cached_property
+    def search_repo(self) -> OpenSearchSearchRepository:
+        from rise_scout.infrastructure.opensearch.search_repository import (
+            OpenSearchSearchRepository,
+        )
+
+        return OpenSearchSearchRepository(self._os_client, self.settings.contacts_index)
+
+    # DynamoDB
+    @cached_property
+    def card_repo(self) -> DynamoDBCardRepository:
+        from rise_scout.infrastructure.dynamodb.card_repository import DynamoDBCardRepository
+
+        return DynamoDBCardRepository(self.settings.cards_table, self.settings.aws_region)
+
+    # Bedrock
+    @cached_property
+    def embedding_rate_limiter(self) -> RedisTokenBucket:
+        from rise_scout.infrastructure.redis.rate_limiter import RedisTokenBucket
+
+        return RedisTokenBucket(
+            self._redis_client,
+            "bedrock_embedding",
+            self.settings.embedding_rate_per_second,
+            self.settings.embedding_burst,
+            max_wait_ms=self.settings.bedrock_max_wait_ms,
+        )
+
+    @cached_property
+    def llm_rate_limiter(self) -> RedisTokenBucket:
+        from rise_scout.infrastructure.redis.rate_limiter import RedisTokenBucket
+
+        return RedisTokenBucket(
+            self._redis_client,
+            "bedrock_llm",
+            self.settings.llm_rate_per_second,
+            self.settings.llm_burst,
+            max_wait_ms=self.settings.bedrock_max_wait_ms,
+        )
+
+    @cached_property
+    def embedding_service(self) -> BedrockEmbeddingService:
+        from rise_scout.infrastructure.bedrock.embedding_service import BedrockEmbeddingService
+
+        return BedrockEmbeddingService(
+            self.settings.embedding_model_id,
+            self.settings.aws_region,
+            rate_limiter=self.embedding_rate_limiter,
+            dimensions=self.settings.embedding_dimensions,
+        )
+
+    @cached_property
+    def llm_service(self) -> BedrockLLMService:
+        from rise_scout.infrastructure.bedrock.llm_service import BedrockLLMService
+
+        return BedrockLLMService(
+            self.settings.llm_model_id,
+            self.settings.aws_region,
+            max_pool_connections=self.settings.llm_max_concurrency,
+            rate_limiter=self.llm_rate_limiter,
+        )
+
+    # Async adapters over the clients above, sharing one I/O pool
+    @cached_property
+    def _io_executor(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(
+            max_workers=self.settings.async_io_workers, thread_name_prefix="rise_scout_io"
+        )
+
+    @cached_property
+    def async_contact_repo(self) -> ThreadedContactRepository:
+        return ThreadedContactRepository(self.contact_repo, self._io_executor)
+
+    @cached_property
+    def async_search_repo(self) -> ThreadedSearchRepository:
+        return ThreadedSearchRepository(self.search_repo, self._io_executor)
+
+    @cached_property
+    def async_card_repo(self) -> ThreadedCardRepository:
+        return ThreadedCardRepository(self.card_repo, self._io_executor)
+
+    @cached_property
+    def async_refresh_flags(self) -> ThreadedRefreshFlags:
+        return ThreadedRefreshFlags(self.refresh_flags, self._io_executor)
+
+    @cached_property
+    def async_contact_events(self) -> ThreadedContactEventStream:
+        return ThreadedContactEventStream(self.contact_events, self._io_executor)
+
+    @cached_property
+    def async_insight_cache(self) -> ThreadedInsightCache:
+        return ThreadedInsightCache(self.insight_cache, self._io_executor)
+
+    @cached_property
+    def async_embedding_service(self) -> ThreadedEmbeddingService:
+        return ThreadedEmbeddingService(self.embedding_service, self._io_executor)
+
+    @cached_property
+    def async_llm_service(self) -> ThreadedLLMService:
+        return ThreadedLLMService(self.llm_service, self._io_executor)
+
+    # Kafka parsers
+    @cached_property
+    def contact_change_parser(self) -> ContactChangeParser:
+        return ContactChangeParser()
+
+    @cached_property
+    def interaction_parser(self) -> InteractionParser:
+        return InteractionParser()
+
+    @cached_property
+    def listing_parser(self) -> ListingParser:
+        return ListingParser()
+
+    # RISE API
+    @cached_property
+    def rise_api(self) -> StubRiseApiClient:
+        return StubRiseApiClient()
 
     def _init_logging(self) -> None:
         structlog.configure(
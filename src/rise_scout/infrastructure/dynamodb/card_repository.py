@@ -1,21 +1,30 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import time
 from datetime import UTC, datetime
 from typing import Any
 
 import boto3
 import structlog
+from botocore.exceptions import ClientError
 
 from rise_scout.domain.cards.models import Card, CardContact
 from rise_scout.domain.shared.types import AgentId, ContactId
 
 logger = structlog.get_logger()
 
+WRITE_BATCH_SIZE = 25
+READ_BATCH_SIZE = 100
+MAX_BATCH_ATTEMPTS = 5
+
 
 class DynamoDBCardRepository:
     def __init__(self, table_name: str, region: str = "us-west-2") -> None:
-        self._table = boto3.resource("dynamodb", region_name=region).Table(table_name)
+        self._resource = boto3.resource("dynamodb", region_name=region)
+        self._table = self._resource.Table(table_name)
+        self._table_name = table_name
 
     def get(self, agent_id: AgentId) -> Card | None:
         resp = self._table.get_item(Key={"agent_id": str(agent_id)})
@@ -29,11 +38,88 @@ class DynamoDBCardRepository:
         self._table.put_item(Item=item)
         logger.info("card_saved", agent_id=str(card.agent_id))
 
+    def save_many(self, cards: list[Card]) -> int:
+        items = {str(card.agent_id): self._card_to_item(card) for card in cards}
+        stored = self._stored_hashes(list(items))
+
+        to_write: list[dict[str, Any]] = []
+        skipped = 0
+        for agent_id, item in items.items():
+            if stored.get(agent_id) == item["content_hash"] and self._extend_expiry(item):
+                skipped += 1
+            else:
+                to_write.append(item)
+
+        written = 0
+        for start in range(0, len(to_write), WRITE_BATCH_SIZE):
+            written += self._batch_write(to_write[start : start + WRITE_BATCH_SIZE])
+
+        logger.info(
+            "cards_saved",
+            written=written,
+            skipped=skipped,
+            failed=len(to_write) - written,
+        )
+        return written
+
+    def _stored_hashes(self, agent_ids: list[str]) -> dict[str, str]:
+        hashes: dict[str, str] = {}
+        for start in range(0, len(agent_ids), READ_BATCH_SIZE):
+            keys = [{"agent_id": a} for a in agent_ids[start : start + READ_BATCH_SIZE]]
+            # Unprocessed keys are simply treated as changed and rewritten
+            resp = self._resource.batch_get_item(
+                RequestItems={
+                    self._table_name: {
+                        "Keys": keys,
+                        "ProjectionExpression": "agent_id, content_hash",
+                    }
+                }
+            )
+            for item in resp["Responses"].get(self._table_name, []):
+                if "content_hash" in item:
+                    hashes[item["agent_id"]] = item["content_hash"]
+        return hashes
+
+    def _extend_expiry(self, item: dict[str, Any]) -> bool:
+        try:
+            self._table.update_item(
+                Key={"agent_id": item["agent_id"]},
+                UpdateExpression="SET generated_at = :g, expires_at = :e",
+                ConditionExpression="content_hash = :h",
+                ExpressionAttributeValues={
+                    ":g": item["generated_at"],
+                    ":e": item["expires_at"],
+                    ":h": item["content_hash"],
+                },
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return False
+            raise
+        return True
+
+    def _batch_write(self, items: list[dict[str, Any]]) -> int:
+        requests = [{"PutRequest": {"Item": item}} for item in items]
+        for attempt in range(MAX_BATCH_ATTEMPTS):
+            resp = self._resource.batch_write_item(RequestItems={self._table_name: requests})
+            requests = resp.get("UnprocessedItems", {}).get(self._table_name, [])
+            if not requests:
+                break
+            time.sleep(0.05 * 2**attempt)
+        if requests:
+            logger.warning(
+                "card_batch_write_unprocessed",
+                agent_ids=[r["PutRequest"]["Item"]["agent_id"] for r in requests],
+            )
+        return len(items) - len(requests)
+
     def _card_to_item(self, card: Card) -> dict[str, Any]:
         expires_at = int(card.generated_at.timestamp()) + card.ttl
+        contacts = json.dumps([c.model_dump(mode="json") for c in card.contacts])
         return {
             "agent_id": str(card.agent_id),
-            "contacts": json.dumps([c.model_dump(mode="json") for c in card.contacts]),
+            "contacts": contacts,
+            "content_hash": hashlib.sha256(contacts.encode()).hexdigest(),
             "generated_at": card.generated_at.isoformat(),
             "ttl": card.ttl,
             "expires_at": expires_at,
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from typing import Any
+
+import structlog
+
+from rise_scout.infrastructure.redis.debouncer import EventDebouncer
+
+logger = structlog.get_logger()
+
+
+def skip_processed_records(
+    debouncer: EventDebouncer, records: dict[str, list[dict[str, Any]]]
+) -> dict[str, list[dict[str, Any]]]:
+    """Drop records an earlier delivery already processed, in one Redis round-trip.
+
+    Records are keyed by topic, partition and offset; any without those fields pass through.
+    Nothing is claimed here: records are marked by mark_records_processed once they've been
+    handled, so a delivery that crashes or times out is retried in full.
+    """
+    keys = {id(r): key for batch in records.values() for r in batch if (key := _key(r))}
+    try:
+        seen = debouncer.seen_many(list(keys.values()))
+    except Exception:
+        # Processing a redelivery twice beats dropping the batch
+        logger.warning("kafka_dedupe_failed", records=len(keys), exc_info=True)
+        return records
+
+    fresh = {
+        topic: [r for r in batch if id(r) not in keys or not seen[keys[id(r)]]]
+        for topic, batch in records.items()
+    }
+    skipped = sum(len(b) for b in records.values()) - sum(len(b) for b in fresh.values())
+    if skipped:
+        logger.info("kafka_redeliveries_skipped", skipped=skipped)
+    return fresh
+
+
+def mark_records_processed(
+    debouncer: EventDebouncer, records: list[dict[str, Any]], ttl_seconds: int
+) -> None:
+    keys = [key for r in records if (key := _key(r))]
+    try:
+        debouncer.mark_many(keys, ttl_seconds=ttl_seconds)
+    except Exception:
+        # Unmarked records are only processed again if the batch is redelivered
+        logger.warning("kafka_dedupe_mark_failed", records=len(keys), exc_info=True)
+
+
+def _key(record: dict[str, Any]) -> str | None:
+    if not {"topic", "partition", "offset"} <= record.keys():
+        return None
+    return f"kafka:{record['topic']}:{record['partition']}:{record['offset']}"
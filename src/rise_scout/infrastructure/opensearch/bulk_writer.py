@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+import structlog
+from opensearchpy.exceptions import TransportError
+
+from rise_scout.domain.contact.repository import BulkWriteResult
+from rise_scout.domain.shared.types import ContactId
+from rise_scout.infrastructure.opensearch.serializers import document_json
+from rise_scout.infrastructure.opensearch.vectors import FLOAT_VECTORS, VectorFormat
+
+if TYPE_CHECKING:
+    from opensearchpy import OpenSearch
+
+logger = structlog.get_logger()
+
+# Only what's needed to tell which items failed and why
+BULK_FILTER_PATH = "errors,items.*._id,items.*.status,items.*.error.type,items.*.error.reason"
+RETRYABLE_STATUSES = {429, 502, 503, 504}
+MIN_CHUNK_BYTES = 256 * 1024
+
+
+class BulkWriter:
+    """Indexes documents by id, retrying only what was throttled or failed transiently.
+
+    Requests are packed up to a byte budget rather than a document count, so a page of
+    vector-heavy documents doesn't overrun the request size limit. Any 429 halves the byte
+    budget and the number of parallel requests; clean rounds grow them back additively.
+    The adapted limits carry over between calls.
+    """
+
+    def __init__(
+        self,
+        client: OpenSearch,
+        index: str,
+        max_chunk_bytes: int = 5 * 1024 * 1024,
+        max_chunk_docs: int = 1000,
+        max_concurrency: int = 4,
+        max_retries: int = 5,
+        initial_backoff_s: float = 0.2,
+        max_backoff_s: float = 10.0,
+        vectors: VectorFormat = FLOAT_VECTORS,
+    ) -> None:
+        self._client = client
+        self._index = index
+        self._max_chunk_bytes = max_chunk_bytes
+        self._max_chunk_docs = max_chunk_docs
+        self._max_concurrency = max_concurrency
+        self._max_retries = max_retries
+        self._initial_backoff = initial_backoff_s
+        self._max_backoff = max_backoff_s
+        self._vectors = vectors
+
+        self._lock = threading.Lock()
+        self._chunk_bytes = max_chunk_bytes
+        self._concurrency = max_concurrency
+
+    def write(
+        self,
+        docs: list[dict[str, Any]],
+        id_field: str = "contact_id",
+        versions: dict[str, tuple[int, int]] | None = None,
+    ) -> BulkWriteResult:
+        """Index ``docs``; ids in ``versions`` only if still at that (seq_no, primary_term)."""
+        if not docs:
+            return BulkWriteResult()
+
+        # Serialized once; retries resend the same bytes
+        pending: dict[str, bytes] = {}
+        for doc in docs:
+            doc_id = str(doc[id_field])
+            meta: dict[str, Any] = {"_index": self._index, "_id": doc_id}
+            if versions and doc_id in versions:
+                meta["if_seq_no"], meta["if_primary_term"] = versions[doc_id]
+            action = {"index": meta}
+            source = document_json(doc, self._vectors)
+            pending[doc_id] = f"{json.dumps(action)}\n{source}\n".encode()
+
+        succeeded: list[ContactId] = []
+        failed: dict[ContactId, str] = {}
+        throttled = 0
+        attempt = 0
+        while pending:
+            chunks = list(self._chunks(pending))
+            with ThreadPoolExecutor(max_workers=min(self._concurrency, len(chunks))) as pool:
+                outcomes = list(pool.map(self._send, chunks))
+
+            retry: dict[str, str] = {}
+            round_throttled = 0
+            for statuses in outcomes:
+                for doc_id, (status, reason) in statuses.items():
+                    if status < 300:
+                        succeeded.append(ContactId(doc_id))
+                        del pending[doc_id]
+                    elif status in RETRYABLE_STATUSES:
+                        retry[doc_id] = reason
+                        round_throttled += status == 429
+                    else:
+                        failed[ContactId(doc_id)] = reason
+                        del pending[doc_id]
+            throttled += round_throttled
+            self._adapt(round_throttled > 0)
+
+            if not pending:
+                break
+            if attempt >= self._max_retries:
+                failed.update({ContactId(doc_id): retry[doc_id] for doc_id in pending})
+                break
+            attempt += 1
+            time.sleep(self._backoff(attempt))
+
+        log = logger.error if failed else logger.info
+        log(
+            "bulk_write_complete",
+            docs=len(docs),
+            succeeded=len(succeeded),
+            failed=len(failed),
+            retries=attempt,
+            throttled=throttled,
+            chunk_bytes=self._chunk_bytes,
+            concurrency=self._concurrency,
+        )
+        return BulkWriteResult(succeeded=succeeded, failed=failed)
+
+    def _chunks(self, pending: dict[str, bytes]) -> Iterator[dict[str, bytes]]:
+        chunk: dict[str, bytes] = {}
+        size = 0
+        for doc_id, line in pending.items():
+            # An oversize document still goes out, alone in its own request
+            if chunk and (
+                size + len(line) > self._chunk_bytes or len(chunk) >= self._max_chunk_docs
+            ):
+                yield chunk
+                chunk, size = {}, 0
+            chunk[doc_id] = line
+            size += len(line)
+        if chunk:
+            yield chunk
+
+    def _send(self, chunk: dict[str, bytes]) -> dict[str, tuple[int, str]]:
+        try:
+            resp = self._client.bulk(body=b"".join(chunk.values()), filter_path=BULK_FILTER_PATH)
+        except TransportError as e:
+            # Connection errors carry "N/A"; treat them like an unavailable cluster
+            status = e.status_code if isinstance(e.status_code, int) else 503
+            return dict.fromkeys(chunk, (status, str(e.error)))
+
+        if not resp.get("errors"):
+            return dict.fromkeys(chunk, (200, ""))
+
+        statuses: dict[str, tuple[int, str]] = {}
+        for item in resp["items"]:
+            result = item["index"]
+            error = result.get("error", {})
+            reason = f"{error.get('type', '')}: {error.get('reason', '')}" if error else ""
+            statuses[result["_id"]] = (result.get("status", 500 if error else 200), reason)
+        return statuses
+
+    def _adapt(self, throttled: bool) -> None:
+        with self._lock:
+            if throttled:
+                self._chunk_bytes = max(MIN_CHUNK_BYTES, self._chunk_bytes // 2)
+                self._concurrency = max(1, self._concurrency // 2)
+            else:
+                self._chunk_bytes = min(self._max_chunk_bytes, self._chunk_bytes + MIN_CHUNK_BYTES)
+                self._concurrency = min(self._max_concurrency, self._concurrency + 1)
+
+    def _backoff(self, attempt: int) -> float:
+        # Full jitter keeps retries from concurrent writers from landing together
+        return random.uniform(0, min(self._max_backoff, self._initial_backoff * 2**attempt))
@@ -1,30 +1,68 @@
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
 
 import structlog
 from opensearchpy import OpenSearch
+from opensearchpy.exceptions import TransportError
 
 from rise_scout.domain.contact.models import Contact
+from rise_scout.domain.contact.repository import BulkWriteResult
+from rise_scout.domain.scoring.columnar import DecayBatch, DecayKernelResult
+from rise_scout.domain.scoring.slicing import slice_bounds
 from rise_scout.domain.shared.types import AgentId, ContactId
-from rise_scout.infrastructure.opensearch.pagination import search_after_paginator
+from rise_scout.infrastructure.opensearch.bulk_writer import BulkWriter
+from rise_scout.infrastructure.opensearch.decay_batch import DocumentDecayBatch
+from rise_scout.infrastructure.opensearch.mappings import contacts_index_body
+from rise_scout.infrastructure.opensearch.pagination import (
+    search_after_pages,
+    search_after_paginator,
+)
 from rise_scout.infrastructure.opensearch.serializers import (
     contact_to_document,
-    document_to_contact,
+    document_json,
+    trusted_document_to_contact,
 )
+from rise_scout.infrastructure.opensearch.vectors import FLOAT_VECTORS, VectorFormat
+
+if TYPE_CHECKING:
+    from rise_scout.infrastructure.redis.leaderboard import RedisContactLeaderboard
 
 logger = structlog.get_logger()
 
+CARD_SOURCE_FIELDS = ["contact_id", "user_ids", "first_name", "last_name", "score", "score_reasons"]
+
 
 class OpenSearchContactRepository:
-    def __init__(self, client: OpenSearch, index: str) -> None:
+    def __init__(
+        self,
+        client: OpenSearch,
+        index: str,
+        leaderboard: RedisContactLeaderboard | None = None,
+        writer: BulkWriter | None = None,
+        vectors: VectorFormat = FLOAT_VECTORS,
+    ) -> None:
         self._client = client
         self._index = index
+        self._leaderboard = leaderboard
+        self._writer = writer or BulkWriter(client, index, vectors=vectors)
+        self._vectors = vectors
+
+    def create_index(self) -> None:
+        self._client.indices.create(index=self._index, body=contacts_index_body(self._vectors))
+        logger.info(
+            "contacts_index_created",
+            index=self._index,
+            dimensions=self._vectors.dimensions,
+            quantization=str(self._vectors.quantization),
+        )
 
     def get(self, contact_id: ContactId) -> Contact | None:
         try:
             resp = self._client.get(index=self._index, id=str(contact_id))
-            return document_to_contact(resp["_source"])
+            return trusted_document_to_contact(resp["_source"], self._vectors)
         except Exception:
             logger.debug("contact_not_found", contact_id=str(contact_id))
             return None
@@ -34,8 +72,9 @@ class OpenSearchContactRepository:
         self._client.index(
             index=self._index,
             id=str(contact.contact_id),
-            body=doc,
+            body=document_json(doc, self._vectors),
         )
+        self._record_leaderboard([doc])
         logger.info("contact_saved", contact_id=str(contact.contact_id))
 
     def bulk_get(self, contact_ids: list[ContactId]) -> list[Contact]:
@@ -49,46 +88,78 @@ class OpenSearchContactRepository:
         contacts = []
         for doc in resp.get("docs", []):
             if doc.get("found"):
-                contacts.append(document_to_contact(doc["_source"]))
+                contacts.append(trusted_document_to_contact(doc["_source"], self._vectors))
         return contacts
 
-    def bulk_save(self, contacts: list[Contact]) -> None:
-        if not contacts:
-            return
-
-        actions: list[dict[str, Any]] = []
-        for contact in contacts:
-            actions.append({"index": {"_index": self._index, "_id": str(contact.contact_id)}})
-            actions.append(contact_to_document(contact))
-
-        resp = self._client.bulk(body=actions)
-        if resp.get("errors"):
-            failed = [item for item in resp["items"] if item["index"].get("error")]
-            logger.error("bulk_save_errors", count=len(failed))
-        else:
-            logger.info("bulk_save_complete", count=len(contacts))
+    def bulk_save(self, contacts: list[Contact]) -> BulkWriteResult:
+        return self._bulk_index([contact_to_document(c) for c in contacts])
 
-    def bulk_save_batched(self, contacts: list[Contact], batch_size: int = 100) -> None:
+    def bulk_save_batched(self, contacts: list[Contact], batch_size: int = 100) -> BulkWriteResult:
+        # Serializes one batch at a time; the writer still sizes requests by bytes
+        result = BulkWriteResult()
         for i in range(0, len(contacts), batch_size):
-            self.bulk_save(contacts[i : i + batch_size])
+            batch = self.bulk_save(contacts[i : i + batch_size])
+            result.succeeded.extend(batch.succeeded)
+            result.failed.update(batch.failed)
+        return result
 
     def get_top_by_agents(
-        self, agent_ids: list[AgentId], limit: int = 5
+        self, agent_ids: list[AgentId], limit: int = 5, chunk_size: int = 100
     ) -> dict[AgentId, list[Contact]]:
+        # Contacts come back with only the fields a card needs; never save them.
         result: dict[AgentId, list[Contact]] = {}
+        missing = agent_ids
+        if self._leaderboard is not None:
+            try:
+                result = self._leaderboard.get_top_by_agents(agent_ids, limit)
+            except Exception:
+                logger.exception("leaderboard_read_failed", agents=len(agent_ids))
+            missing = [a for a in agent_ids if a not in result]
+            if missing:
+                logger.info("leaderboard_miss", agents=len(missing))
 
-        for agent_id in agent_ids:
-            body: dict[str, Any] = {
-                "query": {"term": {"user_ids": str(agent_id)}},
-                "sort": [{"score": {"order": "desc"}}],
-                "size": limit,
-            }
-            resp = self._client.search(index=self._index, body=body)
-            contacts = [document_to_contact(hit["_source"]) for hit in resp["hits"]["hits"]]
-            result[agent_id] = contacts
+        for i in range(0, len(missing), chunk_size):
+            chunk = missing[i : i + chunk_size]
+            searches: list[dict[str, Any]] = []
+            for agent_id in chunk:
+                searches.append({"index": self._index})
+                searches.append(
+                    {
+                        "query": {"term": {"user_ids": str(agent_id)}},
+                        "sort": [{"score": {"order": "desc"}}],
+                        "size": limit,
+                        "_source": CARD_SOURCE_FIELDS,
+                    }
+                )
+
+            resp = self._client.msearch(body=searches)
+            for agent_id, sub in zip(chunk, resp["responses"], strict=True):
+                if "error" in sub:
+                    # An empty list would read as an agent with no contacts, and the caller
+                    # has already popped its flag; failing the chunk gets it flagged again
+                    logger.error("top_contacts_search_failed", agent_id=str(agent_id))
+                    raise TransportError(sub.get("status", 500), "msearch_failed", sub["error"])
+                sources = [hit["_source"] for hit in sub["hits"]["hits"]]
+                result[agent_id] = [
+                    trusted_document_to_contact(source, self._vectors) for source in sources
+                ]
+                # Refills boards whose members were trimmed, unlinked or evicted; a search
+                # that came back short found all of the agent's contacts
+                self._record_leaderboard(sources, [agent_id] if len(sources) < limit else [])
 
         return result
 
+    def rebuild_leaderboard(self, page_size: int = 1000) -> int:
+        if self._leaderboard is None:
+            raise RuntimeError("No leaderboard configured")
+
+        body: dict[str, Any] = {"query": {"match_all": {}}, "_source": CARD_SOURCE_FIELDS}
+        rebuilt = 0
+        for hits in search_after_pages(self._client, self._index, body, page_size):
+            rebuilt += self._leaderboard.record_documents(hit["_source"] for hit in hits)
+        logger.info("leaderboard_rebuilt", contacts=rebuilt)
+        return rebuilt
+
     def paginate_all(self, page_size: int = 500) -> list[Contact]:
         body: dict[str, Any] = {
             "query": {"match_all": {}},
@@ -96,5 +167,112 @@ class OpenSearchContactRepository:
         }
         contacts = []
         for hit in search_after_paginator(self._client, self._index, body, page_size):
-            contacts.append(document_to_contact(hit["_source"]))
+            contacts.append(trusted_document_to_contact(hit["_source"], self._vectors))
         return contacts
+
+    def iter_pages(
+        self,
+        page_size: int = 500,
+        search_after: list[Any] | None = None,
+        slice_id: int = 0,
+        slice_count: int = 1,
+    ) -> Iterator[tuple[list[Contact], list[Any]]]:
+        body: dict[str, Any] = {
+            "query": self._slice_query(slice_id, slice_count),
+            "sort": [{"_id": "asc"}],
+        }
+        for hits in search_after_pages(self._client, self._index, body, page_size, search_after):
+            contacts = [trusted_document_to_contact(hit["_source"], self._vectors) for hit in hits]
+            yield contacts, hits[-1]["sort"]
+
+    def iter_decay_batches(
+        self,
+        run_id: str,
+        reasons_before: datetime,
+        page_size: int = 500,
+        search_after: list[Any] | None = None,
+        slice_id: int = 0,
+        slice_count: int = 1,
+    ) -> Iterator[tuple[DecayBatch, list[Any]]]:
+        # Only contacts with a score left to decay or reasons left to prune, and
+        # not already written by this run
+        candidates: list[dict[str, Any]] = [
+            {"range": {"score": {"gt": 0.0}}},
+            {
+                "nested": {
+                    "path": "score_reasons",
+                    "query": {
+                        "range": {"score_reasons.timestamp": {"lt": reasons_before.isoformat()}}
+                    },
+                }
+            },
+        ]
+        body: dict[str, Any] = {
+            "query": {
+                "bool": {
+                    "filter": [
+                        self._slice_query(slice_id, slice_count),
+                        {"bool": {"should": candidates, "minimum_should_match": 1}},
+                    ],
+                    "must_not": [{"term": {"decay_run_id": run_id}}],
+                }
+            },
+            "sort": [{"_id": "asc"}],
+            "seq_no_primary_term": True,
+        }
+        for hits in search_after_pages(self._client, self._index, body, page_size, search_after):
+            batch = DocumentDecayBatch(
+                [hit["_source"] for hit in hits],
+                {hit["_id"]: (hit["_seq_no"], hit["_primary_term"]) for hit in hits},
+            )
+            yield batch, hits[-1]["sort"]
+
+    def save_decay_batch(
+        self, batch: DecayBatch, result: DecayKernelResult, run_id: str
+    ) -> BulkWriteResult:
+        if not isinstance(batch, DocumentDecayBatch):
+            raise TypeError(f"Expected DocumentDecayBatch, got {type(batch).__name__}")
+
+        docs = batch.apply(result, run_id, datetime.now(UTC))
+        # Failed contacts keep their old decay_run_id, so a later pass of the run finds them.
+        # Writes are conditional on the version read, so a stale page can't decay twice.
+        return self._bulk_index(docs, batch.versions)
+
+    def _bulk_index(
+        self, docs: list[dict[str, Any]], versions: dict[str, tuple[int, int]] | None = None
+    ) -> BulkWriteResult:
+        result = self._writer.write(docs, versions=versions)
+        if result.succeeded:
+            written = set(result.succeeded)
+            self._record_leaderboard([d for d in docs if d["contact_id"] in written])
+        return result
+
+    def _record_leaderboard(
+        self, docs: list[dict[str, Any]], complete: list[AgentId] | None = None
+    ) -> None:
+        # The leaderboard is a cache; the index write it follows has already succeeded
+        if self._leaderboard is None:
+            return
+        try:
+            if docs:
+                self._leaderboard.record_documents(docs)
+            if complete:
+                self._leaderboard.mark_complete(complete)
+        except Exception:
+            logger.exception("leaderboard_record_failed", contacts=len(docs))
+
+    def _slice_query(self, slice_id: int, slice_count: int) -> dict[str, Any]:
+        if slice_count == 1:
+            return {"match_all": {}}
+
+        lower, upper = slice_bounds(slice_id, slice_count)
+        in_range: dict[str, Any] = {"range": {"slice_bucket": {"gte": lower, "lt": upper}}}
+        if slice_id != 0:
+            return in_range
+        # Documents written before slice_bucket existed are owned by slice 0
+        return {
+            "bool": {
+                "should": [in_range, {"bool": {"must_not": {"exists": {"field": "slice_bucket"}}}}],
+                "minimum_should_match": 1,
+            }
+        }
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+
+from rise_scout.domain.scoring.columnar import DecayBatch, DecayKernelResult
+
+
+def _epoch_seconds(value: str) -> float:
+    return datetime.fromisoformat(value).timestamp()
+
+
+class DocumentDecayBatch(DecayBatch):
+    """Decay batch over raw contact documents, skipping model construction.
+
+    ``versions`` maps contact ids to the ``(seq_no, primary_term)`` each document was read
+    at, so writes can be made conditional on nothing having changed it since.
+    """
+
+    __slots__ = ("documents", "versions")
+
+    def __init__(
+        self,
+        documents: list[dict[str, Any]],
+        versions: dict[str, tuple[int, int]] | None = None,
+    ) -> None:
+        super().__init__(
+            scores=(d.get("score", 0.0) for d in documents),
+            reason_counts=(len(d.get("score_reasons", ())) for d in documents),
+            reason_timestamps=(
+                _epoch_seconds(r["timestamp"])
+                for d in documents
+                for r in d.get("score_reasons", ())
+            ),
+        )
+        self.documents = documents
+        self.versions = versions or {}
+
+    def apply(self, result: DecayKernelResult, run_id: str, now: datetime) -> list[dict[str, Any]]:
+        scores = result.scores.tolist()
+        decayed = result.decayed.tolist()
+        pruned = result.pruned.tolist()
+        keep = result.keep.tolist()
+        offsets = self.reason_offsets.tolist()
+        updated_at = now.isoformat()
+
+        changed = []
+        for i in np.flatnonzero(result.changed).tolist():
+            doc = self.documents[i]
+            # A search that hasn't caught up with this run's writes can return them again
+            if doc.get("decay_run_id") == run_id:
+                continue
+            if decayed[i]:
+                doc["score"] = scores[i]
+                doc["updated_at"] = updated_at
+            if pruned[i]:
+                kept = keep[offsets[i] : offsets[i + 1]]
+                doc["score_reasons"] = [
+                    r for r, k in zip(doc["score_reasons"], kept, strict=True) if k
+                ]
+            doc["decay_run_id"] = run_id
+            changed.append(doc)
+        return changed
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import copy
+import json
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from rise_scout.infrastructure.opensearch.vectors import FLOAT_VECTORS, VectorFormat
+
+DEFAULT_MAPPINGS_PATH = Path(__file__).resolve().parents[4] / "config" / "opensearch_mappings.json"
+
+
+def load_index_body(name: str, path: Path | None = None) -> dict[str, Any]:
+    return copy.deepcopy(_load(path or DEFAULT_MAPPINGS_PATH)[name])
+
+
+def contacts_index_body(
+    vectors: VectorFormat = FLOAT_VECTORS, path: Path | None = None
+) -> dict[str, Any]:
+    body = load_index_body("contacts", path)
+    properties = body["mappings"]["properties"]
+    properties["embedding_vector"] = vectors.mapping(properties["embedding_vector"])
+    return body
+
+
+@cache
+def _load(path: Path) -> dict[str, Any]:
+    with open(path) as f:
+        data: dict[str, Any] = json.load(f)
+    return data
@@ -9,17 +9,16 @@ from opensearchpy import OpenSearch
 logger = structlog.get_logger()
 
 
-def search_after_paginator(
+def search_after_pages(
     client: OpenSearch,
     index: str,
     body: dict[str, Any],
     page_size: int = 500,
-) -> Iterator[dict[str, Any]]:
+    search_after: list[Any] | None = None,
+) -> Iterator[list[dict[str, Any]]]:
     body["size"] = page_size
     body.setdefault("sort", [{"_id": "asc"}])
 
-    search_after: list[Any] | None = None
-
     while True:
         if search_after is not None:
             body["search_after"] = search_after
@@ -30,7 +29,17 @@ def search_after_paginator(
         if not hits:
             break
 
-        yield from hits
+        yield hits
 
         search_after = hits[-1]["sort"]
         logger.debug("search_after_page", index=index, count=len(hits))
+
+
+def search_after_paginator(
+    client: OpenSearch,
+    index: str,
+    body: dict[str, Any],
+    page_size: int = 500,
+) -> Iterator[dict[str, Any]]:
+    for hits in search_after_pages(client, index, body, page_size):
+        yield from hits
@@ -1,9 +1,23 @@
 from __future__ import annotations
 
-from typing import Any
+import json
+from array import array
+from datetime import UTC, datetime
+from typing import Any, TypeVar
 
-from rise_scout.domain.contact.models import Contact, Preferences, ScoreReason
+from pydantic import BaseModel
+
+from rise_scout.domain.contact.models import Contact, Preferences, PropertyType, ScoreReason
+from rise_scout.domain.embeddings.vector import Float32Array
+from rise_scout.domain.scoring.slicing import slice_bucket
 from rise_scout.domain.shared.types import AgentId, ContactId, ListingId, MlsId
+from rise_scout.infrastructure.opensearch.vectors import FLOAT_VECTORS, VectorFormat
+
+M = TypeVar("M", bound=BaseModel)
+
+_FIELDS_SET: dict[type[BaseModel], set[str]] = {
+    cls: set(cls.model_fields) for cls in (Contact, Preferences, ScoreReason)
+}
 
 
 def contact_to_document(contact: Contact) -> dict[str, Any]:
@@ -16,21 +30,24 @@ def contact_to_document(contact: Contact) -> dict[str, Any]:
         "last_name": contact.last_name,
         "email": contact.email,
         "phone": contact.phone,
-        "preferences": contact.preferences.model_dump(),
+        "preferences": _preferences_to_dict(contact.preferences),
         "watched_listings": [str(lid) for lid in contact.watched_listings],
         "score": contact.score,
-        "score_reasons": [r.model_dump(mode="json") for r in contact.score_reasons],
+        "score_reasons": _reasons_to_dicts(contact),
         "last_interaction_at": (
             contact.last_interaction_at.isoformat() if contact.last_interaction_at else None
         ),
         "updated_at": contact.updated_at.isoformat(),
+        "decay_run_id": contact.decay_run_id,
+        "slice_bucket": slice_bucket(str(contact.contact_id)),
     }
     if contact.embedding_vector is not None:
         doc["embedding_vector"] = contact.embedding_vector
     return doc
 
 
-def document_to_contact(doc: dict[str, Any]) -> Contact:
+def document_to_contact(doc: dict[str, Any], vectors: VectorFormat = FLOAT_VECTORS) -> Contact:
+    """Validates every field; use for documents that didn't come from contact_to_document."""
     kwargs: dict[str, Any] = {
         "contact_id": ContactId(doc["contact_id"]),
         "user_ids": [AgentId(uid) for uid in doc.get("user_ids", [])],
@@ -44,9 +61,153 @@ def document_to_contact(doc: dict[str, Any]) -> Contact:
         "watched_listings": [ListingId(lid) for lid in doc.get("watched_listings", [])],
         "score": doc.get("score", 0.0),
         "score_reasons": [ScoreReason.model_validate(r) for r in doc.get("score_reasons", [])],
-        "embedding_vector": doc.get("embedding_vector"),
+        "embedding_vector": _trusted_vector(doc.get("embedding_vector"), vectors),
         "last_interaction_at": doc.get("last_interaction_at"),
+        "decay_run_id": doc.get("decay_run_id"),
     }
     if "updated_at" in doc:
         kwargs["updated_at"] = doc["updated_at"]
     return Contact(**kwargs)
+
+
+def trusted_document_to_contact(
+    doc: dict[str, Any], vectors: VectorFormat = FLOAT_VECTORS
+) -> Contact:
+    """Builds the models without validation, for documents written by contact_to_document.
+
+    Only the types JSON loses are restored: datetimes, property types and the nested models.
+    """
+    prefs = doc.get("preferences") or {}
+    if prefs.keys() >= _FIELDS_SET[Preferences]:
+        preferences = _construct(
+            Preferences,
+            {
+                **prefs,
+                "property_types": [PropertyType(t) for t in prefs["property_types"]],
+                "zip_codes": list(prefs["zip_codes"]),
+                "cities": list(prefs["cities"]),
+                "keywords": list(prefs["keywords"]),
+            },
+        )
+    else:
+        # Partial projections are rare enough to take the validated path
+        preferences = Preferences.model_validate(prefs)
+    last_interaction_at = doc.get("last_interaction_at")
+    updated_at = doc.get("updated_at")
+
+    return _construct(
+        Contact,
+        {
+            "contact_id": ContactId(doc["contact_id"]),
+            "user_ids": list(doc.get("user_ids", ())),
+            "organisationalunit_id": doc.get("organisationalunit_id"),
+            "mls_ids": list(doc.get("mls_ids", ())),
+            "first_name": doc.get("first_name", ""),
+            "last_name": doc.get("last_name", ""),
+            "email": doc.get("email"),
+            "phone": doc.get("phone"),
+            "preferences": preferences,
+            "watched_listings": list(doc.get("watched_listings", ())),
+            "score": float(doc.get("score", 0.0)),
+            "score_reasons": _trusted_reasons(doc.get("score_reasons", ())),
+            "embedding_vector": _trusted_vector(doc.get("embedding_vector"), vectors),
+            "decay_run_id": doc.get("decay_run_id"),
+            "last_interaction_at": (
+                datetime.fromisoformat(last_interaction_at) if last_interaction_at else None
+            ),
+            "updated_at": datetime.fromisoformat(updated_at) if updated_at else datetime.now(UTC),
+        },
+        private={"_pending_events": []},
+    )
+
+
+def _construct(model: type[M], values: dict[str, Any], private: dict[str, Any] | None = None) -> M:
+    # What model_construct does once it has the values, minus its per-field default handling,
+    # which costs more than pydantic-core's validation for models this small
+    obj = object.__new__(model)
+    object.__setattr__(obj, "__dict__", values)
+    # Assignment adds to the fields set, so each instance gets its own
+    object.__setattr__(obj, "__pydantic_fields_set__", _FIELDS_SET[model].copy())
+    object.__setattr__(obj, "__pydantic_extra__", None)
+    object.__setattr__(obj, "__pydantic_private__", private)
+    return obj
+
+
+def _trusted_reasons(raw: list[dict[str, Any]]) -> list[ScoreReason]:
+    # Up to 50 per contact, so _construct is inlined with its lookups bound locally
+    new, setattr_, parse = object.__new__, object.__setattr__, datetime.fromisoformat
+    fields_set = _FIELDS_SET[ScoreReason]
+    reasons = []
+    for r in raw:
+        reason = new(ScoreReason)
+        setattr_(
+            reason,
+            "__dict__",
+            {
+                "signal": r["signal"],
+                "points": r["points"],
+                "category": r["category"],
+                "detail": r["detail"],
+                "timestamp": parse(r["timestamp"]),
+            },
+        )
+        setattr_(reason, "__pydantic_fields_set__", fields_set.copy())
+        setattr_(reason, "__pydantic_extra__", None)
+        setattr_(reason, "__pydantic_private__", None)
+        reasons.append(reason)
+    return reasons
+
+
+def document_json(doc: dict[str, Any], vectors: VectorFormat = FLOAT_VECTORS) -> str:
+    """Encodes a document for indexing, writing float32 vectors without going through floats.
+
+    Vectors are written at the precision the index keeps them; for float32 that is nine
+    significant digits, about 40% less text than the 17-digit repr of each value widened
+    to a double, in half the encoding time.
+    """
+    keys = [k for k, v in doc.items() if isinstance(v, array)]
+    if not keys:
+        return json.dumps(doc)
+    text = json.dumps({k: v for k, v in doc.items() if k not in keys})
+    packed = ", ".join(f'"{k}": {vectors.encode(doc[k])}' for k in keys)
+    return f"{text[:-1]}, {packed}}}" if len(text) > 2 else f"{{{packed}}}"
+
+
+def _trusted_vector(values: list[float] | None, vectors: VectorFormat) -> Float32Array | None:
+    return vectors.decode(values) if values is not None else None
+
+
+def _reasons_to_dicts(contact: Contact) -> list[dict[str, Any]]:
+    return [
+        {
+            "signal": r.signal,
+            "points": r.points,
+            "category": r.category,
+            "detail": r.detail,
+            "timestamp": _json_datetime(r.timestamp),
+        }
+        for r in contact.score_reasons
+    ]
+
+
+def _preferences_to_dict(prefs: Preferences) -> dict[str, Any]:
+    return {
+        "price_min": prefs.price_min,
+        "price_max": prefs.price_max,
+        "beds_min": prefs.beds_min,
+        "beds_max": prefs.beds_max,
+        "baths_min": prefs.baths_min,
+        "baths_max": prefs.baths_max,
+        "sqft_min": prefs.sqft_min,
+        "sqft_max": prefs.sqft_max,
+        "property_types": list(prefs.property_types),
+        "zip_codes": list(prefs.zip_codes),
+        "cities": list(prefs.cities),
+        "keywords": list(prefs.keywords),
+    }
+
+
+def _json_datetime(value: datetime) -> str:
+    # Same text as pydantic's JSON mode, which earlier documents were written with
+    text = value.isoformat()
+    return text[:-6] + "Z" if text.endswith("+00:00") else text
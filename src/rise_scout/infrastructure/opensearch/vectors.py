@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import math
+from array import array
+from enum import StrEnum
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from rise_scout.domain.embeddings.vector import Float32Array, to_float32
+
+# Unit vectors have components of about 1/sqrt(d); byte quantization clips at this many
+BYTE_CLIP_SIGMAS = 4.0
+
+
+class VectorQuantization(StrEnum):
+    # float32 on nmslib, as the index was first mapped
+    FLOAT = "float"
+    # float32 sent, stored at 2 bytes per dimension by faiss's scalar quantizer
+    FP16 = "fp16"
+    # int8 per dimension, quantized here before indexing
+    BYTE = "byte"
+
+
+class VectorFormat(BaseModel):
+    """How contact embeddings are mapped, sent and read back for the kNN index."""
+
+    model_config = {"frozen": True}
+
+    dimensions: int = Field(default=1024, gt=0)
+    quantization: VectorQuantization = VectorQuantization.FLOAT
+
+    @property
+    def bytes_per_dimension(self) -> int:
+        return {VectorQuantization.FLOAT: 4, VectorQuantization.FP16: 2}.get(self.quantization, 1)
+
+    @property
+    def byte_scale(self) -> float:
+        return 127 * math.sqrt(self.dimensions) / BYTE_CLIP_SIGMAS
+
+    def mapping(self, base: dict[str, Any]) -> dict[str, Any]:
+        """The knn_vector field for this format, keeping the HNSW parameters from ``base``."""
+        parameters = dict(base["method"].get("parameters", {}))
+        if self.quantization is VectorQuantization.FLOAT:
+            method = {**base["method"], "parameters": parameters}
+            return {**base, "dimension": self.dimensions, "method": method}
+
+        if self.quantization is VectorQuantization.FP16:
+            parameters["encoder"] = {"name": "sq", "parameters": {"type": "fp16"}}
+        field: dict[str, Any] = {
+            "type": "knn_vector",
+            "dimension": self.dimensions,
+            # Titan vectors are unit length, where inner product ranks like cosine
+            "method": {
+                "name": "hnsw",
+                "space_type": "innerproduct",
+                "engine": "faiss",
+                "parameters": parameters,
+            },
+        }
+        if self.quantization is VectorQuantization.BYTE:
+            field["data_type"] = "byte"
+        return field
+
+    def encode(self, vector: Float32Array) -> str:
+        """The vector as JSON array text, at the precision the index keeps."""
+        if self.quantization is VectorQuantization.BYTE:
+            scale = self.byte_scale
+            values = ", ".join(str(max(-128, min(127, round(x * scale)))) for x in vector)
+        else:
+            # Nine significant digits read back as the same float32, five as the same fp16
+            fmt = "{:.9g}" if self.quantization is VectorQuantization.FLOAT else "{:.5g}"
+            values = ", ".join(map(fmt.format, vector))
+        return f"[{values}]"
+
+    def decode(self, values: list[float]) -> Float32Array:
+        if self.quantization is VectorQuantization.BYTE:
+            scale = self.byte_scale
+            return array("f", (v / scale for v in values))
+        return to_float32(values)
+
+
+# The index's original mapping, and the default wherever no format is configured
+FLOAT_VECTORS = VectorFormat()
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import os
+import time
+import uuid
+from typing import TYPE_CHECKING, Any
+
+import structlog
+from redis.exceptions import ResponseError
+
+from rise_scout.domain.shared.events import ContactScored
+
+if TYPE_CHECKING:
+    import redis
+
+logger = structlog.get_logger()
+
+STREAM_KEY = "rise_scout:contact_scored"
+CONSUMER_GROUP = "card_refresh"
+
+
+class RedisContactEventStream:
+    def __init__(
+        self,
+        client: redis.Redis[bytes],
+        consumer: str | None = None,
+        maxlen: int = 100_000,
+        claim_idle_ms: int = 60_000,
+    ) -> None:
+        self._client = client
+        self._consumer = consumer or f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._maxlen = maxlen
+        self._claim_idle_ms = claim_idle_ms
+        self._group_ready = False
+        self._next_claim = 0.0
+
+    def publish(self, events: list[ContactScored]) -> None:
+        if not events:
+            return
+        pipe = self._client.pipeline(transaction=False)
+        for event in events:
+            pipe.xadd(
+                STREAM_KEY,
+                {"event": event.model_dump_json()},
+                maxlen=self._maxlen,
+                approximate=True,
+            )
+        pipe.execute()
+        logger.debug("contact_events_published", count=len(events))
+
+    def read(self, count: int = 100, block_ms: int = 1000) -> list[tuple[str, ContactScored]]:
+        self._ensure_group()
+        now = time.monotonic()
+        if now >= self._next_claim:
+            # Pick up messages a dead consumer read but never acknowledged; a warm
+            # container checks again once more of them could have gone idle
+            _, messages, *_ = self._client.xautoclaim(
+                STREAM_KEY, CONSUMER_GROUP, self._consumer, self._claim_idle_ms, count=count
+            )
+            # A full page may mean more are waiting, so look again on the next read
+            self._next_claim = now if len(messages) >= count else now + self._claim_idle_ms / 1000
+            if messages:
+                logger.info("contact_events_reclaimed", count=len(messages))
+                return self._decode(messages)
+
+        resp = self._client.xreadgroup(
+            CONSUMER_GROUP, self._consumer, {STREAM_KEY: ">"}, count=count, block=block_ms
+        )
+        return self._decode(resp[0][1]) if resp else []
+
+    def ack(self, message_ids: list[str]) -> None:
+        if message_ids:
+            self._client.xack(STREAM_KEY, CONSUMER_GROUP, *message_ids)
+
+    def _ensure_group(self) -> None:
+        if self._group_ready:
+            return
+        try:
+            self._client.xgroup_create(STREAM_KEY, CONSUMER_GROUP, id="$", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._group_ready = True
+
+    def _decode(self, messages: list[Any]) -> list[tuple[str, ContactScored]]:
+        return [
+            (message_id.decode(), ContactScored.model_validate_json(fields[b"event"]))
+            for message_id, fields in messages
+            if fields
+        ]
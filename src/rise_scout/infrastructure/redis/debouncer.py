@@ -23,3 +23,19 @@ class EventDebouncer:
             return True
         logger.debug("debounce_skip", key=key)
         return False
+
+    def seen_many(self, keys: list[str]) -> dict[str, bool]:
+        """Which keys are set, without setting any."""
+        unique = list(dict.fromkeys(keys))
+        if not unique:
+            return {}
+        values = self._client.mget([f"{self._prefix}:{key}" for key in unique])
+        return {key: v is not None for key, v in zip(unique, values, strict=True)}
+
+    def mark_many(self, keys: list[str], ttl_seconds: int = 60) -> None:
+        if not keys:
+            return
+        pipe = self._client.pipeline(transaction=False)
+        for key in dict.fromkeys(keys):
+            pipe.set(f"{self._prefix}:{key}", "1", ex=ttl_seconds)
+        pipe.execute()
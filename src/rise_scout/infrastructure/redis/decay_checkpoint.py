@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import structlog
+from redis.exceptions import WatchError
+
+from rise_scout.domain.scoring.checkpoint import DecayCheckpoint, checkpoint_key
+from rise_scout.domain.shared.exceptions import LeaseLostError
+
+if TYPE_CHECKING:
+    import redis
+
+logger = structlog.get_logger()
+
+CHECKPOINT_PREFIX = "rise_scout:decay_checkpoint"
+
+
+class DecayCheckpointStore:
+    def __init__(self, client: redis.Redis[bytes], ttl_seconds: int = 2 * 86400) -> None:
+        self._client = client
+        self._ttl = ttl_seconds
+
+    def load(self, run_id: str, slice_id: int = 0, slice_count: int = 1) -> DecayCheckpoint | None:
+        key = checkpoint_key(run_id, slice_id, slice_count)
+        raw = self._client.get(f"{CHECKPOINT_PREFIX}:{key}")
+        if raw is None:
+            return None
+        return DecayCheckpoint.model_validate_json(raw)
+
+    def save(self, checkpoint: DecayCheckpoint) -> None:
+        key = f"{CHECKPOINT_PREFIX}:{checkpoint.key}"
+        with self._client.pipeline() as pipe:
+            try:
+                pipe.watch(key)
+                raw = pipe.get(key)
+                # A holder with a newer lease has taken over this run
+                if raw is not None and DecayCheckpoint.model_validate_json(raw).fence > (
+                    checkpoint.fence
+                ):
+                    pipe.unwatch()
+                    raise LeaseLostError(checkpoint.key, checkpoint.fence)
+                pipe.multi()
+                pipe.set(key, checkpoint.model_dump_json(), ex=self._ttl)
+                pipe.execute()
+            except WatchError:
+                raise LeaseLostError(checkpoint.key, checkpoint.fence) from None
+        logger.debug(
+            "decay_checkpoint_saved",
+            key=checkpoint.key,
+            scanned=checkpoint.scanned,
+            completed=checkpoint.completed,
+        )
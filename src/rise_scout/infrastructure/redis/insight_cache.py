@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import structlog
+
+from rise_scout.domain.cards.insight_cache import CachedInsight
+
+if TYPE_CHECKING:
+    import redis
+
+logger = structlog.get_logger()
+
+INSIGHT_PREFIX = "rise_scout:insight"
+
+
+class RedisInsightCache:
+    def __init__(self, client: redis.Redis[bytes], ttl_seconds: int = 7 * 86400) -> None:
+        self._client = client
+        self._ttl = ttl_seconds
+
+    def get_many(self, keys: list[str]) -> dict[str, CachedInsight]:
+        if not keys:
+            return {}
+        values = self._client.mget([f"{INSIGHT_PREFIX}:{k}" for k in keys])
+        return {
+            key: CachedInsight.model_validate_json(raw)
+            for key, raw in zip(keys, values, strict=True)
+            if raw is not None
+        }
+
+    def set_many(self, entries: dict[str, CachedInsight]) -> None:
+        if not entries:
+            return
+        pipe = self._client.pipeline(transaction=False)
+        for key, entry in entries.items():
+            pipe.set(f"{INSIGHT_PREFIX}:{key}", entry.model_dump_json(), ex=self._ttl)
+        pipe.execute()
+        logger.debug("insights_cached", count=len(entries))
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from rise_scout.domain.contact.models import Contact
+from rise_scout.domain.shared.types import AgentId
+from rise_scout.infrastructure.opensearch.serializers import trusted_document_to_contact
+
+if TYPE_CHECKING:
+    import redis
+
+logger = structlog.get_logger()
+
+LEADERBOARD_PREFIX = "rise_scout:top"
+PROJECTION_PREFIX = "rise_scout:top_contact"
+PROJECTION_FIELDS = ("contact_id", "user_ids", "first_name", "last_name", "score")
+PROJECTION_REASONS = 5
+# Marks a board known to hold every contact of its agent, so short boards are still served
+COMPLETE_PREFIX = "rise_scout:top_complete"
+COMPLETE_TTL_SECONDS = 3600
+
+
+class RedisContactLeaderboard:
+    """Per-agent top-K contacts by score, kept current on every contact write.
+
+    Projections don't expire: a ZSET member without one would hide the agent's real top
+    contacts. Members are removed when their contact is unlinked from the agent, and
+    any found stale on read are dropped then. A board with fewer than ``limit`` members
+    is only served while marked complete, for an hour after a search found it whole.
+    """
+
+    def __init__(self, client: redis.Redis[bytes], size: int = 10) -> None:
+        self._client = client
+        self._size = size
+
+    def record_documents(self, documents: Iterable[dict[str, Any]]) -> int:
+        docs = list(documents)
+        if not docs:
+            return 0
+
+        # Agents a contact was linked to before this write, to drop it from their boards
+        previous = self._client.mget([f"{PROJECTION_PREFIX}:{d['contact_id']}" for d in docs])
+        pipe = self._client.pipeline(transaction=False)
+        for doc, old in zip(docs, previous, strict=True):
+            contact_id = doc["contact_id"]
+            user_ids = doc.get("user_ids", [])
+            if old is not None and "user_ids" in doc:
+                for agent_id in set(json.loads(old).get("user_ids", [])) - set(user_ids):
+                    pipe.zrem(f"{LEADERBOARD_PREFIX}:{agent_id}", contact_id)
+            projection = {f: doc[f] for f in PROJECTION_FIELDS if f in doc}
+            projection["score_reasons"] = doc.get("score_reasons", [])[:PROJECTION_REASONS]
+            pipe.set(f"{PROJECTION_PREFIX}:{contact_id}", json.dumps(projection))
+            for agent_id in user_ids:
+                key = f"{LEADERBOARD_PREFIX}:{agent_id}"
+                pipe.zadd(key, {contact_id: doc.get("score", 0.0)})
+                pipe.zremrangebyrank(key, 0, -(self._size + 1))
+        pipe.execute()
+        return len(docs)
+
+    def mark_complete(self, agent_ids: Iterable[AgentId]) -> None:
+        """Record that the boards of ``agent_ids`` hold all of their agents' contacts."""
+        pipe = self._client.pipeline(transaction=False)
+        for agent_id in agent_ids:
+            pipe.set(f"{COMPLETE_PREFIX}:{agent_id}", 1, ex=COMPLETE_TTL_SECONDS)
+        pipe.execute()
+
+    def get_top_by_agents(
+        self, agent_ids: list[AgentId], limit: int = 5
+    ) -> dict[AgentId, list[Contact]]:
+        # Agents with fewer than limit resolvable contacts on an incomplete board are left
+        # out, so callers fall back to the index; trimmed contacts never come back otherwise
+        if not agent_ids:
+            return {}
+
+        pipe = self._client.pipeline(transaction=False)
+        for agent_id in agent_ids:
+            pipe.zrevrange(f"{LEADERBOARD_PREFIX}:{agent_id}", 0, self._size - 1)
+        pipe.mget([f"{COMPLETE_PREFIX}:{agent_id}" for agent_id in agent_ids])
+        *boards, markers = pipe.execute()
+        complete = {a for a, marker in zip(agent_ids, markers, strict=True) if marker}
+        ranked: dict[AgentId, list[str]] = {
+            agent_id: [m.decode() for m in members]
+            for agent_id, members in zip(agent_ids, boards, strict=True)
+            if members or agent_id in complete
+        }
+
+        contact_ids = list({cid for ids in ranked.values() for cid in ids})
+        contacts: dict[str, Contact] = {}
+        if contact_ids:
+            raw = self._client.mget([f"{PROJECTION_PREFIX}:{cid}" for cid in contact_ids])
+            for cid, value in zip(contact_ids, raw, strict=True):
+                if value is not None:
+                    contacts[cid] = trusted_document_to_contact(json.loads(value))
+
+        result: dict[AgentId, list[Contact]] = {}
+        stale: dict[AgentId, list[str]] = {}
+        for agent_id, ids in ranked.items():
+            # The projection is authoritative for which agents a contact belongs to
+            top = []
+            for cid in ids:
+                if cid in contacts and agent_id in contacts[cid].user_ids:
+                    top.append(contacts[cid])
+                else:
+                    stale.setdefault(agent_id, []).append(cid)
+                    # An unlinked contact leaves the board whole; a lost projection doesn't
+                    if cid not in contacts:
+                        complete.discard(agent_id)
+            if len(top) >= limit or agent_id in complete:
+                result[agent_id] = top[:limit]
+
+        if stale:
+            pipe = self._client.pipeline(transaction=False)
+            for agent_id, cids in stale.items():
+                pipe.zrem(f"{LEADERBOARD_PREFIX}:{agent_id}", *cids)
+                if agent_id not in complete:
+                    pipe.delete(f"{COMPLETE_PREFIX}:{agent_id}")
+            pipe.execute()
+            logger.info("leaderboard_stale_members_removed", agents=len(stale))
+        return result
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+import structlog
+from redis.exceptions import RedisError, WatchError
+
+if TYPE_CHECKING:
+    import redis
+
+logger = structlog.get_logger()
+
+LEASE_PREFIX = "rise_scout:lease"
+# Fence counters outlive their leases by this long; heartbeats keep extending it
+FENCE_TTL_MS = 24 * 60 * 60 * 1000
+
+
+class RedisLease:
+    """A held lease, renewed by a heartbeat thread until released or lost."""
+
+    def __init__(self, client: redis.Redis[bytes], name: str, fence: int, ttl_ms: int) -> None:
+        self._client = client
+        self._name = name
+        self._key = f"{LEASE_PREFIX}:{name}"
+        self._fence_key = _fence_key(name)
+        self._fence = fence
+        self._ttl_ms = ttl_ms
+        self._lost = False
+        self._stop = threading.Event()
+        self._heartbeat = threading.Thread(target=self._renew_loop, daemon=True)
+        self._heartbeat.start()
+
+    @property
+    def fence(self) -> int:
+        return self._fence
+
+    @property
+    def lost(self) -> bool:
+        return self._lost
+
+    def release(self) -> None:
+        self._stop.set()
+        self._heartbeat.join()
+        if not self._lost:
+            self._compare_and(lambda pipe: pipe.delete(self._key))
+        logger.info("lease_released", name=self._name, fence=self._fence)
+
+    def __enter__(self) -> RedisLease:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.release()
+
+    def _renew_loop(self) -> None:
+        renewed_at = time.monotonic()
+        while not self._stop.wait(self._ttl_ms / 3000):
+            try:
+                held = self._compare_and(self._renew)
+            except RedisError as e:
+                # The key may still be ours; only once it must have expired is the lease gone
+                logger.warning("lease_renew_failed", name=self._name, error=str(e))
+                if (time.monotonic() - renewed_at) * 1000 < self._ttl_ms:
+                    continue
+                held = False
+            if not held:
+                self._lost = True
+                logger.warning("lease_lost", name=self._name, fence=self._fence)
+                return
+            renewed_at = time.monotonic()
+
+    def _renew(self, pipe: Any) -> None:
+        pipe.pexpire(self._key, self._ttl_ms)
+        pipe.pexpire(self._fence_key, FENCE_TTL_MS)
+
+    def _compare_and(self, action: Callable[[Any], object]) -> bool:
+        with self._client.pipeline() as pipe:
+            try:
+                pipe.watch(self._key)
+                if pipe.get(self._key) != str(self._fence).encode():
+                    pipe.unwatch()
+                    return False
+                pipe.multi()
+                action(pipe)
+                pipe.execute()
+            except WatchError:
+                return False
+        return True
+
+
+class RedisLeaseService:
+    def __init__(self, client: redis.Redis[bytes]) -> None:
+        self._client = client
+
+    def acquire(self, name: str, ttl_ms: int) -> RedisLease | None:
+        # Every attempt draws a new fence, so a later holder always outranks an earlier one
+        pipe = self._client.pipeline()
+        pipe.incr(_fence_key(name))
+        pipe.pexpire(_fence_key(name), FENCE_TTL_MS)
+        fence = int(pipe.execute()[0])
+        if not self._client.set(f"{LEASE_PREFIX}:{name}", str(fence), nx=True, px=ttl_ms):
+            logger.info("lease_held_elsewhere", name=name)
+            return None
+        logger.info("lease_acquired", name=name, fence=fence)
+        return RedisLease(self._client, name, fence, ttl_ms)
+
+
+def _fence_key(name: str) -> str:
+    return f"{LEASE_PREFIX}:{name}:fence"
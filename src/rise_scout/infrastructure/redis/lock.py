@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import uuid
+from typing import TYPE_CHECKING
+
+import structlog
+from redis.exceptions import WatchError
+
+if TYPE_CHECKING:
+    import redis
+
+logger = structlog.get_logger()
+
+
+class RedisLock:
+    def __init__(self, client: redis.Redis[bytes], prefix: str = "rise_scout:lock") -> None:
+        self._client = client
+        self._prefix = prefix
+
+    def acquire(self, name: str, ttl_ms: int) -> str | None:
+        token = uuid.uuid4().hex
+        if self._client.set(f"{self._prefix}:{name}", token, nx=True, px=ttl_ms):
+            logger.debug("lock_acquired", name=name)
+            return token
+        return None
+
+    def release(self, name: str, token: str) -> bool:
+        # Compare-and-delete so an expired holder never frees a lock someone else now owns
+        key = f"{self._prefix}:{name}"
+        with self._client.pipeline() as pipe:
+            try:
+                pipe.watch(key)
+                if pipe.get(key) != token.encode():
+                    pipe.unwatch()
+                    logger.warning("lock_lost", name=name)
+                    return False
+                pipe.multi()
+                pipe.delete(key)
+                pipe.execute()
+            except WatchError:
+                logger.warning("lock_lost", name=name)
+                return False
+        return True
+
+    def is_locked(self, name: str) -> bool:
+        return bool(self._client.exists(f"{self._prefix}:{name}"))
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+import structlog
+
+from rise_scout.domain.shared.exceptions import RateLimitExceededError
+
+if TYPE_CHECKING:
+    import redis
+
+logger = structlog.get_logger()
+
+BUCKET_PREFIX = "rise_scout:rate"
+
+# Refills the bucket from Redis server time, then reserves `cost` tokens. A caller that
+# has to wait keeps its reservation and sleeps for the returned milliseconds, so waiting
+# callers are served in arrival order. Returns -1 without reserving when the wait would
+# exceed the caller's limit.
+TOKEN_BUCKET_LUA = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local max_wait_ms = tonumber(ARGV[4])
+
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + (now - ts) * rate / 1000)
+
+local wait_ms = 0
+if tokens < cost then
+  wait_ms = math.ceil((cost - tokens) * 1000 / rate)
+  if wait_ms > max_wait_ms then
+    return -1
+  end
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens - cost), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity * 1000 / rate) + wait_ms + 1000)
+return wait_ms
+"""
+
+
+class RedisTokenBucket:
+    def __init__(
+        self,
+        client: redis.Redis[bytes],
+        name: str,
+        rate_per_second: float,
+        capacity: float,
+        max_wait_ms: int = 5_000,
+    ) -> None:
+        self._key = f"{BUCKET_PREFIX}:{name}"
+        self._name = name
+        self._rate = rate_per_second
+        self._capacity = capacity
+        self._max_wait_ms = max_wait_ms
+        self._script = client.register_script(TOKEN_BUCKET_LUA)
+
+    def acquire(self, cost: float = 1.0) -> None:
+        wait_ms = int(
+            self._script(
+                keys=[self._key],
+                args=[self._rate, self._capacity, cost, self._max_wait_ms],
+            )
+        )
+        if wait_ms < 0:
+            logger.warning("rate_limit_exceeded", bucket=self._name)
+            raise RateLimitExceededError(self._name, self._max_wait_ms)
+        if wait_ms:
+            logger.debug("rate_limit_wait", bucket=self._name, wait_ms=wait_ms)
+            time.sleep(wait_ms / 1000)
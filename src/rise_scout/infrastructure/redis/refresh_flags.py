@@ -11,24 +11,64 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger()
 
-REFRESH_KEY = "rise_scout:refresh_flags"
+# Sorted set of agent id -> accumulated refresh priority
+REFRESH_KEY = "rise_scout:refresh_queue"
+# Plain set the flags lived in before they had priorities
+LEGACY_REFRESH_KEY = "rise_scout:refresh_flags"
+LEGACY_PRIORITY = 1.0
+
+# Moves up to ARGV[1] legacy flags into the queue atomically, so none are lost in between
+MIGRATE_LEGACY_LUA = """
+local members = redis.call('SPOP', KEYS[1], ARGV[1])
+for _, member in ipairs(members) do
+  redis.call('ZINCRBY', KEYS[2], ARGV[2], member)
+end
+return #members
+"""
 
 
 class RefreshFlagStore:
-    def __init__(self, client: redis.Redis[bytes]) -> None:
+    def __init__(self, client: redis.Redis[bytes], migrate_batch: int = 1000) -> None:
         self._client = client
+        self._migrate_batch = migrate_batch
+        self._migrate = client.register_script(MIGRATE_LEGACY_LUA)
+        self._legacy_drained = False
 
-    def flag_agents(self, agent_ids: list[AgentId]) -> None:
-        if not agent_ids:
+    def flag_agents(self, priorities: dict[AgentId, float]) -> None:
+        if not priorities:
             return
-        self._client.sadd(REFRESH_KEY, *[str(aid) for aid in agent_ids])
-        logger.debug("agents_flagged", count=len(agent_ids))
+        pipe = self._client.pipeline(transaction=False)
+        for agent_id, priority in priorities.items():
+            pipe.zincrby(REFRESH_KEY, priority, str(agent_id))
+        pipe.execute()
+        logger.debug("agents_flagged", count=len(priorities))
 
-    def pop_flagged_agents(self) -> list[AgentId]:
-        members: set[bytes] = self._client.smembers(REFRESH_KEY)
+    def pop_flagged_agents(self, limit: int = 100) -> dict[AgentId, float]:
+        """Removes up to ``limit`` agents, most urgent first, with their priorities."""
+        if not self._legacy_drained:
+            self._drain_legacy()
+        # ZPOPMAX removes atomically and hands out the most urgent agents first
+        members: list[tuple[bytes, float]] = self._client.zpopmax(REFRESH_KEY, limit)
         if not members:
-            return []
-        self._client.delete(REFRESH_KEY)
-        agent_ids = [AgentId(m.decode()) for m in members]
-        logger.info("flagged_agents_popped", count=len(agent_ids))
-        return agent_ids
+            return {}
+        popped = {AgentId(m.decode()): priority for m, priority in members}
+        logger.info("flagged_agents_popped", count=len(popped), top_priority=members[0][1])
+        return popped
+
+    def unflag_agents(self, agent_ids: list[AgentId]) -> None:
+        # For agents whose cards were rebuilt another way since they were flagged
+        if agent_ids:
+            self._client.zrem(REFRESH_KEY, *(str(a) for a in agent_ids))
+
+    def _drain_legacy(self) -> None:
+        # Flags set before the queue existed; once empty, nothing writes there again
+        migrated = 0
+        while moved := int(
+            self._migrate(
+                keys=[LEGACY_REFRESH_KEY, REFRESH_KEY], args=[self._migrate_batch, LEGACY_PRIORITY]
+            )
+        ):
+            migrated += moved
+        if migrated:
+            logger.info("legacy_refresh_flags_migrated", count=migrated)
+        self._legacy_drained = True
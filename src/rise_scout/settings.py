@@ -11,16 +11,51 @@ class Settings(BaseSettings):
     aoss_endpoint: str = ""
     contacts_index: str = "contacts"
     listings_index: str = "listings"
+    # Bulk writes: request byte budget and parallel requests shrink under 429s and regrow
+    bulk_max_chunk_bytes: int = 5 * 1024 * 1024
+    bulk_max_concurrency: int = 4
+    bulk_max_retries: int = 5
+    # Contact kNN vectors: 256, 512 or 1024 dimensions, stored as float, fp16 or byte.
+    # Changing either needs a new contacts index
+    embedding_dimensions: int = 1024
+    embedding_quantization: str = "float"
 
     # DynamoDB
     cards_table: str = "rise-scout-cards"
 
     # Redis
     redis_url: str = "redis://localhost:6379/0"
+    # One pool shared by every Redis store; callers wait for a free connection
+    redis_max_connections: int = 64
+    redis_pool_timeout_s: float = 2.0
+    redis_socket_timeout_s: float = 5.0
+    redis_connect_timeout_s: float = 2.0
+    leaderboard_size: int = 10
+
+    # Score decay
+    decay_slice_count: int = 1
 
     # Bedrock
     embedding_model_id: str = "amazon.titan-embed-text-v2:0"
     llm_model_id: str = "anthropic.claude-3-haiku-20240307-v1:0"
+    llm_max_concurrency: int = 8
+    # Shared across all Lambda containers through Redis
+    embedding_rate_per_second: float = 20.0
+    embedding_burst: float = 40.0
+    llm_rate_per_second: float = 5.0
+    llm_burst: float = 10.0
+    bedrock_max_wait_ms: int = 5_000
+    insight_cache_ttl_seconds: int = 7 * 86400
+
+    # Card refresh
+    card_refresh_chunk_size: int = 100
+    card_stream_coalesce_ms: int = 2_000
+    card_stream_idle_exit_ms: int = 10_000
+
+    # Async I/O: handlers drive the asyncio services, each call running on this many threads
+    async_io: bool = False
+    async_io_workers: int = 32
 
     # Kafka
     kafka_bootstrap_servers: str = "localhost:9092"
+    kafka_dedupe_ttl_seconds: int = 86400
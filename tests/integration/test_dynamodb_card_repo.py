@@ -1,4 +1,5 @@
 import os
+from datetime import UTC, datetime, timedelta
 
 import boto3
 import pytest
@@ -60,3 +61,24 @@ class TestDynamoDBCardRepository:
             repo = DynamoDBCardRepository("test-cards", "us-west-2")
             result = repo.get(AgentId("nonexistent"))
             assert result is None
+
+    def test_save_many_skips_unchanged_cards(self, dynamodb_table):
+        with mock_aws():
+            repo = DynamoDBCardRepository("test-cards", "us-west-2")
+            contact = CardContact(contact_id=ContactId("c-1"), name="Jane", score=10.0)
+            cards = [Card(agent_id=AgentId(f"a-{i}"), contacts=[contact]) for i in range(30)]
+
+            assert repo.save_many(cards) == 30
+
+            later = datetime.now(UTC) + timedelta(minutes=5)
+            changed = CardContact(contact_id=ContactId("c-2"), name="Joe", score=5.0)
+            again = [
+                Card(agent_id=AgentId("a-0"), contacts=[changed], generated_at=later),
+                Card(agent_id=AgentId("a-1"), contacts=[contact], generated_at=later),
+            ]
+
+            assert repo.save_many(again) == 1
+            assert repo.get(AgentId("a-0")).contacts[0].name == "Joe"
+            refreshed = repo.get(AgentId("a-1"))
+            assert refreshed.generated_at == later
+            assert refreshed.contacts[0].name == "Jane"
@@ -1,8 +1,28 @@
+import time
+
 import fakeredis
 import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
 
-from rise_scout.domain.shared.types import AgentId
+from rise_scout.domain.cards.insight_cache import CachedInsight
+from rise_scout.domain.contact.models import Contact, ScoreReason
+from rise_scout.domain.scoring.checkpoint import DecayCheckpoint
+from rise_scout.domain.shared.events import ContactScored
+from rise_scout.domain.shared.exceptions import LeaseLostError, RateLimitExceededError
+from rise_scout.domain.shared.types import AgentId, ContactId
+from rise_scout.infrastructure.kafka.dedupe import (
+    mark_records_processed,
+    skip_processed_records,
+)
+from rise_scout.infrastructure.opensearch.serializers import contact_to_document
+from rise_scout.infrastructure.redis.contact_events import RedisContactEventStream
 from rise_scout.infrastructure.redis.debouncer import EventDebouncer
+from rise_scout.infrastructure.redis.decay_checkpoint import DecayCheckpointStore
+from rise_scout.infrastructure.redis.insight_cache import RedisInsightCache
+from rise_scout.infrastructure.redis.leaderboard import RedisContactLeaderboard
+from rise_scout.infrastructure.redis.lease import RedisLeaseService
+from rise_scout.infrastructure.redis.lock import RedisLock
+from rise_scout.infrastructure.redis.rate_limiter import RedisTokenBucket
 from rise_scout.infrastructure.redis.refresh_flags import RefreshFlagStore
 
 
@@ -16,26 +36,67 @@ class TestRefreshFlagStore:
     def test_flag_and_pop_agents(self, redis_client):
         store = RefreshFlagStore(redis_client)
 
-        store.flag_agents([AgentId("a-1"), AgentId("a-2")])
-        store.flag_agents([AgentId("a-2"), AgentId("a-3")])
+        store.flag_agents({AgentId("a-1"): 1.0, AgentId("a-2"): 1.0})
+        store.flag_agents({AgentId("a-2"): 1.0, AgentId("a-3"): 1.0})
 
         popped = store.pop_flagged_agents()
         agent_strs = {str(a) for a in popped}
 
-        assert agent_strs == {"a-1", "a-2", "a-3"}  # SET deduplicates a-2
+        assert agent_strs == {"a-1", "a-2", "a-3"}  # sorted set deduplicates a-2
 
     def test_pop_empty_returns_empty(self, redis_client):
         store = RefreshFlagStore(redis_client)
-        assert store.pop_flagged_agents() == []
+        assert store.pop_flagged_agents() == {}
 
     def test_pop_clears_flags(self, redis_client):
         store = RefreshFlagStore(redis_client)
-        store.flag_agents([AgentId("a-1")])
+        store.flag_agents({AgentId("a-1"): 1.0})
 
         store.pop_flagged_agents()
         second_pop = store.pop_flagged_agents()
 
-        assert second_pop == []
+        assert second_pop == {}
+
+    def test_pop_in_chunks(self, redis_client):
+        store = RefreshFlagStore(redis_client)
+        store.flag_agents({AgentId(f"a-{i}"): 1.0 for i in range(5)})
+
+        first = store.pop_flagged_agents(limit=3)
+        rest = store.pop_flagged_agents(limit=3)
+
+        assert len(first) == 3
+        assert len(rest) == 2
+        assert {str(a) for a in [*first, *rest]} == {f"a-{i}" for i in range(5)}
+
+    def test_pop_in_priority_order(self, redis_client):
+        store = RefreshFlagStore(redis_client)
+        store.flag_agents({AgentId("a-1"): 3.0, AgentId("a-2"): 50.0, AgentId("a-3"): 10.0})
+        store.flag_agents({AgentId("a-1"): 20.0})
+
+        popped = store.pop_flagged_agents(limit=2)
+
+        assert popped == {AgentId("a-2"): 50.0, AgentId("a-1"): 23.0}
+        assert list(popped) == [AgentId("a-2"), AgentId("a-1")]
+        assert list(store.pop_flagged_agents()) == [AgentId("a-3")]
+
+    def test_legacy_flags_are_drained_into_the_queue(self, redis_client):
+        redis_client.sadd("rise_scout:refresh_flags", "a-1", "a-2", "a-3")
+        store = RefreshFlagStore(redis_client, migrate_batch=2)
+        store.flag_agents({AgentId("a-9"): 5.0, AgentId("a-1"): 1.0})
+
+        popped = list(store.pop_flagged_agents(limit=10))
+
+        assert popped[:2] == [AgentId("a-9"), AgentId("a-1")]
+        assert set(popped[2:]) == {AgentId("a-2"), AgentId("a-3")}
+        assert not redis_client.exists("rise_scout:refresh_flags")
+
+    def test_unflag_agents(self, redis_client):
+        store = RefreshFlagStore(redis_client)
+        store.flag_agents({AgentId("a-1"): 1.0, AgentId("a-2"): 1.0})
+
+        store.unflag_agents([AgentId("a-1"), AgentId("a-9")])
+
+        assert list(store.pop_flagged_agents()) == [AgentId("a-2")]
 
 
 @pytest.mark.integration
@@ -53,3 +114,335 @@ class TestEventDebouncer:
         debouncer = EventDebouncer(redis_client)
         assert debouncer.should_process("event-1", ttl_seconds=60) is True
         assert debouncer.should_process("event-2", ttl_seconds=60) is True
+
+    def test_bulk_marks_are_seen(self, redis_client):
+        debouncer = EventDebouncer(redis_client)
+        debouncer.should_process("event-1")
+
+        debouncer.mark_many(["event-2", "event-2"])
+
+        seen = debouncer.seen_many(["event-1", "event-2", "event-3"])
+        assert seen == {"event-1": True, "event-2": True, "event-3": False}
+
+    def test_redelivered_kafka_records_dropped(self, redis_client):
+        debouncer = EventDebouncer(redis_client)
+        records = {
+            "contacts-0": [
+                {"topic": "contacts", "partition": 0, "offset": 1, "value": ""},
+                {"topic": "contacts", "partition": 0, "offset": 2, "value": ""},
+            ]
+        }
+        mark_records_processed(debouncer, records["contacts-0"][:1], ttl_seconds=60)
+
+        fresh = skip_processed_records(debouncer, records)
+
+        assert [r["offset"] for r in fresh["contacts-0"]] == [2]
+
+    def test_unprocessed_kafka_records_are_redelivered(self, redis_client):
+        debouncer = EventDebouncer(redis_client)
+        records = {"contacts-0": [{"topic": "contacts", "partition": 0, "offset": 1}]}
+
+        # A delivery that died before marking anything leaves the record to its retry
+        skip_processed_records(debouncer, records)
+
+        assert skip_processed_records(debouncer, records) == records
+
+
+@pytest.mark.integration
+class TestDecayCheckpointStore:
+    def test_save_and_load(self, redis_client):
+        store = DecayCheckpointStore(redis_client)
+        store.save(DecayCheckpoint(run_id="run-1", search_after=["c-9"], scanned=10, decayed=7))
+
+        loaded = store.load("run-1")
+
+        assert loaded is not None
+        assert loaded.search_after == ["c-9"]
+        assert loaded.scanned == 10
+        assert loaded.decayed == 7
+        assert loaded.completed is False
+
+    def test_load_missing_returns_none(self, redis_client):
+        store = DecayCheckpointStore(redis_client)
+        assert store.load("run-1") is None
+
+    def test_checkpoint_expires(self, redis_client):
+        store = DecayCheckpointStore(redis_client, ttl_seconds=60)
+        store.save(DecayCheckpoint(run_id="run-1"))
+
+        assert 0 < redis_client.ttl("rise_scout:decay_checkpoint:run-1") <= 60
+
+    def test_slices_are_stored_independently(self, redis_client):
+        store = DecayCheckpointStore(redis_client)
+        store.save(DecayCheckpoint(run_id="run-1", slice_id=0, slice_count=2, scanned=3))
+        store.save(DecayCheckpoint(run_id="run-1", slice_id=1, slice_count=2, scanned=4))
+
+        assert store.load("run-1", 0, 2).scanned == 3
+        assert store.load("run-1", 1, 2).scanned == 4
+        assert store.load("run-1") is None
+
+
+@pytest.mark.integration
+class TestRedisInsightCache:
+    def test_round_trip(self, redis_client):
+        cache = RedisInsightCache(redis_client, ttl_seconds=60)
+        cache.set_many({"k1": CachedInsight(insight="call today", tokens=80)})
+
+        entries = cache.get_many(["k1", "k2"])
+
+        assert entries == {"k1": CachedInsight(insight="call today", tokens=80)}
+        assert 0 < redis_client.ttl("rise_scout:insight:k1") <= 60
+
+    def test_empty_keys(self, redis_client):
+        assert RedisInsightCache(redis_client).get_many([]) == {}
+
+
+def _doc(i: int, agents: list[str], score: float) -> dict:
+    contact = Contact(
+        contact_id=ContactId(f"c-{i}"),
+        user_ids=[AgentId(a) for a in agents],
+        first_name=f"Contact{i}",
+        score=score,
+        score_reasons=[
+            ScoreReason(signal="listing_view", points=3.0, category="engagement", detail=str(n))
+            for n in range(8)
+        ],
+        embedding_vector=[0.1, 0.2],
+    )
+    return contact_to_document(contact)
+
+
+@pytest.mark.integration
+class TestRedisContactLeaderboard:
+    def test_top_contacts_by_score(self, redis_client):
+        board = RedisContactLeaderboard(redis_client, size=3)
+        board.record_documents([_doc(i, ["a-1"], float(i)) for i in range(6)])
+
+        top = board.get_top_by_agents([AgentId("a-1"), AgentId("a-2")], limit=2)
+
+        assert [str(c.contact_id) for c in top[AgentId("a-1")]] == ["c-5", "c-4"]
+        assert AgentId("a-2") not in top
+        assert redis_client.zcard("rise_scout:top:a-1") == 3
+        assert len(top[AgentId("a-1")][0].score_reasons) == 5
+        assert top[AgentId("a-1")][0].embedding_vector is None
+
+    def test_score_updates_reorder(self, redis_client):
+        board = RedisContactLeaderboard(redis_client)
+        board.record_documents([_doc(1, ["a-1"], 10.0), _doc(2, ["a-1"], 5.0)])
+        board.record_documents([_doc(1, ["a-1"], 1.0)])
+
+        top = board.get_top_by_agents([AgentId("a-1")], limit=2)
+
+        assert [str(c.contact_id) for c in top[AgentId("a-1")]] == ["c-2", "c-1"]
+        assert top[AgentId("a-1")][1].score == 1.0
+
+    def test_contact_moved_to_other_agent_is_removed(self, redis_client):
+        board = RedisContactLeaderboard(redis_client)
+        board.record_documents([_doc(1, ["a-1"], 10.0)])
+        board.record_documents([_doc(1, ["a-2"], 10.0)])
+
+        top = board.get_top_by_agents([AgentId("a-1"), AgentId("a-2")], limit=1)
+
+        assert AgentId("a-1") not in top
+        assert redis_client.zcard("rise_scout:top:a-1") == 0
+        assert [str(c.contact_id) for c in top[AgentId("a-2")]] == ["c-1"]
+
+    def test_projections_do_not_expire(self, redis_client):
+        board = RedisContactLeaderboard(redis_client)
+        board.record_documents([_doc(1, ["a-1"], 10.0)])
+
+        assert redis_client.ttl("rise_scout:top_contact:c-1") == -1
+
+    def test_agents_short_of_limit_are_misses(self, redis_client):
+        board = RedisContactLeaderboard(redis_client)
+        board.record_documents([_doc(i, ["a-1"], float(i)) for i in range(3)])
+        redis_client.delete("rise_scout:top_contact:c-2")
+
+        assert board.get_top_by_agents([AgentId("a-1")], limit=3) == {}
+        # The member without a projection is dropped, not left to hold a slot
+        assert redis_client.zrange("rise_scout:top:a-1", 0, -1) == [b"c-0", b"c-1"]
+        assert len(board.get_top_by_agents([AgentId("a-1")], limit=2)[AgentId("a-1")]) == 2
+
+    def test_complete_boards_are_served_short(self, redis_client):
+        board = RedisContactLeaderboard(redis_client)
+        board.record_documents([_doc(i, ["a-1"], float(i)) for i in range(2)])
+        board.mark_complete([AgentId("a-1"), AgentId("a-2")])
+
+        top = board.get_top_by_agents([AgentId("a-1"), AgentId("a-2")], limit=5)
+
+        assert [str(c.contact_id) for c in top[AgentId("a-1")]] == ["c-1", "c-0"]
+        assert top[AgentId("a-2")] == []
+        assert 0 < redis_client.ttl("rise_scout:top_complete:a-1") <= 3600
+
+    def test_lost_projection_clears_the_complete_marker(self, redis_client):
+        board = RedisContactLeaderboard(redis_client)
+        board.record_documents([_doc(i, ["a-1"], float(i)) for i in range(2)])
+        board.mark_complete([AgentId("a-1")])
+        redis_client.delete("rise_scout:top_contact:c-1")
+
+        assert board.get_top_by_agents([AgentId("a-1")], limit=5) == {}
+        assert not redis_client.exists("rise_scout:top_complete:a-1")
+
+
+@pytest.mark.integration
+class TestRedisContactEventStream:
+    def _event(self, contact_id: str) -> ContactScored:
+        return ContactScored(contact_id=ContactId(contact_id), agent_ids=[AgentId("a-1")])
+
+    def test_publish_read_ack(self, redis_client):
+        stream = RedisContactEventStream(redis_client, consumer="w-1")
+        assert stream.read(block_ms=1) == []
+
+        stream.publish([self._event("c-1"), self._event("c-2")])
+        messages = stream.read(block_ms=1)
+        stream.ack([message_id for message_id, _ in messages])
+
+        assert [str(e.contact_id) for _, e in messages] == ["c-1", "c-2"]
+        assert redis_client.xpending("rise_scout:contact_scored", "card_refresh")["pending"] == 0
+
+    def test_unacked_messages_reclaimed_by_next_consumer(self, redis_client):
+        first = RedisContactEventStream(redis_client, consumer="w-1")
+        first.read(block_ms=1)
+        first.publish([self._event("c-1")])
+        first.read(block_ms=1)
+
+        second = RedisContactEventStream(redis_client, consumer="w-2", claim_idle_ms=0)
+        reclaimed = second.read(block_ms=1)
+
+        assert [str(e.contact_id) for _, e in reclaimed] == ["c-1"]
+
+    def test_warm_consumer_reclaims_again(self, redis_client):
+        first = RedisContactEventStream(redis_client, consumer="w-1")
+        second = RedisContactEventStream(redis_client, consumer="w-2", claim_idle_ms=0)
+        assert second.read(block_ms=1) == []
+
+        first.publish([self._event("c-1")])
+        first.read(block_ms=1)
+
+        assert [str(e.contact_id) for _, e in second.read(block_ms=1)] == ["c-1"]
+
+
+@pytest.mark.integration
+class TestRedisLock:
+    def test_single_holder(self, redis_client):
+        lock = RedisLock(redis_client)
+
+        token = lock.acquire("build:a-1", ttl_ms=1000)
+
+        assert token is not None
+        assert lock.acquire("build:a-1", ttl_ms=1000) is None
+        assert lock.is_locked("build:a-1")
+        assert lock.release("build:a-1", token)
+        assert not lock.is_locked("build:a-1")
+
+    def test_release_with_wrong_token_keeps_lock(self, redis_client):
+        lock = RedisLock(redis_client)
+        lock.acquire("build:a-1", ttl_ms=1000)
+
+        assert not lock.release("build:a-1", "someone-else")
+        assert lock.is_locked("build:a-1")
+
+
+@pytest.mark.integration
+class TestRedisLeaseService:
+    def test_second_acquire_fails_until_release(self, redis_client):
+        leases = RedisLeaseService(redis_client)
+
+        lease = leases.acquire("card_refresh", ttl_ms=1000)
+        assert lease is not None
+        assert leases.acquire("card_refresh", ttl_ms=1000) is None
+
+        lease.release()
+        successor = leases.acquire("card_refresh", ttl_ms=1000)
+        assert successor is not None
+        assert successor.fence > lease.fence
+        successor.release()
+
+    def test_heartbeat_keeps_lease_alive(self, redis_client):
+        lease = RedisLeaseService(redis_client).acquire("decay", ttl_ms=150)
+
+        time.sleep(0.4)
+
+        assert not lease.lost
+        assert redis_client.exists("rise_scout:lease:decay")
+        lease.release()
+
+    def test_lease_lost_when_taken_over(self, redis_client):
+        lease = RedisLeaseService(redis_client).acquire("decay", ttl_ms=150)
+        redis_client.set("rise_scout:lease:decay", "999")
+
+        time.sleep(0.2)
+
+        assert lease.lost
+        lease.release()
+        assert redis_client.get("rise_scout:lease:decay") == b"999"
+
+    def test_lease_lost_once_renewals_fail_past_the_ttl(self, redis_client, monkeypatch):
+        lease = RedisLeaseService(redis_client).acquire("decay", ttl_ms=150)
+
+        def unreachable(action):
+            raise RedisConnectionError("refused")
+
+        monkeypatch.setattr(lease, "_compare_and", unreachable)
+        time.sleep(0.1)
+        assert not lease.lost
+
+        time.sleep(0.3)
+        assert lease.lost
+        lease.release()
+
+    def test_fence_counter_expires(self, redis_client):
+        lease = RedisLeaseService(redis_client).acquire("decay:run-1", ttl_ms=1000)
+
+        assert redis_client.pttl("rise_scout:lease:decay:run-1:fence") > 0
+        lease.release()
+
+    def test_checkpoint_from_older_fence_rejected(self, redis_client):
+        store = DecayCheckpointStore(redis_client)
+        store.save(DecayCheckpoint(run_id="run-1", fence=2))
+
+        with pytest.raises(LeaseLostError):
+            store.save(DecayCheckpoint(run_id="run-1", fence=1, scanned=10))
+        assert store.load("run-1").scanned == 0
+
+
+@pytest.mark.integration
+class TestRedisTokenBucket:
+    def test_burst_up_to_capacity_is_immediate(self, redis_client):
+        bucket = RedisTokenBucket(redis_client, "llm", rate_per_second=1, capacity=5)
+
+        start = time.monotonic()
+        for _ in range(5):
+            bucket.acquire()
+
+        assert time.monotonic() - start < 0.5
+
+    def test_waits_for_refill_when_empty(self, redis_client):
+        bucket = RedisTokenBucket(redis_client, "llm", rate_per_second=20, capacity=1)
+        bucket.acquire()
+
+        start = time.monotonic()
+        bucket.acquire()
+
+        assert time.monotonic() - start >= 0.04
+
+    def test_raises_when_wait_exceeds_limit(self, redis_client):
+        bucket = RedisTokenBucket(
+            redis_client, "llm", rate_per_second=1, capacity=1, max_wait_ms=100
+        )
+        bucket.acquire()
+
+        with pytest.raises(RateLimitExceededError):
+            bucket.acquire()
+
+    def test_buckets_shared_by_name(self, redis_client):
+        first = RedisTokenBucket(redis_client, "llm", rate_per_second=1, capacity=1, max_wait_ms=0)
+        second = RedisTokenBucket(redis_client, "llm", rate_per_second=1, capacity=1, max_wait_ms=0)
+        other = RedisTokenBucket(
+            redis_client, "embedding", rate_per_second=1, capacity=1, max_wait_ms=0
+        )
+        first.acquire()
+
+        with pytest.raises(RateLimitExceededError):
+            second.acquire()
+        other.acquire()
@@ -0,0 +1,380 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from rise_scout.application.card_refresh import AsyncCardRefreshService, CardRefreshService
+from rise_scout.domain.cards.insight_cache import insight_cache_key
+from rise_scout.domain.cards.models import Card, CardContact
+from rise_scout.domain.contact.models import Contact
+from rise_scout.domain.shared.types import AgentId, ContactId
+from rise_scout.infrastructure.aio import (
+    ThreadedCardRepository,
+    ThreadedContactRepository,
+    ThreadedInsightCache,
+    ThreadedLLMService,
+    ThreadedRefreshFlags,
+)
+
+
+class FakeContactRepo:
+    def __init__(self, top: dict[AgentId, list[Contact]]):
+        self.top = top
+        self.fail = False
+
+    def get_top_by_agents(self, agent_ids, limit=5):
+        if self.fail:
+            raise ConnectionError("search unavailable")
+        return {a: self.top.get(a, [])[:limit] for a in agent_ids}
+
+
+class FakeCardRepo:
+    def __init__(self):
+        self.cards: dict[str, Card] = {}
+
+    def get(self, agent_id):
+        return self.cards.get(str(agent_id))
+
+    def save(self, card):
+        self.cards[str(card.agent_id)] = card
+
+    def save_many(self, cards):
+        for card in cards:
+            self.save(card)
+        return len(cards)
+
+
+class FakeRefreshFlags:
+    def __init__(self, flagged: list[AgentId] | None = None):
+        self.flagged = list(flagged or [])
+        self.priorities: dict[AgentId, float] = {}
+
+    def flag_agents(self, priorities):
+        self.flagged.extend(priorities)
+        self.priorities.update(priorities)
+
+    def pop_flagged_agents(self, limit=100):
+        result, self.flagged = self.flagged[:limit], self.flagged[limit:]
+        return {a: self.priorities.pop(a, 1.0) for a in result}
+
+
+class FakeLLMService:
+    def __init__(self, slow: set[str] | None = None, failing: set[str] | None = None):
+        self.slow = slow or set()
+        self.failing = failing or set()
+        self.calls: list[str] = []
+        self.batches: list[list[str]] = []
+        self.release = threading.Event()
+        self._lock = threading.Lock()
+
+    def generate_insight(self, contact):
+        cid = str(contact.contact_id)
+        with self._lock:
+            self.calls.append(cid)
+        if cid in self.slow:
+            self.release.wait(timeout=5)
+        if cid in self.failing:
+            raise RuntimeError("bedrock unavailable")
+        return f"insight for {cid}"
+
+    def generate_insights(self, contacts):
+        with self._lock:
+            self.batches.append([str(c.contact_id) for c in contacts])
+        return {c.contact_id: self.generate_insight(c) for c in contacts}
+
+
+class BarrierLLMService(FakeLLMService):
+    """Only returns once `parties` batches are in flight together."""
+
+    def __init__(self, parties: int):
+        super().__init__()
+        self.barrier = threading.Barrier(parties, timeout=2)
+
+    def generate_insights(self, contacts):
+        self.barrier.wait()
+        return super().generate_insights(contacts)
+
+
+class FakeInsightCache:
+    def __init__(self):
+        self.entries = {}
+
+    def get_many(self, keys):
+        return {k: self.entries[k] for k in keys if k in self.entries}
+
+    def set_many(self, entries):
+        self.entries.update(entries)
+
+
+class FakeLeaseService:
+    def __init__(self, available: bool):
+        self.available = available
+
+    def acquire(self, name, ttl_ms):
+        return FakeLease() if self.available else None
+
+
+class FakeLease:
+    fence = 1
+    lost = False
+
+    def release(self):
+        pass
+
+
+def _contact(i: int, agents: list[str]) -> Contact:
+    return Contact(
+        contact_id=ContactId(f"c-{i}"),
+        user_ids=[AgentId(a) for a in agents],
+        first_name=f"Contact{i}",
+        score=float(100 - i),
+    )
+
+
+class TestCardRefreshService:
+    def _build_service(self, top, llm, flagged, **kwargs):
+        self.cards = FakeCardRepo()
+        self.flags = FakeRefreshFlags(flagged)
+        self.contacts = FakeContactRepo(top)
+        return CardRefreshService(
+            contact_repo=self.contacts,
+            card_repo=self.cards,
+            llm_service=llm,
+            refresh_flags=self.flags,
+            **kwargs,
+        )
+
+    def test_builds_cards_with_insights(self):
+        top = {AgentId("a-1"): [_contact(1, ["a-1"]), _contact(2, ["a-1"])]}
+        service = self._build_service(top, FakeLLMService(), [AgentId("a-1")])
+
+        refreshed = service.refresh_flagged_agents()
+
+        assert refreshed == 1
+        card = self.cards.cards["a-1"]
+        assert [c.insight for c in card.contacts] == ["insight for c-1", "insight for c-2"]
+
+    def test_shared_contact_generates_one_insight(self):
+        shared = _contact(1, ["a-1", "a-2"])
+        top = {AgentId("a-1"): [shared], AgentId("a-2"): [shared]}
+        llm = FakeLLMService()
+        service = self._build_service(top, llm, [AgentId("a-1"), AgentId("a-2")])
+
+        service.refresh_flagged_agents()
+
+        assert llm.calls == ["c-1"]
+        assert self.cards.cards["a-2"].contacts[0].insight == "insight for c-1"
+
+    def test_one_request_per_card(self):
+        top = {
+            AgentId("a-1"): [_contact(1, ["a-1"]), _contact(2, ["a-1"])],
+            AgentId("a-2"): [_contact(3, ["a-2"])],
+        }
+        llm = FakeLLMService()
+        service = self._build_service(top, llm, [AgentId("a-1"), AgentId("a-2")])
+
+        service.refresh_flagged_agents()
+
+        assert sorted(llm.batches) == [["c-1", "c-2"], ["c-3"]]
+
+    def test_insights_past_budget_fall_back_to_stale(self):
+        top = {AgentId("a-1"): [_contact(1, ["a-1"])], AgentId("a-2"): [_contact(2, ["a-2"])]}
+        llm = FakeLLMService(slow={"c-2"})
+        service = self._build_service(top, llm, [AgentId("a-1"), AgentId("a-2")], time_margin_ms=0)
+        self.cards.save(
+            Card(
+                agent_id=AgentId("a-2"),
+                contacts=[
+                    CardContact(contact_id=ContactId("c-2"), name="", score=1.0, insight="old")
+                ],
+            )
+        )
+
+        refreshed = service.refresh_flagged_agents(remaining_time_ms=lambda: 200)
+        llm.release.set()
+
+        assert refreshed == 2
+        assert self.cards.cards["a-1"].contacts[0].insight == "insight for c-1"
+        assert self.cards.cards["a-2"].contacts[0].insight == "old"
+
+    def test_failed_insight_without_stale_is_empty(self):
+        top = {AgentId("a-1"): [_contact(1, ["a-1"])]}
+        service = self._build_service(top, FakeLLMService(failing={"c-1"}), [AgentId("a-1")])
+
+        service.refresh_flagged_agents()
+
+        assert self.cards.cards["a-1"].contacts[0].insight == ""
+
+    def test_no_flagged_agents(self):
+        service = self._build_service({}, FakeLLMService(), [])
+
+        assert service.refresh_flagged_agents() == 0
+
+    def test_cached_insight_skips_llm_across_runs(self):
+        top = {AgentId("a-1"): [_contact(1, ["a-1"])]}
+        cache = FakeInsightCache()
+        llm = FakeLLMService()
+        service = self._build_service(top, llm, [AgentId("a-1")], insight_cache=cache)
+
+        service.refresh_flagged_agents()
+        self.flags.flag_agents({AgentId("a-1"): 1.0})
+        service.refresh_flagged_agents()
+
+        assert llm.calls == ["c-1"]
+        assert self.cards.cards["a-1"].contacts[0].insight == "insight for c-1"
+
+    def test_changed_inputs_miss_cache(self):
+        contact = _contact(1, ["a-1"])
+        key = insight_cache_key(contact, "model-a")
+        contact.score += 40
+
+        assert insight_cache_key(contact, "model-a") != key
+
+    def test_model_change_misses_cache(self):
+        contact = _contact(1, ["a-1"])
+
+        assert insight_cache_key(contact, "model-a") != insight_cache_key(contact, "model-b")
+
+    def test_failed_insight_not_cached(self):
+        top = {AgentId("a-1"): [_contact(1, ["a-1"])]}
+        cache = FakeInsightCache()
+        llm = FakeLLMService(failing={"c-1"})
+        service = self._build_service(top, llm, [AgentId("a-1")], insight_cache=cache)
+
+        service.refresh_flagged_agents()
+
+        assert cache.entries == {}
+
+    def test_drains_flags_in_chunks(self):
+        agents = [AgentId(f"a-{i}") for i in range(5)]
+        top = {a: [_contact(i, [str(a)])] for i, a in enumerate(agents)}
+        service = self._build_service(top, FakeLLMService(), agents, chunk_size=2)
+
+        assert service.refresh_flagged_agents() == 5
+        assert self.flags.flagged == []
+
+    def test_agents_left_queued_when_budget_spent(self):
+        agents = [AgentId(f"a-{i}") for i in range(3)]
+        top = {a: [_contact(i, [str(a)])] for i, a in enumerate(agents)}
+        service = self._build_service(top, FakeLLMService(), agents, chunk_size=1)
+
+        refreshed = service.refresh_flagged_agents(remaining_time_ms=lambda: 10_000)
+
+        assert refreshed == 0
+        assert self.flags.flagged == agents
+
+    def test_overlapping_run_leaves_flags_queued(self):
+        top = {AgentId("a-1"): [_contact(1, ["a-1"])]}
+        llm = FakeLLMService()
+        service = self._build_service(
+            top, llm, [AgentId("a-1")], leases=FakeLeaseService(available=False)
+        )
+
+        assert service.refresh_flagged_agents() == 0
+        assert self.flags.flagged == [AgentId("a-1")]
+        assert llm.calls == []
+
+    def test_refreshes_under_lease(self):
+        top = {AgentId("a-1"): [_contact(1, ["a-1"])]}
+        service = self._build_service(
+            top, FakeLLMService(), [AgentId("a-1")], leases=FakeLeaseService(available=True)
+        )
+
+        assert service.refresh_flagged_agents() == 1
+
+    def test_failed_chunk_is_flagged_again(self):
+        service = self._build_service({}, FakeLLMService(), [])
+        self.flags.flag_agents({AgentId("a-1"): 7.0, AgentId("a-2"): 2.0})
+        self.contacts.fail = True
+
+        with pytest.raises(ConnectionError):
+            service.refresh_flagged_agents()
+
+        assert self.flags.flagged == [AgentId("a-1"), AgentId("a-2")]
+        assert self.flags.priorities == {AgentId("a-1"): 7.0, AgentId("a-2"): 2.0}
+
+
+class TestAsyncCardRefreshService:
+    def _build_service(self, top, llm, flagged, insight_cache=None, **kwargs):
+        self.cards = FakeCardRepo()
+        self.flags = FakeRefreshFlags(flagged)
+        self.contacts = FakeContactRepo(top)
+        return AsyncCardRefreshService(
+            contact_repo=ThreadedContactRepository(self.contacts),
+            card_repo=ThreadedCardRepository(self.cards),
+            llm_service=ThreadedLLMService(llm),
+            refresh_flags=ThreadedRefreshFlags(self.flags),
+            insight_cache=None if insight_cache is None else ThreadedInsightCache(insight_cache),
+            **kwargs,
+        )
+
+    def test_builds_cards_with_insights(self):
+        top = {AgentId("a-1"): [_contact(1, ["a-1"]), _contact(2, ["a-1"])]}
+        service = self._build_service(top, FakeLLMService(), [AgentId("a-1")])
+
+        refreshed = asyncio.run(service.refresh_flagged_agents())
+
+        assert refreshed == 1
+        card = self.cards.cards["a-1"]
+        assert [c.insight for c in card.contacts] == ["insight for c-1", "insight for c-2"]
+
+    def test_card_batches_run_concurrently(self):
+        agents = [AgentId(f"a-{i}") for i in range(3)]
+        top = {a: [_contact(i, [str(a)])] for i, a in enumerate(agents)}
+        service = self._build_service(top, BarrierLLMService(parties=3), agents)
+
+        assert asyncio.run(service.refresh_agents(agents)) == 3
+
+    def test_insights_past_budget_fall_back_to_stale(self):
+        top = {AgentId("a-1"): [_contact(1, ["a-1"])], AgentId("a-2"): [_contact(2, ["a-2"])]}
+        llm = FakeLLMService(slow={"c-2"})
+        service = self._build_service(top, llm, [], time_margin_ms=0)
+        self.cards.save(
+            Card(
+                agent_id=AgentId("a-2"),
+                contacts=[
+                    CardContact(contact_id=ContactId("c-2"), name="", score=1.0, insight="old")
+                ],
+            )
+        )
+
+        refreshed = asyncio.run(service.refresh_agents(list(top), remaining_time_ms=lambda: 200))
+        llm.release.set()
+
+        assert refreshed == 2
+        assert self.cards.cards["a-1"].contacts[0].insight == "insight for c-1"
+        assert self.cards.cards["a-2"].contacts[0].insight == "old"
+
+    def test_cached_insight_skips_llm(self):
+        top = {AgentId("a-1"): [_contact(1, ["a-1"])]}
+        cache = FakeInsightCache()
+        llm = FakeLLMService()
+        service = self._build_service(top, llm, [AgentId("a-1")], insight_cache=cache)
+
+        asyncio.run(service.refresh_flagged_agents())
+        self.flags.flag_agents({AgentId("a-1"): 1.0})
+        asyncio.run(service.refresh_flagged_agents())
+
+        assert llm.calls == ["c-1"]
+
+    def test_overlapping_run_leaves_flags_queued(self):
+        top = {AgentId("a-1"): [_contact(1, ["a-1"])]}
+        service = self._build_service(
+            top, FakeLLMService(), [AgentId("a-1")], leases=FakeLeaseService(available=False)
+        )
+
+        assert asyncio.run(service.refresh_flagged_agents()) == 0
+        assert self.flags.flagged == [AgentId("a-1")]
+
+    def test_failed_chunk_is_flagged_again(self):
+        service = self._build_service({}, FakeLLMService(), [])
+        self.flags.flag_agents({AgentId("a-1"): 7.0})
+        self.contacts.fail = True
+
+        with pytest.raises(ConnectionError):
+            asyncio.run(service.refresh_flagged_agents())
+
+        assert self.flags.flagged == [AgentId("a-1")]
+        assert self.flags.priorities == {AgentId("a-1"): 7.0}
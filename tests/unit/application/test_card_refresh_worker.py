@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+from rise_scout.application.card_refresh_worker import CardRefreshWorker
+from rise_scout.domain.shared.events import ContactScored
+from rise_scout.domain.shared.types import AgentId, ContactId
+
+
+class FakeEventStream:
+    def __init__(self, batches: list[list[ContactScored]]):
+        self.batches = list(batches)
+        self.acked: list[str] = []
+        self._next_id = 0
+
+    def publish(self, events):
+        self.batches.append(list(events))
+
+    def read(self, count=100, block_ms=1000):
+        if not self.batches:
+            return []
+        messages = []
+        for event in self.batches.pop(0):
+            self._next_id += 1
+            messages.append((f"{self._next_id}-0", event))
+        return messages
+
+    def ack(self, message_ids):
+        self.acked.extend(message_ids)
+
+
+class FakeCardRefresh:
+    def __init__(self):
+        self.calls: list[list[AgentId]] = []
+        self.budgets: list = []
+
+    def refresh_agents(self, agent_ids, remaining_time_ms=None):
+        self.calls.append(sorted(agent_ids))
+        self.budgets.append(remaining_time_ms)
+        return len(agent_ids)
+
+
+class FakeRefreshFlags:
+    def __init__(self):
+        self.unflagged: list[list[AgentId]] = []
+
+    def unflag_agents(self, agent_ids):
+        self.unflagged.append(sorted(agent_ids))
+
+
+def _event(contact: str, agents: list[str]) -> ContactScored:
+    return ContactScored(
+        contact_id=ContactId(contact),
+        agent_ids=[AgentId(a) for a in agents],
+        occurred_at=datetime.now(UTC) - timedelta(seconds=1),
+    )
+
+
+def _iterations(n: int):
+    remaining = [n]
+
+    def should_continue() -> bool:
+        remaining[0] -= 1
+        return remaining[0] >= 0
+
+    return should_continue
+
+
+class TestCardRefreshWorker:
+    def test_coalesces_events_per_agent(self):
+        stream = FakeEventStream(
+            [
+                [_event("c-1", ["a-1"]), _event("c-2", ["a-1", "a-2"])],
+                [_event("c-3", ["a-1"])],
+            ]
+        )
+        cards = FakeCardRefresh()
+        worker = CardRefreshWorker(cards, stream, coalesce_ms=0)
+
+        refreshed = worker.run(_iterations(3))
+
+        assert cards.calls == [[AgentId("a-1"), AgentId("a-2")], [AgentId("a-1")]]
+        assert refreshed == 3
+        assert stream.acked == ["1-0", "2-0", "3-0"]
+
+    def test_pending_agents_flushed_on_stop(self):
+        stream = FakeEventStream([[_event("c-1", ["a-1"])]])
+        cards = FakeCardRefresh()
+        worker = CardRefreshWorker(cards, stream, coalesce_ms=60_000)
+
+        worker.run(_iterations(2))
+
+        assert cards.calls == [[AgentId("a-1")]]
+        assert stream.acked == ["1-0"]
+
+    def test_exits_when_idle(self):
+        cards = FakeCardRefresh()
+        worker = CardRefreshWorker(cards, FakeEventStream([]), idle_exit_ms=0)
+
+        assert worker.run(lambda: True) == 0
+        assert cards.calls == []
+
+    def test_flushed_agents_are_unflagged_and_budgeted(self):
+        stream = FakeEventStream([[_event("c-1", ["a-1", "a-2"])]])
+        cards = FakeCardRefresh()
+        flags = FakeRefreshFlags()
+
+        def remaining() -> int:
+            return 60_000
+
+        worker = CardRefreshWorker(
+            cards, stream, coalesce_ms=0, refresh_flags=flags, remaining_time_ms=remaining
+        )
+        worker.run(_iterations(1))
+
+        assert flags.unflagged == [[AgentId("a-1"), AgentId("a-2")]]
+        assert cards.budgets == [remaining]
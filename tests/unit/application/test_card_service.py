@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+from datetime import UTC, datetime, timedelta
+
+from rise_scout.application.card_service import CardService
+from rise_scout.domain.cards.models import Card
+from rise_scout.domain.shared.types import AgentId
+
+
+class FakeCardRepo:
+    def __init__(self, cards: list[Card] | None = None):
+        self.cards = {str(c.agent_id): c for c in cards or []}
+
+    def get(self, agent_id):
+        return self.cards.get(str(agent_id))
+
+    def save(self, card):
+        self.cards[str(card.agent_id)] = card
+
+    def save_many(self, cards):
+        for card in cards:
+            self.save(card)
+        return len(cards)
+
+
+class FakeCardRefresh:
+    def __init__(self, repo: FakeCardRepo):
+        self.repo = repo
+        self.built: list[AgentId] = []
+        self.budgets: list[int] = []
+
+    def build_card(self, agent_id, remaining_time_ms=None):
+        self.built.append(agent_id)
+        self.budgets.append(remaining_time_ms())
+        card = Card(agent_id=agent_id)
+        self.repo.save(card)
+        return card
+
+
+class FakeLock:
+    def __init__(self, held: set[str] | None = None):
+        self.held = set(held or [])
+
+    def acquire(self, name, ttl_ms):
+        if name in self.held:
+            return None
+        self.held.add(name)
+        return "token"
+
+    def release(self, name, token):
+        self.held.discard(name)
+        return True
+
+    def is_locked(self, name):
+        return name in self.held
+
+
+class DeferredExecutor:
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, fn, *args):
+        self.submitted.append((fn, args))
+        return Future()
+
+    def run_all(self):
+        for fn, args in self.submitted:
+            fn(*args)
+
+
+def _service(cards=None, held=None):
+    repo = FakeCardRepo(cards)
+    refresh = FakeCardRefresh(repo)
+    executor = DeferredExecutor()
+    service = CardService(repo, refresh, FakeLock(held), executor=executor, wait_timeout_ms=0)
+    return service, repo, refresh, executor
+
+
+class TestCardService:
+    def test_fresh_card_returned_without_build(self):
+        card = Card(agent_id=AgentId("a-1"))
+        service, _, refresh, _ = _service([card])
+
+        assert service.get_or_build(AgentId("a-1")) == card
+        assert refresh.built == []
+
+    def test_miss_builds_under_lock(self):
+        service, _, refresh, _ = _service()
+
+        card = service.get_or_build(AgentId("a-1"))
+
+        assert card is not None
+        assert refresh.built == [AgentId("a-1")]
+
+    def test_miss_while_another_build_runs_waits_instead_of_building(self):
+        service, repo, refresh, _ = _service(held={"card_build:a-1"})
+        repo.save(Card(agent_id=AgentId("a-2")))
+
+        assert service.get_or_build(AgentId("a-1")) is None
+        assert refresh.built == []
+
+    def test_stale_card_served_while_refreshing_in_background(self):
+        stale = Card(agent_id=AgentId("a-1"), generated_at=datetime.now(UTC) - timedelta(hours=1))
+        service, repo, refresh, executor = _service([stale])
+
+        assert service.get_or_build(AgentId("a-1")) == stale
+        assert service.get_or_build(AgentId("a-1")) == stale
+        assert len(executor.submitted) == 1  # second reader sees the lock held
+
+        executor.run_all()
+        assert refresh.built == [AgentId("a-1")]
+        assert not repo.get(AgentId("a-1")).is_expired()
+
+    def test_build_is_budgeted_within_the_lock_ttl(self):
+        service, _, refresh, _ = _service()
+
+        service.get_or_build(AgentId("a-1"))
+
+        assert 29_000 < refresh.budgets[0] <= 30_000
+
+    def test_services_share_one_background_pool(self):
+        repo = FakeCardRepo()
+        first = CardService(repo, FakeCardRefresh(repo), FakeLock())
+        second = CardService(repo, FakeCardRefresh(repo), FakeLock())
+
+        assert first._executor is second._executor
@@ -1,13 +1,24 @@
 from __future__ import annotations
 
+import asyncio
+import threading
 from typing import Any
 
-from rise_scout.application.contact_ingestion import ContactIngestionService
+from rise_scout.application.contact_ingestion import (
+    AsyncContactIngestionService,
+    ContactIngestionService,
+)
 from rise_scout.domain.contact.models import Contact, Preferences
+from rise_scout.domain.contact.repository import BulkWriteResult
 from rise_scout.domain.scoring.engine import ScoringEngine
 from rise_scout.domain.scoring.signals import SignalType
 from rise_scout.domain.scoring.weights import ScoringWeights
 from rise_scout.domain.shared.types import AgentId, ContactId
+from rise_scout.infrastructure.aio import (
+    ThreadedContactRepository,
+    ThreadedEmbeddingService,
+    ThreadedRefreshFlags,
+)
 
 
 class FakeContactRepo:
@@ -23,9 +34,10 @@ class FakeContactRepo:
     def bulk_get(self, contact_ids: list[ContactId]) -> list[Contact]:
         return [self.contacts[str(cid)] for cid in contact_ids if str(cid) in self.contacts]
 
-    def bulk_save(self, contacts: list[Contact]) -> None:
+    def bulk_save(self, contacts: list[Contact]) -> BulkWriteResult:
         for c in contacts:
             self.save(c)
+        return BulkWriteResult(succeeded=[c.contact_id for c in contacts])
 
     def get_top_by_agents(self, agent_ids, limit=5):
         return {}
@@ -44,13 +56,14 @@ class FakeEmbeddingService:
 
 class FakeRefreshFlags:
     def __init__(self):
-        self.flagged: list[AgentId] = []
+        self.flagged: dict[AgentId, float] = {}
 
-    def flag_agents(self, agent_ids: list[AgentId]) -> None:
-        self.flagged.extend(agent_ids)
+    def flag_agents(self, priorities: dict[AgentId, float]) -> None:
+        for agent_id, priority in priorities.items():
+            self.flagged[agent_id] = self.flagged.get(agent_id, 0.0) + priority
 
-    def pop_flagged_agents(self) -> list[AgentId]:
-        result = list(self.flagged)
+    def pop_flagged_agents(self, limit: int = 100) -> dict[AgentId, float]:
+        result = dict(self.flagged)
         self.flagged.clear()
         return result
 
@@ -113,6 +126,7 @@ class TestContactIngestionService:
         saved = self.repo.contacts["c-1"]
         assert saved.score > 0  # profile signals computed
         assert saved.embedding_vector is not None
+        assert saved.embedding_vector.typecode == "f"
         assert AgentId("a-1") in self.flags.flagged
 
     def test_handle_update_preserves_score(self, scoring_weights: ScoringWeights):
@@ -138,6 +152,23 @@ class TestContactIngestionService:
         saved = self.repo.contacts["c-1"]
         assert saved.score >= 50.0  # preserved + possibly added profile signals
 
+    def test_handle_update_preserves_decay_run(self, scoring_weights: ScoringWeights):
+        service = self._build_service(scoring_weights)
+        self.repo.save(
+            Contact(
+                contact_id=ContactId("c-1"),
+                user_ids=[AgentId("a-1")],
+                score=50.0,
+                decay_run_id="decay-2024-06-01",
+            )
+        )
+
+        service.handle_contact_change(
+            {"contact_id": "c-1", "event_type": "update", "user_ids": ["a-1"], "first_name": "Jane"}
+        )
+
+        assert self.repo.contacts["c-1"].decay_run_id == "decay-2024-06-01"
+
     def test_handle_interaction(self, scoring_weights: ScoringWeights):
         service = self._build_service(scoring_weights)
 
@@ -170,3 +201,99 @@ class TestContactIngestionService:
                 "interaction_type": "listing_view",
             }
         )
+
+
+class RendezvousContactRepo(FakeContactRepo):
+    """`get` only returns once the embedding call is in flight too."""
+
+    def __init__(self, barrier: threading.Barrier):
+        super().__init__()
+        self.barrier = barrier
+
+    def get(self, contact_id: ContactId) -> Contact | None:
+        self.barrier.wait()
+        return super().get(contact_id)
+
+
+class RendezvousEmbeddingService(FakeEmbeddingService):
+    def __init__(self, barrier: threading.Barrier):
+        self.barrier = barrier
+
+    def embed(self, text: str) -> list[float]:
+        self.barrier.wait()
+        return super().embed(text)
+
+
+class TestAsyncContactIngestionService:
+    def _build_service(self, scoring_weights: ScoringWeights, repo=None, embedding=None):
+        self.repo = repo or FakeContactRepo()
+        self.flags = FakeRefreshFlags()
+        return AsyncContactIngestionService(
+            contact_repo=ThreadedContactRepository(self.repo),
+            scoring_engine=ScoringEngine(scoring_weights),
+            embedding_service=ThreadedEmbeddingService(embedding or FakeEmbeddingService()),
+            refresh_flags=ThreadedRefreshFlags(self.flags),
+            contact_parser=FakeContactParser(),
+            interaction_parser=FakeInteractionParser(),
+        )
+
+    def test_lookup_and_embedding_overlap(self, scoring_weights: ScoringWeights):
+        barrier = threading.Barrier(2, timeout=2)
+        service = self._build_service(
+            scoring_weights,
+            repo=RendezvousContactRepo(barrier),
+            embedding=RendezvousEmbeddingService(barrier),
+        )
+        self.repo.contacts["c-1"] = Contact(
+            contact_id=ContactId("c-1"), user_ids=[AgentId("a-1")], score=50.0
+        )
+
+        asyncio.run(
+            service.handle_contact_change(
+                {
+                    "contact_id": "c-1",
+                    "event_type": "update",
+                    "user_ids": ["a-1"],
+                    "first_name": "Jane",
+                }
+            )
+        )
+
+        saved = self.repo.contacts["c-1"]
+        assert saved.score >= 50.0
+        assert saved.embedding_vector is not None
+
+    def test_handle_update_preserves_decay_run(self, scoring_weights: ScoringWeights):
+        service = self._build_service(scoring_weights)
+        self.repo.contacts["c-1"] = Contact(
+            contact_id=ContactId("c-1"),
+            user_ids=[AgentId("a-1")],
+            score=50.0,
+            decay_run_id="decay-2024-06-01",
+        )
+
+        asyncio.run(
+            service.handle_contact_change(
+                {
+                    "contact_id": "c-1",
+                    "event_type": "update",
+                    "user_ids": ["a-1"],
+                    "first_name": "Jane",
+                }
+            )
+        )
+
+        assert self.repo.contacts["c-1"].decay_run_id == "decay-2024-06-01"
+
+    def test_handle_interaction(self, scoring_weights: ScoringWeights):
+        service = self._build_service(scoring_weights)
+        self.repo.save(Contact(contact_id=ContactId("c-1"), user_ids=[AgentId("a-1")]))
+
+        asyncio.run(
+            service.handle_interaction(
+                {"contact_id": "c-1", "interaction_type": "listing_view", "detail": "Viewed l-1"}
+            )
+        )
+
+        assert self.repo.contacts["c-1"].score == 3.0
+        assert AgentId("a-1") in self.flags.flagged
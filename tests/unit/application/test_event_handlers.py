@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from rise_scout.application.event_handlers import dispatch_contact_events
+from rise_scout.domain.contact.models import Contact
+from rise_scout.domain.scoring.engine import ScoringEngine
+from rise_scout.domain.scoring.signals import SignalType
+from rise_scout.domain.scoring.weights import ScoringWeights
+from rise_scout.domain.shared.types import AgentId, ContactId
+
+
+class FakeRefreshFlags:
+    def __init__(self):
+        self.priorities: dict[AgentId, float] = {}
+
+    def flag_agents(self, priorities):
+        for agent_id, priority in priorities.items():
+            self.priorities[agent_id] = self.priorities.get(agent_id, 0.0) + priority
+
+    def pop_flagged_agents(self, limit=100):
+        return {}
+
+
+class FakeEventStream:
+    def __init__(self):
+        self.published = []
+
+    def publish(self, events):
+        self.published.extend(events)
+
+
+class TestDispatchContactEvents:
+    def test_engagement_outranks_market_signal(self, scoring_weights: ScoringWeights):
+        engine = ScoringEngine(scoring_weights)
+        signed = Contact(contact_id=ContactId("c-1"), user_ids=[AgentId("a-1")])
+        matched = Contact(contact_id=ContactId("c-2"), user_ids=[AgentId("a-2")])
+        engine.process_signal(signed, SignalType.DOCUMENT_SIGNED)
+        engine.process_signal(matched, SignalType.PRICE_DROP_MATCH)
+        flags = FakeRefreshFlags()
+
+        dispatch_contact_events([signed, matched], flags)
+
+        assert flags.priorities[AgentId("a-1")] > flags.priorities[AgentId("a-2")]
+
+    def test_priorities_accumulate_per_agent(self, scoring_weights: ScoringWeights):
+        engine = ScoringEngine(scoring_weights)
+        contact = Contact(contact_id=ContactId("c-1"), user_ids=[AgentId("a-1")])
+        engine.process_signal(contact, SignalType.LISTING_VIEW)
+        engine.process_signal(contact, SignalType.LISTING_VIEW)
+        flags = FakeRefreshFlags()
+
+        dispatch_contact_events([contact], flags)
+
+        assert flags.priorities == {AgentId("a-1"): 12.0}  # 2 x 3pts x engagement 2.0
+
+    def test_publishes_one_event_per_contact(self, scoring_weights: ScoringWeights):
+        engine = ScoringEngine(scoring_weights)
+        contact = Contact(contact_id=ContactId("c-1"), user_ids=[AgentId("a-1")])
+        engine.process_signal(contact, SignalType.LISTING_VIEW)
+        engine.process_signal(contact, SignalType.LISTING_SAVE)
+        stream = FakeEventStream()
+
+        dispatch_contact_events([contact], FakeRefreshFlags(), stream)
+
+        assert [str(e.contact_id) for e in stream.published] == ["c-1"]
+        assert stream.published[0].delta == 3.0  # earliest event kept
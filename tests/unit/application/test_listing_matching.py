@@ -4,6 +4,7 @@ from typing import Any
 
 from rise_scout.application.listing_matching import ListingMatchingService
 from rise_scout.domain.contact.models import Contact
+from rise_scout.domain.contact.repository import BulkWriteResult
 from rise_scout.domain.scoring.engine import ScoringEngine
 from rise_scout.domain.scoring.weights import ScoringWeights
 from rise_scout.domain.search.models import ListingEvent, ListingEventType, MatchedContact
@@ -26,6 +27,7 @@ class FakeContactRepo:
     def bulk_save(self, contacts):
         for c in contacts:
             self.save(c)
+        return BulkWriteResult(succeeded=[c.contact_id for c in contacts])
 
     def get_top_by_agents(self, agent_ids, limit=5):
         return {}
@@ -44,13 +46,14 @@ class FakeSearchRepo:
 
 class FakeRefreshFlags:
     def __init__(self):
-        self.flagged: list[AgentId] = []
+        self.flagged: dict[AgentId, float] = {}
 
-    def flag_agents(self, agent_ids):
-        self.flagged.extend(agent_ids)
+    def flag_agents(self, priorities):
+        for agent_id, priority in priorities.items():
+            self.flagged[agent_id] = self.flagged.get(agent_id, 0.0) + priority
 
-    def pop_flagged_agents(self):
-        result = list(self.flagged)
+    def pop_flagged_agents(self, limit=100):
+        result = dict(self.flagged)
         self.flagged.clear()
         return result
 
@@ -123,3 +126,30 @@ class TestListingMatchingService:
         )
 
         assert len(flags.flagged) == 0
+
+    def test_unsaved_contacts_are_not_flagged(self, scoring_weights: ScoringWeights):
+        repo = FakeContactRepo()
+        for cid, agent in (("c-1", "a-1"), ("c-2", "a-2")):
+            repo.save(Contact(contact_id=ContactId(cid), user_ids=[AgentId(agent)]))
+        repo.bulk_save = lambda contacts: BulkWriteResult(
+            succeeded=[ContactId("c-1")], failed={ContactId("c-2"): "mapper_parsing_exception"}
+        )
+        matches = [
+            MatchedContact(contact_id=ContactId(cid), match_reasons=["price match"])
+            for cid in ("c-1", "c-2")
+        ]
+        flags = FakeRefreshFlags()
+
+        service = ListingMatchingService(
+            contact_repo=repo,
+            search_repo=FakeSearchRepo(matches),
+            scoring_engine=ScoringEngine(scoring_weights),
+            refresh_flags=flags,
+            listing_parser=FakeListingParser(),
+        )
+
+        service.handle_listing_event(
+            {"listing_id": "l-1", "event_type": "new_listing", "mls_id": "mls-1"}
+        )
+
+        assert set(flags.flagged) == {AgentId("a-1")}
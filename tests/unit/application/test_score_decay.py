@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+from rise_scout.application.score_decay import ScoreDecayService, aggregate_checkpoints
+from rise_scout.domain.contact.models import Contact, ScoreReason
+from rise_scout.domain.contact.repository import BulkWriteResult
+from rise_scout.domain.scoring.checkpoint import DecayCheckpoint, checkpoint_key
+from rise_scout.domain.scoring.columnar import ContactDecayBatch
+from rise_scout.domain.scoring.decay import DecayCalculator
+from rise_scout.domain.scoring.slicing import slice_bounds, slice_bucket
+from rise_scout.domain.scoring.weights import DecayConfig, ScoringWeights
+from rise_scout.domain.shared.types import AgentId, ContactId
+
+
+class FakeContactRepo:
+    def __init__(self):
+        self.contacts: dict[str, Contact] = {}
+        self.saved_batches: list[list[str]] = []
+        # Contact id -> how many more of its decay writes fail
+        self.failing: dict[str, int] = {}
+
+    def save(self, contact):
+        self.contacts[str(contact.contact_id)] = contact
+
+    def bulk_save_batched(self, contacts, batch_size=100):
+        self.saved_batches.append([str(c.contact_id) for c in contacts])
+        for c in contacts:
+            self.save(c)
+
+    def iter_decay_batches(
+        self,
+        run_id,
+        reasons_before,
+        page_size=500,
+        search_after=None,
+        slice_id=0,
+        slice_count=1,
+    ):
+        lower, upper = slice_bounds(slice_id, slice_count)
+        ids = sorted(
+            cid
+            for cid, c in self.contacts.items()
+            if lower <= slice_bucket(cid) < upper
+            and c.decay_run_id != run_id
+            and (c.score > 0.0 or any(r.timestamp < reasons_before for r in c.score_reasons))
+        )
+        if search_after is not None:
+            ids = [cid for cid in ids if cid > search_after[0]]
+        for i in range(0, len(ids), page_size):
+            page = ids[i : i + page_size]
+            contacts = [self.contacts[cid].model_copy(deep=True) for cid in page]
+            yield ContactDecayBatch(contacts), [page[-1]]
+
+    def save_decay_batch(self, batch, result, run_id):
+        changed = batch.apply(result, datetime.now(UTC))
+        failed = {}
+        for contact in list(changed):
+            cid = str(contact.contact_id)
+            if self.failing.get(cid, 0) > 0:
+                self.failing[cid] -= 1
+                failed[ContactId(cid)] = "rejected"
+                changed.remove(contact)
+            else:
+                contact.decay_run_id = run_id
+        self.bulk_save_batched(changed)
+        return BulkWriteResult(succeeded=[c.contact_id for c in changed], failed=failed)
+
+
+class FakeCheckpointStore:
+    def __init__(self):
+        self.checkpoints: dict[str, DecayCheckpoint] = {}
+
+    def load(self, run_id, slice_id=0, slice_count=1):
+        checkpoint = self.checkpoints.get(checkpoint_key(run_id, slice_id, slice_count))
+        return checkpoint.model_copy(deep=True) if checkpoint else None
+
+    def save(self, checkpoint):
+        self.checkpoints[checkpoint.key] = checkpoint.model_copy(deep=True)
+
+
+class FakeLease:
+    def __init__(self, fence: int, lost_after: int | None = None):
+        self.fence = fence
+        self.lost_after = lost_after
+        self.checks = 0
+        self.released = False
+
+    @property
+    def lost(self):
+        self.checks += 1
+        return self.lost_after is not None and self.checks > self.lost_after
+
+    def release(self):
+        self.released = True
+
+
+class FakeLeaseService:
+    def __init__(self, lease: FakeLease | None):
+        self.lease = lease
+        self.names: list[str] = []
+
+    def acquire(self, name, ttl_ms):
+        self.names.append(name)
+        return self.lease
+
+
+class FakeDispatcher:
+    def __init__(self):
+        self.dispatched: list[tuple[str, int, int]] = []
+
+    def dispatch(self, run_id, slice_id, slice_count):
+        self.dispatched.append((run_id, slice_id, slice_count))
+
+
+def _make_reason(days_ago: int) -> ScoreReason:
+    return ScoreReason(
+        signal="listing_view",
+        points=3.0,
+        category="engagement",
+        detail="test",
+        timestamp=datetime.now(UTC) - timedelta(days=days_ago),
+    )
+
+
+def _seed(repo: FakeContactRepo, count: int, score: float = 100.0) -> None:
+    for i in range(count):
+        repo.save(
+            Contact(contact_id=ContactId(f"c-{i:03d}"), user_ids=[AgentId("a-1")], score=score)
+        )
+
+
+class TestScoreDecayService:
+    def _build_service(self, scoring_weights: ScoringWeights, page_size: int = 2, leases=None):
+        self.repo = FakeContactRepo()
+        self.checkpoints = FakeCheckpointStore()
+        return ScoreDecayService(
+            contact_repo=self.repo,
+            decay_calculator=DecayCalculator(scoring_weights),
+            checkpoints=self.checkpoints,
+            page_size=page_size,
+            leases=leases,
+        )
+
+    def test_overlapping_run_exits_without_work(self, scoring_weights: ScoringWeights):
+        leases = FakeLeaseService(None)
+        service = self._build_service(scoring_weights, leases=leases)
+        _seed(self.repo, 5)
+
+        result = service.run_decay(run_id="run-1", slice_id=1, slice_count=4)
+
+        assert leases.names == ["score_decay:run-1:1/4"]
+        assert result.scanned == 0
+        assert self.repo.saved_batches == []
+
+    def test_lease_fence_recorded_and_released(self, scoring_weights: ScoringWeights):
+        lease = FakeLease(fence=7)
+        service = self._build_service(scoring_weights, leases=FakeLeaseService(lease))
+        _seed(self.repo, 3)
+
+        result = service.run_decay(run_id="run-1")
+
+        assert result.completed is True
+        assert self.checkpoints.checkpoints["run-1"].fence == 7
+        assert lease.released is True
+
+    def test_stops_when_lease_lost(self, scoring_weights: ScoringWeights):
+        lease = FakeLease(fence=1, lost_after=1)
+        service = self._build_service(scoring_weights, leases=FakeLeaseService(lease))
+        _seed(self.repo, 5)
+
+        result = service.run_decay(run_id="run-1")
+
+        assert result.completed is False
+        assert self.repo.saved_batches == [["c-000", "c-001"]]
+
+    def test_decays_all_contacts_and_completes(self, scoring_weights: ScoringWeights):
+        service = self._build_service(scoring_weights)
+        _seed(self.repo, 5)
+
+        result = service.run_decay(run_id="run-1")
+
+        assert result.completed is True
+        assert result.scanned == 5
+        assert result.decayed == 5
+        assert all(c.score == 95.0 for c in self.repo.contacts.values())
+        assert self.checkpoints.checkpoints["run-1"].completed is True
+
+    def test_failed_writes_are_retried_by_the_next_invocation(
+        self, scoring_weights: ScoringWeights
+    ):
+        service = self._build_service(scoring_weights)
+        _seed(self.repo, 5)
+        self.repo.failing = {"c-001": 1, "c-003": 1}
+
+        first = service.run_decay(run_id="run-1")
+
+        assert first.completed is False
+        assert first.search_after is None
+        assert len(self.repo.saved_batches) == 3
+
+        result = service.run_decay(run_id="run-1")
+
+        assert result.completed is True
+        assert result.scanned == 5
+        assert result.decayed == 5
+        assert result.catch_up_passes == 1
+        assert self.repo.saved_batches[-1] == ["c-001", "c-003"]
+        assert all(c.score == 95.0 for c in self.repo.contacts.values())
+
+    def test_catch_up_passes_are_bounded(self, scoring_weights: ScoringWeights):
+        service = self._build_service(scoring_weights)
+        _seed(self.repo, 3)
+        self.repo.failing = {"c-001": 100}
+
+        for _ in range(4):
+            result = service.run_decay(run_id="run-1")
+
+        assert result.completed is True
+        assert result.decayed == 2
+        assert result.failed == 1
+        assert result.catch_up_passes == 3
+
+    def test_checkpoints_after_each_page(self, scoring_weights: ScoringWeights):
+        service = self._build_service(scoring_weights)
+        _seed(self.repo, 5)
+
+        service.run_decay(run_id="run-1")
+
+        assert self.repo.saved_batches == [["c-000", "c-001"], ["c-002", "c-003"], ["c-004"]]
+
+    def test_stops_before_deadline_and_resumes(self, scoring_weights: ScoringWeights):
+        service = self._build_service(scoring_weights)
+        _seed(self.repo, 5)
+
+        first = service.run_decay(run_id="run-1", remaining_time_ms=lambda: 1_000)
+
+        assert first.completed is False
+        assert first.scanned == 2
+        assert first.search_after == ["c-001"]
+
+        second = service.run_decay(run_id="run-1")
+
+        assert second.completed is True
+        assert second.scanned == 5
+        assert second.invocations == 2
+        assert all(c.score == 95.0 for c in self.repo.contacts.values())
+
+    def test_completed_run_is_not_reapplied(self, scoring_weights: ScoringWeights):
+        service = self._build_service(scoring_weights)
+        _seed(self.repo, 3)
+
+        service.run_decay(run_id="run-1")
+        again = service.run_decay(run_id="run-1")
+
+        assert again.decayed == 3
+        assert all(c.score == 95.0 for c in self.repo.contacts.values())
+
+    def test_skips_contacts_already_stamped_with_run(self, scoring_weights: ScoringWeights):
+        service = self._build_service(scoring_weights)
+        _seed(self.repo, 3)
+        # Simulate a page that was flushed before its checkpoint was persisted
+        self.repo.contacts["c-000"].decay_run_id = "run-1"
+
+        result = service.run_decay(run_id="run-1")
+
+        assert result.decayed == 2
+        assert self.repo.contacts["c-000"].score == 100.0
+        assert self.repo.contacts["c-001"].score == 95.0
+
+    def test_skips_zero_score_contacts(self, scoring_weights: ScoringWeights):
+        service = self._build_service(scoring_weights)
+        _seed(self.repo, 2, score=0.0)
+
+        result = service.run_decay(run_id="run-1")
+
+        assert result.scanned == 0
+        assert result.decayed == 0
+
+    def test_scans_with_one_cutoff_per_run(self, scoring_weights: ScoringWeights):
+        service = self._build_service(scoring_weights)
+        calls = []
+        self.repo.iter_decay_batches = lambda *args: calls.append(args) or iter(())
+
+        service.run_decay(run_id="run-1")
+
+        run_id, reasons_before = calls[0][:2]
+        assert run_id == "run-1"
+        expected = datetime.now(UTC) - timedelta(days=30)
+        assert abs((reasons_before - expected).total_seconds()) < 5
+
+    def test_unchanged_contacts_are_not_written(self):
+        weights = ScoringWeights(decay=DecayConfig(rate=1.0, reason_retention_days=30))
+        service = self._build_service(weights)
+        _seed(self.repo, 3, score=0.0)
+        self.repo.contacts["c-001"].score_reasons = [_make_reason(days_ago=45)]
+
+        result = service.run_decay(run_id="run-1")
+
+        assert self.repo.saved_batches[0] == ["c-001"]
+        assert result.decayed == 1
+
+    def test_slices_partition_the_keyspace(self, scoring_weights: ScoringWeights):
+        service = self._build_service(scoring_weights, page_size=10)
+        _seed(self.repo, 50)
+
+        results = [service.run_decay(run_id="run-1", slice_id=i, slice_count=4) for i in range(4)]
+
+        assert sum(r.scanned for r in results) == 50
+        assert all(r.completed for r in results)
+        assert all(c.score == 95.0 for c in self.repo.contacts.values())
+
+    def test_dispatch_skips_completed_slices(self, scoring_weights: ScoringWeights):
+        service = self._build_service(scoring_weights)
+        _seed(self.repo, 10)
+        service.run_decay(run_id="run-1", slice_id=1, slice_count=3)
+        dispatcher = FakeDispatcher()
+
+        pending = service.dispatch_slices(dispatcher, slice_count=3, run_id="run-1")
+
+        assert pending == [0, 2]
+        assert dispatcher.dispatched == [("run-1", 0, 3), ("run-1", 2, 3)]
+
+    def test_summarize_aggregates_slices(self, scoring_weights: ScoringWeights):
+        service = self._build_service(scoring_weights)
+        _seed(self.repo, 20)
+        for i in range(2):
+            service.run_decay(run_id="run-1", slice_id=i, slice_count=2)
+
+        summary = service.summarize("run-1", slice_count=2)
+
+        assert summary.scanned == 20
+        assert summary.decayed == 20
+        assert summary.completed is True
+
+
+class TestAggregateCheckpoints:
+    def test_incomplete_if_any_slice_incomplete(self):
+        summary = aggregate_checkpoints(
+            "run-1",
+            [
+                DecayCheckpoint(run_id="run-1", scanned=5, decayed=4, completed=True),
+                DecayCheckpoint(run_id="run-1", scanned=3, decayed=3, completed=False),
+            ],
+        )
+
+        assert summary.scanned == 8
+        assert summary.decayed == 7
+        assert summary.slice_count == 2
+        assert summary.completed is False
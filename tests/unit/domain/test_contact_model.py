@@ -1,4 +1,9 @@
+from array import array
+
+import numpy as np
+
 from rise_scout.domain.contact.models import Contact, Preferences, ScoreReason
+from rise_scout.domain.embeddings.vector import to_float32
 from rise_scout.domain.shared.events import ContactScored
 from rise_scout.domain.shared.types import AgentId, ContactId
 
@@ -141,6 +146,41 @@ class TestContactModel:
         assert contact.top_score_details(limit=3) == ["only"]
 
 
+class TestEmbeddingVector:
+    def test_lists_are_packed_as_float32(self):
+        contact = _make_contact(embedding_vector=[0.5, -1, 0.25])
+
+        assert contact.embedding_vector == array("f", [0.5, -1.0, 0.25])
+        assert contact.embedding_vector.itemsize == 4
+
+    def test_float32_arrays_are_kept_without_copying(self):
+        vector = array("f", [0.5, 0.25])
+
+        assert _make_contact(embedding_vector=vector).embedding_vector is vector
+        assert to_float32(vector) is vector
+
+    def test_buffers_are_copied_bytewise(self):
+        values = np.array([0.5, -0.125, 3.0], dtype=np.float32)
+
+        assert to_float32(values) == array("f", [0.5, -0.125, 3.0])
+        assert to_float32(values.tobytes()) == array("f", [0.5, -0.125, 3.0])
+        assert to_float32(values.astype(np.float64)) == array("f", [0.5, -0.125, 3.0])
+
+    def test_numpy_can_view_the_vector(self):
+        vector = to_float32([0.5, 0.25])
+
+        view = np.frombuffer(vector, np.float32)
+        vector[0] = 2.0
+
+        assert view[0] == 2.0
+
+    def test_json_dump_is_a_list(self):
+        contact = _make_contact(embedding_vector=[0.5, 0.25])
+
+        assert '"embedding_vector":[0.5,0.25]' in contact.model_dump_json()
+        assert Contact.model_validate_json(contact.model_dump_json()) == contact
+
+
 class TestPreferences:
     def test_is_complete_when_all_required_set(self):
         prefs = Preferences(
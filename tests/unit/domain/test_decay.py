@@ -1,7 +1,10 @@
 from datetime import UTC, datetime, timedelta
 
+import pytest
+
 from rise_scout.domain.contact.models import Contact, ScoreReason
 from rise_scout.domain.scoring.decay import DecayCalculator
+from rise_scout.domain.scoring.slicing import SLICE_BUCKETS, slice_bounds, slice_bucket
 from rise_scout.domain.scoring.weights import DecayConfig, ScoringWeights
 from rise_scout.domain.shared.types import AgentId, ContactId
 
@@ -59,6 +62,39 @@ class TestDecayCalculator:
         assert len(contact.score_reasons) == 1
         assert contact.score_reasons[0] is recent
 
+    def test_prunes_old_reasons_on_zero_score(self, scoring_weights: ScoringWeights):
+        calc = DecayCalculator(scoring_weights)
+        contact = _make_contact(score=0.0, score_reasons=[_make_reason(days_ago=45)])
+
+        assert calc.apply(contact) is True
+        assert contact.score_reasons == []
+
+    def test_reports_unchanged(self):
+        weights = ScoringWeights(decay=DecayConfig(rate=1.0, reason_retention_days=30))
+        calc = DecayCalculator(weights)
+        contact = _make_contact(score=0.0, score_reasons=[_make_reason(days_ago=5)])
+
+        assert calc.apply(contact) is False
+
+    def test_snaps_below_epsilon_to_zero(self):
+        weights = ScoringWeights(
+            decay=DecayConfig(rate=0.5, reason_retention_days=30, score_epsilon=1.0)
+        )
+        calc = DecayCalculator(weights)
+        contact = _make_contact(score=1.5)
+
+        calc.apply(contact)
+
+        assert contact.score == 0.0
+
+    def test_uses_given_cutoff(self, scoring_weights: ScoringWeights):
+        calc = DecayCalculator(scoring_weights)
+        contact = _make_contact(score=10.0, score_reasons=[_make_reason(days_ago=5)])
+
+        calc.apply(contact, cutoff=datetime.now(UTC) - timedelta(days=1))
+
+        assert contact.score_reasons == []
+
     def test_repeated_decay_converges_to_zero(self, scoring_weights: ScoringWeights):
         calc = DecayCalculator(scoring_weights)
         contact = _make_contact(score=100.0)
@@ -66,7 +102,7 @@ class TestDecayCalculator:
         for _ in range(200):
             calc.apply(contact)
 
-        assert contact.score < 0.01
+        assert contact.score == 0.0
 
     def test_decay_math_correctness(self):
         weights = ScoringWeights(decay=DecayConfig(rate=0.5, reason_retention_days=30))
@@ -78,3 +114,58 @@ class TestDecayCalculator:
 
         calc.apply(contact)
         assert contact.score == 25.0
+
+
+class TestSlicing:
+    def test_bounds_cover_all_buckets(self):
+        bounds = [slice_bounds(i, 3) for i in range(3)]
+
+        assert bounds[0][0] == 0
+        assert bounds[-1][1] == SLICE_BUCKETS
+        assert all(bounds[i][1] == bounds[i + 1][0] for i in range(2))
+
+    def test_bucket_is_stable(self):
+        assert slice_bucket("c-1") == slice_bucket("c-1")
+        assert 0 <= slice_bucket("c-1") < SLICE_BUCKETS
+
+    def test_invalid_slice_raises(self):
+        with pytest.raises(ValueError):
+            slice_bounds(3, 3)
+
+
+class TestApplyBatch:
+    def _contacts(self):
+        scores = [0.0, 0.05, 0.12, 1.0, 100.0, 999.9]
+        return [
+            _make_contact(
+                contact_id=ContactId(f"c-{i}"),
+                score=score,
+                score_reasons=[_make_reason(days_ago=d) for d in range(i * 7, 60, 11)],
+            )
+            for i, score in enumerate(scores)
+        ]
+
+    def test_matches_per_contact_path(self, scoring_weights: ScoringWeights):
+        calc = DecayCalculator(scoring_weights)
+        cutoff = calc.reason_cutoff()
+        scalar = self._contacts()
+        batched = [c.model_copy(deep=True) for c in scalar]
+
+        scalar_changed = [c.contact_id for c in scalar if calc.apply(c, cutoff)]
+        batch_changed = [c.contact_id for c in calc.apply_batch(batched, cutoff)]
+
+        assert batch_changed == scalar_changed
+        for s, b in zip(scalar, batched, strict=True):
+            assert b.model_dump(exclude={"updated_at"}) == s.model_dump(exclude={"updated_at"})
+
+    def test_empty_batch(self, scoring_weights: ScoringWeights):
+        assert DecayCalculator(scoring_weights).apply_batch([]) == []
+
+    def test_contacts_without_reasons(self, scoring_weights: ScoringWeights):
+        calc = DecayCalculator(scoring_weights)
+        contacts = [_make_contact(score=100.0), _make_contact(score=0.0)]
+
+        changed = calc.apply_batch(contacts)
+
+        assert changed == [contacts[0]]
+        assert contacts[0].score == 95.0
@@ -0,0 +1,150 @@
+import json
+
+from opensearchpy.exceptions import ConnectionError as OpenSearchConnectionError
+
+from rise_scout.infrastructure.opensearch.bulk_writer import (
+    BULK_FILTER_PATH,
+    MIN_CHUNK_BYTES,
+    BulkWriter,
+)
+
+
+class ScriptedOpenSearch:
+    """Answers each bulk item with the next status queued for its id, 201 once they run out."""
+
+    def __init__(self, statuses: dict[str, list[int]] | None = None):
+        self.statuses = statuses or {}
+        self.requests: list[list[str]] = []
+        self.kwargs: list[dict] = []
+        self.actions: list[dict] = []
+        self.fail_next: Exception | None = None
+
+    def bulk(self, body, **kwargs):
+        actions = [json.loads(line)["index"] for line in body.decode().splitlines()[::2]]
+        ids = [a["_id"] for a in actions]
+        self.requests.append(ids)
+        self.actions.extend(actions)
+        self.kwargs.append(kwargs)
+        if self.fail_next is not None:
+            error, self.fail_next = self.fail_next, None
+            raise error
+
+        items = []
+        for doc_id in ids:
+            queued = self.statuses.get(doc_id)
+            status = queued.pop(0) if queued else 201
+            item = {"_id": doc_id, "status": status}
+            if status >= 300:
+                item["error"] = {"type": "es_rejected_execution_exception", "reason": "busy"}
+            items.append({"index": item})
+        return {"errors": any("error" in i["index"] for i in items), "items": items}
+
+
+def _docs(n: int, padding: int = 0) -> list[dict]:
+    return [{"contact_id": f"c-{i}", "notes": "x" * padding} for i in range(n)]
+
+
+def _writer(client, **kwargs) -> BulkWriter:
+    kwargs.setdefault("initial_backoff_s", 0.0)
+    return BulkWriter(client, "contacts", **kwargs)
+
+
+class TestBulkWriter:
+    def test_requests_are_packed_by_bytes(self):
+        client = ScriptedOpenSearch()
+        writer = _writer(client, max_chunk_bytes=MIN_CHUNK_BYTES, max_concurrency=1)
+
+        result = writer.write(_docs(10, padding=100_000))
+
+        assert len(result.succeeded) == 10
+        assert [len(r) for r in client.requests] == [2, 2, 2, 2, 2]
+
+    def test_oversize_document_is_sent_alone(self):
+        client = ScriptedOpenSearch()
+        writer = _writer(client, max_chunk_bytes=MIN_CHUNK_BYTES, max_concurrency=1)
+
+        writer.write([{"contact_id": "c-big", "notes": "x" * 2 * MIN_CHUNK_BYTES}, *_docs(2)])
+
+        assert client.requests == [["c-big"], ["c-0", "c-1"]]
+
+    def test_only_throttled_items_are_retried(self):
+        client = ScriptedOpenSearch({"c-1": [429], "c-3": [503, 429]})
+        writer = _writer(client)
+
+        result = writer.write(_docs(4))
+
+        assert result.ok
+        assert sorted(result.succeeded) == ["c-0", "c-1", "c-2", "c-3"]
+        assert sorted(client.requests[1]) == ["c-1", "c-3"]
+        assert client.requests[2] == ["c-3"]
+
+    def test_rejected_items_are_reported_without_retry(self):
+        client = ScriptedOpenSearch({"c-0": [400]})
+        writer = _writer(client)
+
+        result = writer.write(_docs(2))
+
+        assert result.succeeded == ["c-1"]
+        assert result.failed == {"c-0": "es_rejected_execution_exception: busy"}
+        assert len(client.requests) == 1
+
+    def test_items_fail_once_retries_run_out(self):
+        client = ScriptedOpenSearch({"c-0": [429, 429, 429]})
+        writer = _writer(client, max_retries=2)
+
+        result = writer.write(_docs(1))
+
+        assert list(result.failed) == ["c-0"]
+        assert len(client.requests) == 3
+
+    def test_connection_errors_are_retried(self):
+        client = ScriptedOpenSearch()
+        client.fail_next = OpenSearchConnectionError("N/A", "refused", None)
+        writer = _writer(client)
+
+        result = writer.write(_docs(3))
+
+        assert result.ok
+        assert len(client.requests) == 2
+
+    def test_throttling_shrinks_and_recovery_regrows_limits(self):
+        client = ScriptedOpenSearch({"c-0": [429]})
+        writer = _writer(client, max_chunk_bytes=4 * MIN_CHUNK_BYTES, max_concurrency=4)
+
+        writer.write(_docs(1))
+        # The throttled round halves both; the clean retry adds one step back
+        assert writer._chunk_bytes == 3 * MIN_CHUNK_BYTES
+        assert writer._concurrency == 3
+
+        writer.write(_docs(1))
+        assert writer._chunk_bytes == 4 * MIN_CHUNK_BYTES
+        assert writer._concurrency == 4
+
+    def test_response_is_filtered(self):
+        client = ScriptedOpenSearch()
+
+        _writer(client).write(_docs(1))
+
+        assert client.kwargs == [{"filter_path": BULK_FILTER_PATH}]
+
+    def test_versioned_documents_are_written_conditionally(self):
+        client = ScriptedOpenSearch({"c-0": [409]})
+        writer = _writer(client)
+
+        result = writer.write(_docs(2), versions={"c-0": (7, 1)})
+
+        assert client.actions[0] == {
+            "_index": "contacts",
+            "_id": "c-0",
+            "if_seq_no": 7,
+            "if_primary_term": 1,
+        }
+        assert "if_seq_no" not in client.actions[1]
+        assert list(result.failed) == ["c-0"]
+        assert len(client.requests) == 1
+
+    def test_no_docs_makes_no_requests(self):
+        client = ScriptedOpenSearch()
+
+        assert _writer(client).write([]).ok
+        assert client.requests == []
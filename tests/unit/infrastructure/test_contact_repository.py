@@ -0,0 +1,192 @@
+import json
+
+import pytest
+from opensearchpy.exceptions import TransportError
+
+from rise_scout.domain.contact.models import Contact
+from rise_scout.domain.shared.types import AgentId, ContactId
+from rise_scout.infrastructure.opensearch.contact_repository import (
+    CARD_SOURCE_FIELDS,
+    OpenSearchContactRepository,
+)
+from rise_scout.infrastructure.opensearch.serializers import contact_to_document
+
+
+class FakeOpenSearch:
+    def __init__(self, contacts: list[Contact]):
+        self.docs = [contact_to_document(c) for c in contacts]
+        self.msearch_calls: list[list[dict]] = []
+        self.bulk_calls: list[list[dict]] = []
+
+    def msearch(self, body):
+        self.msearch_calls.append(body)
+        responses = []
+        for search in body[1::2]:
+            agent_id = search["query"]["term"]["user_ids"]
+            if agent_id == "a-broken":
+                responses.append({"error": {"type": "search_phase_execution_exception"}})
+                continue
+            matches = sorted(
+                (d for d in self.docs if agent_id in d["user_ids"]),
+                key=lambda d: d["score"],
+                reverse=True,
+            )[: search["size"]]
+            hits = [{"_source": {k: d[k] for k in search["_source"] if k in d}} for d in matches]
+            responses.append({"hits": {"hits": hits}})
+        return {"responses": responses}
+
+    def bulk(self, body, **kwargs):
+        actions = [json.loads(line) for line in body.decode().splitlines()]
+        self.bulk_calls.append(actions)
+        items = [
+            {"index": {"_id": a["index"]["_id"], "status": 400, "error": {"type": "x"}}}
+            if a["index"]["_id"] == "c-broken"
+            else {"index": {"_id": a["index"]["_id"], "status": 201}}
+            for a in actions[::2]
+        ]
+        return {"errors": any("error" in i["index"] for i in items), "items": items}
+
+
+class FakeLeaderboard:
+    def __init__(self, top: dict[AgentId, list[Contact]] | None = None):
+        self.top = top or {}
+        self.recorded: list[str] = []
+        self.complete: list[AgentId] = []
+        self.fail_with: Exception | None = None
+
+    def record_documents(self, documents):
+        if self.fail_with is not None:
+            raise self.fail_with
+        ids = [d["contact_id"] for d in documents]
+        self.recorded.extend(ids)
+        return len(ids)
+
+    def mark_complete(self, agent_ids):
+        self.complete.extend(agent_ids)
+
+    def get_top_by_agents(self, agent_ids, limit=5):
+        return {a: self.top[a][:limit] for a in agent_ids if a in self.top}
+
+
+def _contacts() -> list[Contact]:
+    return [
+        Contact(
+            contact_id=ContactId(f"c-{i}"),
+            user_ids=[AgentId(f"a-{i % 3}")],
+            first_name=f"Contact{i}",
+            score=float(i),
+            embedding_vector=[0.1, 0.2],
+        )
+        for i in range(12)
+    ]
+
+
+class TestGetTopByAgents:
+    def test_returns_top_contacts_per_agent(self):
+        client = FakeOpenSearch(_contacts())
+        repo = OpenSearchContactRepository(client, "contacts")
+
+        result = repo.get_top_by_agents([AgentId("a-0"), AgentId("a-1")], limit=2)
+
+        assert [str(c.contact_id) for c in result[AgentId("a-0")]] == ["c-9", "c-6"]
+        assert [str(c.contact_id) for c in result[AgentId("a-1")]] == ["c-10", "c-7"]
+
+    def test_batches_agents_into_chunked_msearch(self):
+        client = FakeOpenSearch(_contacts())
+        repo = OpenSearchContactRepository(client, "contacts")
+        agents = [AgentId(f"a-{i}") for i in range(5)]
+
+        result = repo.get_top_by_agents(agents, chunk_size=2)
+
+        assert len(client.msearch_calls) == 3
+        assert set(result) == set(agents)
+        assert result[AgentId("a-4")] == []
+
+    def test_projects_card_fields_only(self):
+        client = FakeOpenSearch(_contacts())
+        repo = OpenSearchContactRepository(client, "contacts")
+
+        result = repo.get_top_by_agents([AgentId("a-0")])
+
+        assert client.msearch_calls[0][1]["_source"] == CARD_SOURCE_FIELDS
+        assert result[AgentId("a-0")][0].embedding_vector is None
+
+    def test_failed_sub_search_raises(self):
+        client = FakeOpenSearch(_contacts())
+        repo = OpenSearchContactRepository(client, "contacts")
+
+        with pytest.raises(TransportError):
+            repo.get_top_by_agents([AgentId("a-0"), AgentId("a-broken")])
+
+    def test_no_agents_makes_no_requests(self):
+        client = FakeOpenSearch(_contacts())
+        repo = OpenSearchContactRepository(client, "contacts")
+
+        assert repo.get_top_by_agents([]) == {}
+        assert client.msearch_calls == []
+
+
+class TestLeaderboard:
+    def test_top_contacts_served_from_leaderboard(self):
+        client = FakeOpenSearch(_contacts())
+        cached = [Contact(contact_id=ContactId("c-9"), user_ids=[AgentId("a-0")])]
+        repo = OpenSearchContactRepository(
+            client, "contacts", leaderboard=FakeLeaderboard({AgentId("a-0"): cached})
+        )
+
+        result = repo.get_top_by_agents([AgentId("a-0")])
+
+        assert result[AgentId("a-0")] == cached
+        assert client.msearch_calls == []
+
+    def test_agents_missing_from_leaderboard_fall_back_to_search(self):
+        client = FakeOpenSearch(_contacts())
+        repo = OpenSearchContactRepository(client, "contacts", leaderboard=FakeLeaderboard())
+
+        result = repo.get_top_by_agents([AgentId("a-1")], limit=1)
+
+        assert [str(c.contact_id) for c in result[AgentId("a-1")]] == ["c-10"]
+        assert len(client.msearch_calls) == 1
+
+    def test_search_fallback_refills_the_leaderboard(self):
+        leaderboard = FakeLeaderboard()
+        repo = OpenSearchContactRepository(
+            FakeOpenSearch(_contacts()), "contacts", leaderboard=leaderboard
+        )
+
+        repo.get_top_by_agents([AgentId("a-1")], limit=2)
+
+        assert leaderboard.recorded == ["c-10", "c-7"]
+        assert leaderboard.complete == []
+
+    def test_short_search_marks_the_board_complete(self):
+        leaderboard = FakeLeaderboard()
+        repo = OpenSearchContactRepository(
+            FakeOpenSearch(_contacts()), "contacts", leaderboard=leaderboard
+        )
+
+        repo.get_top_by_agents([AgentId("a-1"), AgentId("a-9")], limit=5)
+
+        assert leaderboard.complete == [AgentId("a-1"), AgentId("a-9")]
+
+    def test_leaderboard_errors_do_not_fail_writes(self):
+        leaderboard = FakeLeaderboard()
+        leaderboard.fail_with = ConnectionError("redis down")
+        client = FakeOpenSearch([])
+        repo = OpenSearchContactRepository(client, "contacts", leaderboard=leaderboard)
+
+        result = repo.bulk_save(_contacts()[:2])
+
+        assert result.succeeded == ["c-0", "c-1"]
+        assert len(client.bulk_calls) == 1
+
+    def test_bulk_save_records_only_indexed_contacts(self):
+        leaderboard = FakeLeaderboard()
+        repo = OpenSearchContactRepository(FakeOpenSearch([]), "contacts", leaderboard=leaderboard)
+        contacts = _contacts()[:2] + [Contact(contact_id=ContactId("c-broken"))]
+
+        result = repo.bulk_save(contacts)
+
+        assert leaderboard.recorded == ["c-0", "c-1"]
+        assert result.succeeded == ["c-0", "c-1"]
+        assert list(result.failed) == ["c-broken"]
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from rise_scout.infrastructure.container import Container
+from rise_scout.settings import Settings
+
+
+class TestContainer:
+    def test_builds_nothing_up_front(self):
+        container = Container(Settings())
+
+        assert set(vars(container)) == {"settings"}
+
+    def test_builds_only_what_is_accessed(self):
+        container = Container(Settings())
+
+        flags = container.refresh_flags
+
+        assert container.refresh_flags is flags
+        assert "_redis_client" in vars(container)
+        assert "_os_client" not in vars(container)
+        assert "card_repo" not in vars(container)
+        assert "llm_service" not in vars(container)
@@ -0,0 +1,87 @@
+from datetime import UTC, datetime, timedelta
+
+from rise_scout.domain.contact.models import Contact, ScoreReason
+from rise_scout.domain.scoring.decay import DecayCalculator
+from rise_scout.domain.scoring.weights import ScoringWeights
+from rise_scout.domain.shared.types import AgentId, ContactId
+from rise_scout.infrastructure.opensearch.decay_batch import DocumentDecayBatch
+from rise_scout.infrastructure.opensearch.serializers import (
+    contact_to_document,
+    document_to_contact,
+)
+
+NOW = datetime(2024, 6, 1, 12, 0, 0, tzinfo=UTC)
+
+
+def _make_doc(index: int, score: float, reason_ages: list[int]) -> dict:
+    contact = Contact(
+        contact_id=ContactId(f"c-{index}"),
+        user_ids=[AgentId("a-1")],
+        first_name="Jane",
+        score=score,
+        score_reasons=[
+            ScoreReason(
+                signal="listing_view",
+                points=3.0,
+                category="engagement",
+                detail=f"reason {age}",
+                timestamp=NOW - timedelta(days=age, microseconds=index),
+            )
+            for age in reason_ages
+        ],
+        embedding_vector=[0.1, 0.2],
+        updated_at=NOW - timedelta(days=1),
+    )
+    return contact_to_document(contact)
+
+
+def _docs() -> list[dict]:
+    return [
+        _make_doc(0, 0.0, []),
+        _make_doc(1, 0.0, [45, 5]),
+        _make_doc(2, 0.05, [1]),
+        _make_doc(3, 100.0, [0, 29, 31, 60]),
+        _make_doc(4, 999.9, [10]),
+    ]
+
+
+class TestDocumentDecayBatch:
+    def test_matches_per_contact_path(self, scoring_weights: ScoringWeights):
+        calc = DecayCalculator(scoring_weights)
+        cutoff = calc.reason_cutoff(NOW)
+
+        expected = {}
+        for doc in _docs():
+            contact = document_to_contact(doc)
+            stored_updated_at = contact.updated_at
+            if calc.apply(contact, cutoff):
+                if contact.updated_at != stored_updated_at:
+                    contact.updated_at = NOW  # apply stamps the wall clock
+                contact.decay_run_id = "run-1"
+                expected[contact.contact_id] = contact_to_document(contact)
+
+        batch = DocumentDecayBatch(_docs())
+        written = batch.apply(calc.decay_columns(batch, cutoff), "run-1", NOW)
+
+        assert {d["contact_id"]: d for d in written} == expected
+
+    def test_unchanged_documents_are_not_returned(self, scoring_weights: ScoringWeights):
+        calc = DecayCalculator(scoring_weights)
+        batch = DocumentDecayBatch([_make_doc(0, 0.0, [1])])
+
+        written = batch.apply(calc.decay_columns(batch, calc.reason_cutoff(NOW)), "run-1", NOW)
+
+        assert written == []
+
+    def test_documents_already_stamped_by_the_run_are_skipped(
+        self, scoring_weights: ScoringWeights
+    ):
+        calc = DecayCalculator(scoring_weights)
+        stamped = _make_doc(3, 100.0, [0, 31])
+        stamped["decay_run_id"] = "run-1"
+        batch = DocumentDecayBatch([stamped, _make_doc(4, 999.9, [10])])
+
+        written = batch.apply(calc.decay_columns(batch, calc.reason_cutoff(NOW)), "run-1", NOW)
+
+        assert [d["contact_id"] for d in written] == ["c-4"]
+        assert stamped["score"] == 100.0
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import io
+import json
+from array import array
+
+import pytest
+
+from rise_scout.infrastructure.bedrock.embedding_service import BedrockEmbeddingService
+
+
+class FakeBedrockClient:
+    def __init__(self, embedding: list[float]):
+        self.embedding = embedding
+        self.bodies: list[dict] = []
+
+    def invoke_model(self, **kwargs):
+        self.bodies.append(json.loads(kwargs["body"]))
+        return {"body": io.BytesIO(json.dumps({"embedding": self.embedding}).encode())}
+
+
+def _service(
+    embedding: list[float], dimensions: int | None = None
+) -> tuple[BedrockEmbeddingService, FakeBedrockClient]:
+    service = BedrockEmbeddingService("model", dimensions=dimensions)
+    client = FakeBedrockClient(embedding)
+    service._client = client
+    return service, client
+
+
+class TestEmbed:
+    def test_requests_only_the_text_by_default(self):
+        service, client = _service([0.5, 0.5])
+
+        assert service.embed("hello") == array("f", [0.5, 0.5])
+        assert client.bodies == [{"inputText": "hello"}]
+
+    def test_requests_the_configured_dimensions(self):
+        service, client = _service([0.5] * 256, dimensions=256)
+
+        assert len(service.embed("hello")) == 256
+        assert client.bodies == [{"inputText": "hello", "dimensions": 256, "normalize": True}]
+
+    def test_rejects_embeddings_of_the_wrong_size(self):
+        service, _ = _service([0.5] * 1024, dimensions=256)
+
+        with pytest.raises(ValueError, match="1024 dimensions"):
+            service.embed("hello")
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import io
+import json
+
+from rise_scout.domain.contact.models import Contact
+from rise_scout.domain.shared.types import ContactId
+from rise_scout.infrastructure.bedrock.llm_service import BedrockLLMService
+
+
+class FakeBedrockClient:
+    def __init__(self, batch_response: dict):
+        self.batch_response = batch_response
+        self.bodies: list[dict] = []
+
+    def invoke_model(self, **kwargs):
+        request = json.loads(kwargs["body"])
+        self.bodies.append(request)
+        if "tools" in request:
+            response = self.batch_response
+        else:
+            name = request["messages"][0]["content"].split("Contact: ")[1].split("\n")[0]
+            response = {"content": [{"type": "text", "text": f" single {name.strip()} "}]}
+        return {"body": io.BytesIO(json.dumps(response).encode())}
+
+
+class CountingLimiter:
+    def __init__(self):
+        self.calls = 0
+
+    def acquire(self, cost: float = 1.0) -> None:
+        self.calls += 1
+
+
+def _service(
+    batch_response: dict, limiter: CountingLimiter | None = None
+) -> tuple[BedrockLLMService, FakeBedrockClient]:
+    service = BedrockLLMService("model", rate_limiter=limiter)
+    client = FakeBedrockClient(batch_response)
+    service._client = client
+    return service, client
+
+
+def _contacts() -> list[Contact]:
+    return [
+        Contact(contact_id=ContactId("c-1"), first_name="Ann"),
+        Contact(contact_id=ContactId("c-2"), first_name="Bob"),
+    ]
+
+
+def _tool_use(insights: list[dict]) -> dict:
+    return {
+        "content": [
+            {"type": "tool_use", "name": "record_insights", "input": {"insights": insights}}
+        ]
+    }
+
+
+class TestGenerateInsights:
+    def test_one_request_for_all_contacts(self):
+        service, client = _service(
+            _tool_use(
+                [
+                    {"contact_id": "c-1", "insight": "Call Ann"},
+                    {"contact_id": "c-2", "insight": "Email Bob"},
+                ]
+            )
+        )
+
+        insights = service.generate_insights(_contacts())
+
+        assert insights == {ContactId("c-1"): "Call Ann", ContactId("c-2"): "Email Bob"}
+        assert len(client.bodies) == 1
+        assert client.bodies[0]["tool_choice"]["name"] == "record_insights"
+
+    def test_missing_contact_falls_back_to_single_call(self):
+        service, client = _service(_tool_use([{"contact_id": "c-1", "insight": "Call Ann"}]))
+
+        insights = service.generate_insights(_contacts())
+
+        assert insights[ContactId("c-2")] == "single Bob"
+        assert len(client.bodies) == 2
+
+    def test_unparseable_response_falls_back_per_contact(self):
+        service, client = _service({"content": [{"type": "text", "text": "not json"}]})
+
+        insights = service.generate_insights(_contacts())
+
+        assert insights == {ContactId("c-1"): "single Ann", ContactId("c-2"): "single Bob"}
+        assert len(client.bodies) == 3
+
+    def test_every_bedrock_call_takes_a_token(self):
+        limiter = CountingLimiter()
+        service, client = _service(
+            _tool_use([{"contact_id": "c-1", "insight": "Call Ann"}]), limiter
+        )
+
+        service.generate_insights(_contacts())
+
+        assert limiter.calls == len(client.bodies) == 2
@@ -1,10 +1,20 @@
-from datetime import UTC, datetime
+import json
+from array import array
+from datetime import UTC, datetime, timedelta, timezone
 
-from rise_scout.domain.contact.models import Contact, Preferences, ScoreReason
+import pytest
+
+from rise_scout.domain.contact.models import Contact, Preferences, PropertyType, ScoreReason
+from rise_scout.domain.scoring.decay import DecayCalculator
+from rise_scout.domain.scoring.engine import ScoringEngine
+from rise_scout.domain.scoring.signals import SignalType
+from rise_scout.domain.scoring.weights import ScoringWeights
 from rise_scout.domain.shared.types import AgentId, ContactId, ListingId, MlsId
 from rise_scout.infrastructure.opensearch.serializers import (
     contact_to_document,
+    document_json,
     document_to_contact,
+    trusted_document_to_contact,
 )
 
 
@@ -62,7 +72,7 @@ class TestSerializerRoundTrip:
         assert restored.preferences.price_min == 200000
         assert restored.preferences.zip_codes == ["90210"]
         assert restored.watched_listings == original.watched_listings
-        assert restored.embedding_vector == [0.1, 0.2, 0.3]
+        assert restored.embedding_vector == array("f", [0.1, 0.2, 0.3])
 
     def test_round_trip_no_embedding(self):
         original = _make_contact()
@@ -83,3 +93,168 @@ class TestSerializerRoundTrip:
         assert doc["score"] == 42.5
         assert isinstance(doc["score_reasons"], list)
         assert isinstance(doc["preferences"], dict)
+
+
+def _pydantic_document(contact: Contact) -> dict:
+    # contact_to_document as it was before the model_dump calls were unrolled
+    doc = contact_to_document(contact)
+    doc["preferences"] = contact.preferences.model_dump()
+    doc["score_reasons"] = [r.model_dump(mode="json") for r in contact.score_reasons]
+    return doc
+
+
+def _variants() -> list[Contact]:
+    full = _make_contact()
+    full.preferences.property_types = [PropertyType.CONDO, PropertyType.LAND]
+    full.preferences.keywords = ["pool"]
+    full.last_interaction_at = datetime(2024, 5, 30, 8, 15, 1, 250, tzinfo=UTC)
+    full.decay_run_id = "run-1"
+
+    offset = _make_contact()
+    offset.score_reasons = [
+        ScoreReason(
+            signal="agent_note_added",
+            points=5,
+            category="relationship",
+            detail="Called",
+            timestamp=datetime(2024, 6, 1, 9, 30, tzinfo=timezone(timedelta(hours=-7))),
+        )
+    ] * 50
+    offset.embedding_vector = None
+
+    return [full, offset, Contact(contact_id=ContactId("c-bare"))]
+
+
+class TestTrustedSerializers:
+    @pytest.mark.parametrize("contact", _variants(), ids=["full", "offset", "bare"])
+    def test_document_matches_pydantic_dump(self, contact: Contact):
+        assert contact_to_document(contact) == _pydantic_document(contact)
+
+    @pytest.mark.parametrize("contact", _variants(), ids=["full", "offset", "bare"])
+    def test_trusted_read_matches_validated_read(self, contact: Contact):
+        doc = json.loads(document_json(contact_to_document(contact)))
+
+        trusted = trusted_document_to_contact(doc)
+        validated = document_to_contact(doc)
+
+        assert trusted == validated
+        assert trusted.model_dump() == validated.model_dump()
+        assert trusted.model_dump_json() == validated.model_dump_json()
+        assert contact_to_document(trusted) == contact_to_document(validated)
+
+    def test_trusted_read_restores_types(self):
+        doc = json.loads(document_json(contact_to_document(_variants()[0])))
+
+        contact = trusted_document_to_contact(doc)
+
+        assert contact.updated_at == datetime(2024, 6, 1, 12, tzinfo=UTC)
+        assert isinstance(contact.score_reasons[0], ScoreReason)
+        assert isinstance(contact.score_reasons[0].timestamp, datetime)
+        assert contact.preferences.property_types == [PropertyType.CONDO, PropertyType.LAND]
+        assert isinstance(contact.preferences.property_types[0], PropertyType)
+
+    def test_trusted_read_accepts_offset_timestamps(self):
+        doc = contact_to_document(_make_contact())
+        doc["score_reasons"][0]["timestamp"] = "2024-06-01T00:00:00+00:00"
+
+        assert trusted_document_to_contact(doc) == document_to_contact(doc)
+
+    def test_trusted_read_fills_defaults_for_projections(self):
+        doc = {"contact_id": "c-1", "user_ids": ["a-1"], "first_name": "Jane", "score": 3}
+
+        contact = trusted_document_to_contact(doc)
+
+        assert contact.score == 3.0
+        assert contact.preferences == Preferences()
+        assert contact.score_reasons == []
+        assert contact.embedding_vector is None
+        assert contact.collect_events() == []
+
+    def test_trusted_contact_behaves_like_validated(self):
+        doc = json.loads(document_json(contact_to_document(_make_contact())))
+        contact = trusted_document_to_contact(doc)
+        reason = ScoreReason(signal="listing_save", points=8.0, category="engagement", detail="d")
+
+        copy = contact.model_copy(deep=True)
+        contact.apply_score_delta(8.0, reason)
+
+        assert contact.score == 50.5
+        assert contact.score_reasons[0] == reason
+        assert len(contact.collect_events()) == 1
+        assert copy.score == 42.5
+        assert len(copy.score_reasons) == 1
+
+    def test_trusted_contact_iterates_like_validated(self):
+        doc = json.loads(document_json(contact_to_document(_variants()[0])))
+        trusted = trusted_document_to_contact(doc)
+        validated = document_to_contact(doc)
+
+        assert dict(trusted) == dict(validated)
+        assert list(dict(trusted)) == list(Contact.model_fields)
+        assert trusted.model_fields_set == validated.model_fields_set
+        assert trusted.model_dump(exclude_unset=True) == validated.model_dump(exclude_unset=True)
+
+    def test_trusted_contact_copies_with_updates_like_validated(self):
+        doc = json.loads(document_json(contact_to_document(_variants()[0])))
+        update = {"score": 1.0, "first_name": "Ann"}
+
+        trusted = trusted_document_to_contact(doc).model_copy(update=update)
+        validated = document_to_contact(doc).model_copy(update=update)
+
+        assert trusted == validated
+        assert trusted.score_reasons == validated.score_reasons
+        assert trusted.model_dump(exclude_unset=True) == validated.model_dump(exclude_unset=True)
+
+    def test_scoring_sees_stored_reasons(self, scoring_weights: ScoringWeights):
+        doc = json.loads(document_json(contact_to_document(_make_contact())))
+        trusted = trusted_document_to_contact(doc)
+        validated = document_to_contact(doc)
+
+        for contact in (trusted, validated):
+            ScoringEngine(scoring_weights).process_signal(contact, SignalType.LISTING_SAVE, "l-2")
+
+        assert trusted.score == validated.score
+        assert [r.signal for r in trusted.score_reasons] == ["listing_save", "listing_view"]
+        assert trusted.score_reasons[1:] == validated.score_reasons[1:]
+        assert len(trusted.collect_events()) == 1
+
+    def test_decay_sees_stored_reasons(self, scoring_weights: ScoringWeights):
+        doc = json.loads(document_json(contact_to_document(_make_contact())))
+        trusted = trusted_document_to_contact(doc)
+        validated = document_to_contact(doc)
+        cutoff = datetime(2024, 7, 1, tzinfo=UTC)
+        calc = DecayCalculator(scoring_weights)
+
+        assert calc.apply(trusted, cutoff) is calc.apply(validated, cutoff) is True
+        assert trusted.score_reasons == validated.score_reasons == []
+        assert calc.apply_batch([trusted_document_to_contact(doc)], cutoff)[0].score_reasons == []
+
+
+class TestDocumentJson:
+    def test_vectors_read_back_as_the_same_float32s(self):
+        contact = _make_contact()
+        contact.embedding_vector = array("f", [0.1, -1e-7, 123.456, 2.0, -0.0])
+
+        doc = json.loads(document_json(contact_to_document(contact)))
+
+        assert array("f", doc["embedding_vector"]) == contact.embedding_vector
+        assert trusted_document_to_contact(doc) == document_to_contact(doc)
+
+    def test_vectors_are_shorter_than_widened_floats(self):
+        contact = _make_contact()
+        contact.embedding_vector = array("f", [i / 7 for i in range(1024)])
+        doc = contact_to_document(contact)
+
+        widened = json.dumps({**doc, "embedding_vector": contact.embedding_vector.tolist()})
+
+        assert len(document_json(doc)) < 0.75 * len(widened)
+
+    def test_documents_without_vectors_match_json_dumps(self):
+        contact = _make_contact()
+        contact.embedding_vector = None
+        doc = contact_to_document(contact)
+
+        assert document_json(doc) == json.dumps(doc)
+        assert json.loads(document_json({"embedding_vector": array("f", [1.0])})) == {
+            "embedding_vector": [1.0]
+        }
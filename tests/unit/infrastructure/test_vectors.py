@@ -0,0 +1,112 @@
+import json
+from array import array
+
+import pytest
+
+from rise_scout.domain.contact.models import Contact
+from rise_scout.domain.shared.types import ContactId
+from rise_scout.infrastructure.opensearch.contact_repository import OpenSearchContactRepository
+from rise_scout.infrastructure.opensearch.mappings import contacts_index_body, load_index_body
+from rise_scout.infrastructure.opensearch.serializers import (
+    contact_to_document,
+    document_json,
+    trusted_document_to_contact,
+)
+from rise_scout.infrastructure.opensearch.vectors import VectorFormat, VectorQuantization
+
+FP16 = VectorFormat(dimensions=4, quantization=VectorQuantization.FP16)
+BYTE = VectorFormat(dimensions=4, quantization=VectorQuantization.BYTE)
+
+
+def _embedding(mapping: dict) -> dict:
+    return mapping["mappings"]["properties"]["embedding_vector"]
+
+
+class TestMapping:
+    def test_default_format_keeps_the_configured_mapping(self):
+        assert contacts_index_body() == load_index_body("contacts")
+
+    def test_fp16_uses_the_faiss_scalar_quantizer(self):
+        field = _embedding(contacts_index_body(VectorFormat(dimensions=512, quantization="fp16")))
+
+        assert field["dimension"] == 512
+        assert field["method"]["engine"] == "faiss"
+        assert field["method"]["space_type"] == "innerproduct"
+        assert field["method"]["parameters"] == {
+            "ef_construction": 128,
+            "m": 24,
+            "encoder": {"name": "sq", "parameters": {"type": "fp16"}},
+        }
+        assert "data_type" not in field
+
+    def test_byte_maps_byte_vectors(self):
+        field = _embedding(contacts_index_body(VectorFormat(dimensions=256, quantization="byte")))
+
+        assert field["dimension"] == 256
+        assert field["data_type"] == "byte"
+        assert field["method"]["parameters"] == {"ef_construction": 128, "m": 24}
+
+    def test_rest_of_the_index_is_unchanged(self):
+        body = contacts_index_body(BYTE)
+        original = load_index_body("contacts")
+        del body["mappings"]["properties"]["embedding_vector"]
+        del original["mappings"]["properties"]["embedding_vector"]
+
+        assert body == original
+
+
+class TestEncoding:
+    def test_float_reads_back_as_the_same_float32s(self):
+        vector = array("f", [0.1, -0.2, 0.3, 1 / 3])
+
+        assert VectorFormat().decode(json.loads(VectorFormat().encode(vector))) == vector
+
+    def test_fp16_keeps_five_significant_digits(self):
+        assert json.loads(FP16.encode(array("f", [1 / 3, -0.25, 0.0, 1.0]))) == [
+            0.33333,
+            -0.25,
+            0.0,
+            1.0,
+        ]
+
+    def test_byte_quantizes_to_int8_and_clips(self):
+        scale = BYTE.byte_scale
+        values = json.loads(BYTE.encode(array("f", [0.5, -0.5, 3.0, -3.0])))
+
+        assert values == [round(0.5 * scale), round(-0.5 * scale), 127, -128]
+        assert BYTE.decode(values)[0] == pytest.approx(0.5, abs=0.5 / scale)
+
+    def test_documents_round_trip_through_the_format(self):
+        contact = Contact(
+            contact_id=ContactId("c-1"), embedding_vector=array("f", [0.1, 0.2, -0.3, 0.0])
+        )
+        doc = json.loads(document_json(contact_to_document(contact), BYTE))
+
+        assert all(isinstance(v, int) for v in doc["embedding_vector"])
+        restored = trusted_document_to_contact(doc, BYTE).embedding_vector
+        assert list(restored) == pytest.approx([0.1, 0.2, -0.3, 0.0], abs=1 / BYTE.byte_scale)
+
+
+class FakeIndices:
+    def __init__(self):
+        self.created: list[dict] = []
+
+    def create(self, **kwargs):
+        self.created.append(kwargs)
+
+
+class FakeOpenSearch:
+    def __init__(self):
+        self.indices = FakeIndices()
+
+
+class TestCreateIndex:
+    def test_creates_the_index_with_the_configured_vectors(self):
+        client = FakeOpenSearch()
+        vectors = VectorFormat(dimensions=512, quantization="fp16")
+
+        OpenSearchContactRepository(client, "contacts-v2", vectors=vectors).create_index()
+
+        assert client.indices.created == [
+            {"index": "contacts-v2", "body": contacts_index_body(vectors)}
+        ]